@@ -4,6 +4,7 @@ import os
 import sys
 from typing import Any, Dict, List, NoReturn, Optional, TYPE_CHECKING, Text
 
+from rasa.constants import MODEL_ARCHIVE_EXTENSIONS
 from rasa.shared.constants import DEFAULT_MODELS_PATH
 import rasa.shared.utils.cli
 import rasa.shared.utils.io
@@ -109,6 +110,7 @@ def create_output_path(
     output_path: Text = DEFAULT_MODELS_PATH,
     prefix: Text = "",
     fixed_name: Optional[Text] = None,
+    extension: Text = ".tar.gz",
 ) -> Text:
     """Creates an output path which includes the current timestamp.
 
@@ -116,13 +118,14 @@ def create_output_path(
         output_path: The path where the model should be stored.
         fixed_name: Name of the model.
         prefix: A prefix which should be included in the output path.
+        extension: File extension of the model archive.
 
     Returns:
         The generated output path, e.g. "20191201-103002.tar.gz".
     """
     import time
 
-    if output_path.endswith("tar.gz"):
+    if output_path.endswith(tuple(MODEL_ARCHIVE_EXTENSIONS.values())):
         return output_path
     else:
         if fixed_name:
@@ -131,7 +134,7 @@ def create_output_path(
             time_format = "%Y%m%d-%H%M%S"
             name = time.strftime(time_format)
             name = f"{prefix}{name}"
-        file_name = f"{name}.tar.gz"
+        file_name = f"{name}{extension}"
         return os.path.join(output_path, file_name)
 
 
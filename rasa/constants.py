@@ -39,3 +39,15 @@ ENV_SANIC_BACKLOG = "SANIC_BACKLOG"
 ENV_GPU_CONFIG = "TF_GPU_MEMORY_ALLOC"
 ENV_CPU_INTER_OP_CONFIG = "TF_INTER_OP_PARALLELISM_THREADS"
 ENV_CPU_INTRA_OP_CONFIG = "TF_INTRA_OP_PARALLELISM_THREADS"
+
+# compression of packaged models, the `zstd` compression requires `zstandard`
+ENV_MODEL_COMPRESSION = "MODEL_COMPRESSION"
+MODEL_COMPRESSION_GZ = "gz"
+MODEL_COMPRESSION_NONE = "none"
+MODEL_COMPRESSION_ZSTD = "zstd"
+DEFAULT_MODEL_COMPRESSION = MODEL_COMPRESSION_GZ
+MODEL_ARCHIVE_EXTENSIONS = {
+    MODEL_COMPRESSION_GZ: ".tar.gz",
+    MODEL_COMPRESSION_NONE: ".tar",
+    MODEL_COMPRESSION_ZSTD: ".tar.zst",
+}
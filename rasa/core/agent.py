@@ -1,21 +1,39 @@
+import asyncio
 from asyncio import CancelledError
+import base64
+import hashlib
 import logging
 import os
 import shutil
 import tempfile
+import time
+import zlib
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Text, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 import uuid
 
 import aiohttp
 from aiohttp import ClientError
 
 import rasa
+from rasa.constants import MODEL_ARCHIVE_EXTENSIONS
 from rasa.core import jobs, training
 from rasa.core.channels.channel import OutputChannel, UserMessage
 from rasa.core.constants import DEFAULT_REQUEST_TIMEOUT
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
 from rasa.shared.core.domain import Domain
-from rasa.core.exceptions import AgentNotReady
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.core.exceptions import AgentNotReady, ModelDownloadError
 import rasa.core.interpreter
 from rasa.shared.constants import (
     DEFAULT_SENDER_ID,
@@ -23,6 +41,7 @@ from rasa.shared.constants import (
     DEFAULT_CORE_SUBDIRECTORY_NAME,
 )
 from rasa.shared.exceptions import InvalidParameterException
+from rasa.shared.nlu.constants import INTENT_NAME_KEY
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
 from rasa.core.lock_store import InMemoryLockStore, LockStore
 from rasa.core.nlg import NaturalLanguageGenerator
@@ -51,8 +70,22 @@ from rasa.shared.nlu.training_data.training_data import TrainingData
 from rasa.utils.endpoints import EndpointConfig
 import rasa.utils.io
 
+if TYPE_CHECKING:
+    from multidict import CIMultiDictProxy
+    from rasa.nlu.model import Interpreter
+    from rasa_addons.core.parse_cache import ParseCache
+
 logger = logging.getLogger(__name__)
 
+# models are streamed to disk in chunks of this size (in bytes)
+MODEL_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# the download progress is logged whenever this many more bytes were received
+MODEL_DOWNLOAD_PROGRESS_INTERVAL = 50 * 1024 * 1024
+
+# synthetic conversation which is used to warm up new models
+WARM_UP_SENDER_ID = "model_warm_up"
+WARM_UP_TEXT = "hello"
+
 
 async def load_from_server(agent: "Agent", model_server: EndpointConfig) -> "Agent":
     """Load a persisted model from a server."""
@@ -127,10 +160,9 @@ def load_and_set_updated_model(
     """
     logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
 
-    core_path, nlu_path = get_model_subdirectories(model_directory)
-
-    interpreter = _load_interpreter(agent, nlu_path)
-    domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+    domain, policy_ensemble, interpreter = _load_and_warm_up_model(
+        agent, model_directory
+    )
 
     agent.update_model(
         domain, policy_ensemble, fingerprint, interpreter, model_directory
@@ -139,6 +171,90 @@ def load_and_set_updated_model(
     logger.debug("Finished updating agent to new model.")
 
 
+async def load_and_set_updated_model_in_background(
+    agent: "Agent", model_directory: Text, fingerprint: Text
+) -> None:
+    """Load and warm up the model in a thread and then set it on the agent.
+
+    The agent keeps serving requests with its current model until the new model
+    is ready.
+
+    Args:
+        agent: Instance of `Agent` to update with the new model.
+        model_directory: Rasa model directory.
+        fingerprint: Fingerprint of the supplied model at `model_directory`.
+    """
+    logger.debug(f"Found new model with fingerprint {fingerprint}. Loading...")
+
+    agent.pending_model_directory = model_directory
+    try:
+        loop = asyncio.get_event_loop()
+        domain, policy_ensemble, interpreter = await loop.run_in_executor(
+            None, _load_and_warm_up_model, agent, model_directory
+        )
+        agent.update_model(
+            domain, policy_ensemble, fingerprint, interpreter, model_directory
+        )
+    finally:
+        agent.pending_model_directory = None
+
+    logger.debug("Finished updating agent to new model.")
+
+
+def _load_and_warm_up_model(
+    agent: "Agent", model_directory: Text
+) -> Tuple[Optional[Domain], Optional[PolicyEnsemble], NaturalLanguageInterpreter]:
+    core_path, nlu_path = get_model_subdirectories(model_directory)
+
+    interpreter = _load_interpreter(agent, nlu_path)
+    domain, policy_ensemble = _load_domain_and_policy_ensemble(core_path)
+    _warm_up_model(domain, policy_ensemble, interpreter)
+
+    return domain, policy_ensemble, interpreter
+
+
+def _loaded_nlu_models(interpreter: NaturalLanguageInterpreter) -> List["Interpreter"]:
+    from rasa_addons.core.interpreter import MultilingualNLUInterpreter
+
+    if isinstance(interpreter, MultilingualNLUInterpreter):
+        interpreters = list(interpreter.interpreters.values())
+    else:
+        interpreters = [interpreter]
+
+    return [
+        i.interpreter
+        for i in interpreters
+        if isinstance(i, rasa.core.interpreter.RasaNLUInterpreter)
+        and i.interpreter is not None
+    ]
+
+
+def _warm_up_model(
+    domain: Optional[Domain],
+    policy_ensemble: Optional[PolicyEnsemble],
+    interpreter: NaturalLanguageInterpreter,
+) -> None:
+    """Parse and predict once, so that the first requests for a new model don't
+    have to wait until the models' prediction graphs are built."""
+    try:
+        for nlu_model in _loaded_nlu_models(interpreter):
+            nlu_model.parse(WARM_UP_TEXT)
+
+        if domain and policy_ensemble:
+            intent = {INTENT_NAME_KEY: domain.intents[0]} if domain.intents else {}
+            tracker = DialogueStateTracker.from_events(
+                WARM_UP_SENDER_ID,
+                [ActionExecuted(ACTION_LISTEN_NAME), UserUttered(WARM_UP_TEXT, intent)],
+                domain.slots,
+            )
+            policy_ensemble.probabilities_using_best_policy(
+                tracker, domain, interpreter
+            )
+    except Exception as e:  # skipcq: PYL-W0703
+        # the model still works, the first requests are just slower
+        logger.warning(f"Failed to warm up the new model: {e}")
+
+
 async def _update_model_from_server(
     model_server: EndpointConfig, agent: "Agent"
 ) -> None:
@@ -156,7 +272,9 @@ async def _update_model_from_server(
         )
 
         if new_fingerprint:
-            load_and_set_updated_model(agent, model_directory, new_fingerprint)
+            await load_and_set_updated_model_in_background(
+                agent, model_directory, new_fingerprint
+            )
             remove_dir = False
         else:
             logger.debug(f"No new model found at URL {model_server.url}")
@@ -189,7 +307,8 @@ async def _pull_model_and_fingerprint(
 
     logger.debug(f"Requesting model from server {model_server.url}...")
 
-    async with model_server.session() as session:
+    # the checksums which the model server sends refer to the encoded body
+    async with model_server.session(auto_decompress=False) as session:
         try:
             params = model_server.combine_parameters()
             async with session.request(
@@ -224,7 +343,19 @@ async def _pull_model_and_fingerprint(
                     )
                     return None
 
-                rasa.utils.io.unarchive(await resp.read(), model_directory)
+                archive_path = await _download_model_archive(
+                    resp, model_server.kwargs.get("verify_etag", False)
+                )
+                try:
+                    # extracting hundreds of MB takes a while
+                    await asyncio.get_event_loop().run_in_executor(
+                        None,
+                        rasa.utils.io.unarchive_file,
+                        archive_path,
+                        model_directory,
+                    )
+                finally:
+                    os.remove(archive_path)
                 logger.debug(
                     "Unzipped model to '{}'".format(os.path.abspath(model_directory))
                 )
@@ -239,6 +370,144 @@ async def _pull_model_and_fingerprint(
                 "Error: {}.".format(e)
             )
             return None
+        except ModelDownloadError as e:
+            logger.warning(f"Downloaded model is corrupted. We'll retry later... {e}")
+            return None
+
+
+def _expected_checksums(
+    headers: "CIMultiDictProxy[Text]", verify_etag: bool
+) -> Dict[Text, Text]:
+    """Collects the checksums of the response body which the server announced.
+
+    Args:
+        headers: Response headers.
+        verify_etag: Whether the `ETag` is the MD5 hash of the model archive (as
+            e.g. for single part uploads to S3).
+
+    Returns:
+        Hex digests by name of the hash algorithm.
+    """
+    checksums = {}
+
+    if headers.get("Content-MD5"):
+        checksums["md5"] = base64.b64decode(headers["Content-MD5"]).hex()
+
+    for digest in headers.get("Digest", "").split(","):
+        algorithm, _, value = digest.strip().partition("=")
+        algorithm = algorithm.lower().replace("-", "")
+        if algorithm in ["md5", "sha256"] and value:
+            checksums[algorithm] = base64.b64decode(value).hex()
+
+    etag = headers.get("ETag")
+    if verify_etag and etag:
+        checksums["md5"] = etag.replace("W/", "").strip('"')
+
+    return checksums
+
+
+def _content_decoder(content_encoding: Optional[Text]) -> Optional[Any]:
+    """Creates a decoder for the `Content-Encoding` of the model archive.
+
+    Returns:
+        A `zlib` decompression object or `None` if the body is not encoded.
+
+    Raises:
+        ModelDownloadError: If the encoding is not supported.
+    """
+    content_encoding = (content_encoding or "identity").lower()
+    if content_encoding == "identity":
+        return None
+    if content_encoding in ["gzip", "x-gzip"]:
+        return zlib.decompressobj(16 + zlib.MAX_WBITS)
+    if content_encoding == "deflate":
+        return zlib.decompressobj()
+
+    raise ModelDownloadError(
+        f"The model server sent the model with the unsupported content encoding "
+        f"'{content_encoding}'."
+    )
+
+
+def _archive_suffix(url_path: Text) -> Text:
+    # the archive is extracted based on its content, the suffix only helps to
+    # recognize the file
+    for extension in MODEL_ARCHIVE_EXTENSIONS.values():
+        if url_path.endswith(extension):
+            return extension
+    return ""
+
+
+async def _download_model_archive(
+    resp: aiohttp.ClientResponse, verify_etag: bool = False
+) -> Text:
+    """Streams the model archive to a temporary file.
+
+    Only one chunk of the archive is held in memory at a time. The size of the
+    archive and its checksums are verified if the server sent them. They refer to
+    the body as it was sent, so the response must not be decompressed by
+    `aiohttp`. A `Content-Encoding` of the body is decoded here instead.
+
+    Args:
+        resp: Response of the model server.
+        verify_etag: Whether the `ETag` is the MD5 hash of the model archive.
+
+    Returns:
+        Path to the downloaded archive.
+
+    Raises:
+        ModelDownloadError: If the archive doesn't match its size or checksums.
+    """
+    expected_checksums = _expected_checksums(resp.headers, verify_etag)
+    hashes = {algorithm: hashlib.new(algorithm) for algorithm in expected_checksums}
+    total_size = resp.content_length
+    downloaded = 0
+    next_progress_log = MODEL_DOWNLOAD_PROGRESS_INTERVAL
+    start = time.time()
+
+    decoder = _content_decoder(resp.headers.get("Content-Encoding"))
+
+    archive_file = tempfile.NamedTemporaryFile(
+        suffix=_archive_suffix(resp.url.path), delete=False
+    )
+    try:
+        with archive_file:
+            async for chunk in resp.content.iter_chunked(MODEL_DOWNLOAD_CHUNK_SIZE):
+                archive_file.write(decoder.decompress(chunk) if decoder else chunk)
+                for model_hash in hashes.values():
+                    model_hash.update(chunk)
+
+                downloaded += len(chunk)
+                if downloaded >= next_progress_log:
+                    next_progress_log += MODEL_DOWNLOAD_PROGRESS_INTERVAL
+                    total = f"{total_size / 1024 ** 2:.0f}" if total_size else "?"
+                    logger.debug(
+                        f"Downloaded {downloaded / 1024 ** 2:.0f} of {total}MB of "
+                        f"the model."
+                    )
+            if decoder:
+                archive_file.write(decoder.flush())
+
+        if total_size is not None and downloaded != total_size:
+            raise ModelDownloadError(
+                f"Received {downloaded} bytes, but the model has {total_size} bytes."
+            )
+        for algorithm, expected in expected_checksums.items():
+            if hashes[algorithm].hexdigest() != expected:
+                raise ModelDownloadError(
+                    f"The {algorithm} checksum of the model doesn't match the "
+                    f"checksum sent by the model server."
+                )
+    except BaseException:
+        os.remove(archive_file.name)
+        raise
+
+    duration = time.time() - start
+    logger.debug(
+        f"Downloaded model ({downloaded / 1024 ** 2:.1f}MB) in {duration:.1f}s "
+        f"({downloaded / 1024 ** 2 / max(duration, 1e-6):.1f}MB/s)."
+    )
+    return archive_file.name
 
 
 async def _run_model_pulling_worker(
@@ -277,6 +546,7 @@ async def load_agent(
     tracker_store: Optional[TrackerStore] = None,
     lock_store: Optional[LockStore] = None,
     action_endpoint: Optional[EndpointConfig] = None,
+    parse_cache: Optional["ParseCache"] = None,
 ):
     try:
         if model_server is not None:
@@ -289,6 +559,7 @@ async def load_agent(
                     action_endpoint=action_endpoint,
                     model_server=model_server,
                     remote_storage=remote_storage,
+                    parse_cache=parse_cache,
                 ),
                 model_server,
             )
@@ -303,6 +574,7 @@ async def load_agent(
                 lock_store=lock_store,
                 action_endpoint=action_endpoint,
                 model_server=model_server,
+                parse_cache=parse_cache,
             )
 
         elif model_path is not None and os.path.exists(model_path):
@@ -315,6 +587,7 @@ async def load_agent(
                 action_endpoint=action_endpoint,
                 model_server=model_server,
                 remote_storage=remote_storage,
+                parse_cache=parse_cache,
             )
 
         else:
@@ -349,6 +622,7 @@ class Agent:
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
         path_to_model_archive: Optional[Text] = None,
+        parse_cache: Optional["ParseCache"] = None,
     ):
         # Initializing variables with the passed parameters.
         self.domain = self._create_domain(domain)
@@ -371,6 +645,11 @@ class Agent:
         self.remote_storage = remote_storage
         self.path_to_model_archive = path_to_model_archive
 
+        self.parse_cache = parse_cache
+        self._update_parse_cache()
+        # directory of a model which is being loaded to replace the current one
+        self.pending_model_directory = None
+
     def update_model(
         self,
         domain: Optional[Domain],
@@ -393,6 +672,29 @@ class Agent:
             self.nlg.templates = domain.templates if domain else {}
 
         self.model_directory = model_directory
+        self._update_parse_cache()
+
+    def _update_parse_cache(self) -> None:
+        """Lets the interpreter use the parse cache for the current model.
+
+        Only the `MultilingualNLUInterpreter` and the `RasaNLUInterpreter` use the
+        cache.
+        """
+        if self.parse_cache is None:
+            return
+
+        self.parse_cache.set_fingerprint(self.fingerprint)
+        if self.uses_parse_cache():
+            self.interpreter.parse_cache = self.parse_cache
+
+    def uses_parse_cache(self) -> bool:
+        """Checks if the parse cache is used by the interpreter of the agent."""
+        from rasa_addons.core.interpreter import MultilingualNLUInterpreter
+
+        return self.parse_cache is not None and isinstance(
+            self.interpreter,
+            (MultilingualNLUInterpreter, rasa.core.interpreter.RasaNLUInterpreter),
+        )
 
     @classmethod
     def load(
@@ -408,6 +710,7 @@ class Agent:
         path_to_model_archive: Optional[Text] = None,
         new_config: Optional[Dict] = None,
         finetuning_epoch_fraction: float = 1.0,
+        parse_cache: Optional["ParseCache"] = None,
     ) -> "Agent":
         """Load a persisted model from the passed path."""
         try:
@@ -421,9 +724,9 @@ class Agent:
             raise ModelNotFound(
                 f"You are trying to load a model from '{model_path}', "
                 f"which is not possible. \n"
-                f"The model path should be a 'tar.gz' file or a directory "
-                f"containing the various model files in the sub-directories "
-                f"'core' and 'nlu'. \n\n"
+                f"The model path should be a 'tar.gz', 'tar' or 'tar.zst' file or a "
+                f"directory containing the various model files in the "
+                f"sub-directories 'core' and 'nlu'. \n\n"
                 f"If you want to load training data instead of a model, use "
                 f"`agent.load_data(...)` instead. {e}"
             )
@@ -463,6 +766,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             path_to_model_archive=path_to_model_archive,
+            parse_cache=parse_cache,
         )
 
     def is_core_ready(self) -> bool:
@@ -828,6 +1132,7 @@ class Agent:
             self.nlg,
             action_endpoint=self.action_endpoint,
             message_preprocessor=preprocessor,
+            model_directory=self.model_directory,
         )
 
     @staticmethod
@@ -895,6 +1200,7 @@ class Agent:
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
         remote_storage: Optional[Text] = None,
+        parse_cache: Optional["ParseCache"] = None,
     ) -> "Agent":
         if os.path.isfile(model_path):
             model_archive = model_path
@@ -905,7 +1211,7 @@ class Agent:
             rasa.shared.utils.io.raise_warning(
                 f"Could not load local model in '{model_path}'."
             )
-            return Agent()
+            return Agent(parse_cache=parse_cache)
 
         working_directory = tempfile.mkdtemp()
         unpacked_model = unpack_model(model_archive, working_directory)
@@ -920,6 +1226,7 @@ class Agent:
             model_server=model_server,
             remote_storage=remote_storage,
             path_to_model_archive=model_archive,
+            parse_cache=parse_cache,
         )
 
     @staticmethod
@@ -932,6 +1239,7 @@ class Agent:
         lock_store: Optional[LockStore] = None,
         action_endpoint: Optional[EndpointConfig] = None,
         model_server: Optional[EndpointConfig] = None,
+        parse_cache: Optional["ParseCache"] = None,
     ) -> Optional["Agent"]:
         from rasa.nlu.persistor import get_persistor
 
@@ -950,6 +1258,7 @@ class Agent:
                 action_endpoint=action_endpoint,
                 model_server=model_server,
                 remote_storage=remote_storage,
+                parse_cache=parse_cache,
             )
 
         return None
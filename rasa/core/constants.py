@@ -48,3 +48,20 @@ POSTGRESQL_SCHEMA = "POSTGRESQL_SCHEMA"
 # Names of the environment variables defining PostgreSQL pool size and max overflow
 POSTGRESQL_POOL_SIZE = "SQL_POOL_SIZE"
 POSTGRESQL_MAX_OVERFLOW = "SQL_MAX_OVERFLOW"
+
+# Names of the environment variables configuring the micro-batching of NLU parse
+# requests. Batching is disabled if the wait time (in seconds) is 0.
+ENV_NLU_BATCH_WAIT_TIME = "NLU_BATCH_WAIT_TIME"
+ENV_NLU_MAX_BATCH_SIZE = "NLU_MAX_BATCH_SIZE"
+DEFAULT_NLU_BATCH_WAIT_TIME = 0
+DEFAULT_NLU_MAX_BATCH_SIZE = 32
+
+# Names of the environment variables configuring where NLU parsing and policy
+# predictions run: on the event loop (`loop`), in a thread pool (`thread`) or in a
+# process pool which loads the model once per worker process (`process`).
+ENV_INFERENCE_EXECUTOR = "INFERENCE_EXECUTOR"
+ENV_INFERENCE_WORKERS = "INFERENCE_WORKERS"
+INFERENCE_EXECUTOR_LOOP = "loop"
+INFERENCE_EXECUTOR_THREAD = "thread"
+INFERENCE_EXECUTOR_PROCESS = "process"
+DEFAULT_INFERENCE_EXECUTOR = INFERENCE_EXECUTOR_LOOP
@@ -29,3 +29,14 @@ class AgentNotReady(RasaCoreException):
     def __init__(self, message: Text) -> None:
         self.message = message
         super(AgentNotReady, self).__init__()
+
+
+class ModelDownloadError(RasaCoreException):
+    """Raised if a model which was pulled from a model server is corrupted."""
+
+    def __init__(self, message: Text) -> None:
+        self.message = message
+        super(ModelDownloadError, self).__init__()
+
+    def __str__(self) -> Text:
+        return self.message
@@ -0,0 +1,356 @@
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Text, Tuple, TYPE_CHECKING
+
+from rasa.core import constants
+
+if TYPE_CHECKING:
+    from rasa.core.policies.ensemble import PolicyEnsemble
+    from rasa.core.policies.policy import PolicyPrediction
+    from rasa.nlu.model import Interpreter
+    from rasa.shared.core.domain import Domain
+    from rasa.shared.core.trackers import DialogueStateTracker
+    from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_EXECUTOR_MODES = [
+    constants.INFERENCE_EXECUTOR_LOOP,
+    constants.INFERENCE_EXECUTOR_THREAD,
+    constants.INFERENCE_EXECUTOR_PROCESS,
+]
+
+_executor: Optional["InferenceExecutor"] = None
+
+# models which were loaded by a worker process of the process pool, by path. Only
+# the models which belong to the latest (unpacked) Rasa model are kept.
+_worker_models: Dict[Text, Tuple[Text, Any]] = {}
+
+
+class InferenceExecutor:
+    """Runs NLU parsing and policy predictions.
+
+    In `loop` mode the models run directly on the event loop. In `thread` mode they
+    run in a thread pool and share the models which were loaded by the server. In
+    `process` mode every worker process loads the models from the model directory,
+    so inference is not limited by the GIL at the cost of one model copy per worker.
+    Models which don't have a model directory run in a thread pool in this case, as
+    do policy predictions with an interpreter which featurizes messages.
+    """
+
+    def __init__(
+        self,
+        mode: Text = constants.DEFAULT_INFERENCE_EXECUTOR,
+        max_workers: Optional[int] = None,
+    ) -> None:
+        if mode not in INFERENCE_EXECUTOR_MODES:
+            raise ValueError(
+                f"Unknown inference executor '{mode}'. Please use one of "
+                f"{INFERENCE_EXECUTOR_MODES}."
+            )
+
+        self.mode = mode
+        self.max_workers = max_workers
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def runs_on_loop(self) -> bool:
+        return self.mode == constants.INFERENCE_EXECUTOR_LOOP
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                self.max_workers, thread_name_prefix="inference"
+            )
+        return self._thread_pool
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            # forking a process which already initialized TensorFlow can deadlock
+            self._process_pool = ProcessPoolExecutor(
+                self.max_workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._process_pool
+
+    async def _run(self, pool: Executor, func: Callable[..., Any], *args: Any) -> Any:
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(pool, functools.partial(func, *args))
+
+    async def _run_in_worker(
+        self,
+        model_directory: Optional[Text],
+        worker_func: Callable[[Text, Any], Any],
+        worker_input: Any,
+        local_func: Callable[..., Any],
+        *local_args: Any,
+    ) -> Any:
+        if self.mode == constants.INFERENCE_EXECUTOR_PROCESS and model_directory:
+            return await self._run(
+                self._get_process_pool(), worker_func, model_directory, worker_input
+            )
+        return await self._run(self._get_thread_pool(), local_func, *local_args)
+
+    async def parse(
+        self, interpreter: "Interpreter", model_directory: Optional[Text], text: Text
+    ) -> Dict[Text, Any]:
+        """Parses `text` with the NLU model.
+
+        Args:
+            interpreter: The loaded NLU model.
+            model_directory: Directory of the persisted NLU model.
+            text: Text to parse.
+
+        Returns:
+            The parse result.
+        """
+        if self.runs_on_loop:
+            return interpreter.parse(text)
+
+        return await self._run_in_worker(
+            model_directory, _parse_in_worker, text, interpreter.parse, text
+        )
+
+    async def parse_batch(
+        self,
+        interpreter: "Interpreter",
+        model_directory: Optional[Text],
+        texts: List[Text],
+    ) -> List[Dict[Text, Any]]:
+        """Parses several texts with the NLU model at once.
+
+        Args:
+            interpreter: The loaded NLU model.
+            model_directory: Directory of the persisted NLU model.
+            texts: Texts to parse.
+
+        Returns:
+            The parse results in the order of `texts`.
+        """
+        if self.runs_on_loop:
+            return interpreter.parse_batch(texts)
+
+        return await self._run_in_worker(
+            model_directory,
+            _parse_batch_in_worker,
+            texts,
+            interpreter.parse_batch,
+            texts,
+        )
+
+    async def probabilities_using_best_policy(
+        self,
+        policy_ensemble: "PolicyEnsemble",
+        tracker: "DialogueStateTracker",
+        domain: "Domain",
+        interpreter: "NaturalLanguageInterpreter",
+        model_directory: Optional[Text],
+    ) -> "PolicyPrediction":
+        """Predicts the next action with the policy ensemble.
+
+        Args:
+            policy_ensemble: The loaded policy ensemble.
+            tracker: The conversation to predict the next action for.
+            domain: The model's domain.
+            interpreter: Interpreter which may be used by the policies.
+            model_directory: Directory of the persisted (unpacked) Rasa model.
+
+        Returns:
+            The prediction of the best policy.
+        """
+        if self.runs_on_loop:
+            return policy_ensemble.probabilities_using_best_policy(
+                tracker, domain, interpreter
+            )
+
+        if _featurizes_messages(interpreter):
+            # the worker processes don't have the NLU model of the server, so the
+            # policies would get different features for the messages
+            model_directory = None
+
+        return await self._run_in_worker(
+            model_directory,
+            _predict_in_worker,
+            tracker,
+            policy_ensemble.probabilities_using_best_policy,
+            tracker,
+            domain,
+            interpreter,
+        )
+
+    async def probabilities_using_best_policy_batch(
+        self,
+        policy_ensemble: "PolicyEnsemble",
+        trackers: List["DialogueStateTracker"],
+        domain: "Domain",
+        interpreter: "NaturalLanguageInterpreter",
+        model_directory: Optional[Text],
+    ) -> List["PolicyPrediction"]:
+        """Predicts the next action for several conversations at once.
+
+        Args:
+            policy_ensemble: The loaded policy ensemble.
+            trackers: The conversations to predict the next action for.
+            domain: The model's domain.
+            interpreter: Interpreter which may be used by the policies.
+            model_directory: Directory of the persisted (unpacked) Rasa model.
+
+        Returns:
+            The prediction of the best policy for every tracker.
+        """
+        if self.runs_on_loop:
+            return policy_ensemble.probabilities_using_best_policy_batch(
+                trackers, domain, interpreter
+            )
+
+        if _featurizes_messages(interpreter):
+            model_directory = None
+
+        return await self._run_in_worker(
+            model_directory,
+            _predict_batch_in_worker,
+            trackers,
+            policy_ensemble.probabilities_using_best_policy_batch,
+            trackers,
+            domain,
+            interpreter,
+        )
+
+    def shutdown(self) -> None:
+        """Stops the worker pools."""
+        for pool in [self._thread_pool, self._process_pool]:
+            if pool is not None:
+                pool.shutdown(wait=False)
+
+        self._thread_pool = None
+        self._process_pool = None
+
+
+def _load_worker_model(
+    path: Text, rasa_model_directory: Text, load: Callable[[Text], Any]
+) -> Any:
+    if path not in _worker_models:
+        for cached_path, (directory, _) in list(_worker_models.items()):
+            if directory != rasa_model_directory:
+                del _worker_models[cached_path]
+
+        logger.debug(f"Loading model from '{path}' in worker {os.getpid()}.")
+        _worker_models[path] = (rasa_model_directory, load(path))
+
+    return _worker_models[path][1]
+
+
+def _load_nlu_model(model_directory: Text) -> "Interpreter":
+    from rasa.nlu.model import Interpreter
+
+    return Interpreter.load(model_directory)
+
+
+def _load_core_model(model_directory: Text) -> Tuple["PolicyEnsemble", "Domain"]:
+    from rasa.core.policies.ensemble import PolicyEnsemble
+    from rasa.model import get_model_subdirectories
+    from rasa.shared.constants import DEFAULT_DOMAIN_PATH
+    from rasa.shared.core.domain import Domain
+
+    core_path, _ = get_model_subdirectories(model_directory)
+    return (
+        PolicyEnsemble.load(core_path),
+        Domain.load(os.path.join(core_path, DEFAULT_DOMAIN_PATH)),
+    )
+
+
+def _parse_in_worker(model_directory: Text, text: Text) -> Dict[Text, Any]:
+    interpreter = _load_worker_model(
+        model_directory, os.path.dirname(model_directory), _load_nlu_model
+    )
+    return interpreter.parse(text)
+
+
+def _parse_batch_in_worker(
+    model_directory: Text, texts: List[Text]
+) -> List[Dict[Text, Any]]:
+    interpreter = _load_worker_model(
+        model_directory, os.path.dirname(model_directory), _load_nlu_model
+    )
+    return interpreter.parse_batch(texts)
+
+
+def _predict_in_worker(
+    model_directory: Text, tracker: "DialogueStateTracker"
+) -> "PolicyPrediction":
+    from rasa.shared.nlu.interpreter import RegexInterpreter
+
+    policy_ensemble, domain = _load_worker_model(
+        model_directory, model_directory, _load_core_model
+    )
+    # predictions only run in a worker process if the interpreter of the server
+    # doesn't featurize messages either, so the policies get the same features
+    return policy_ensemble.probabilities_using_best_policy(
+        tracker, domain, RegexInterpreter()
+    )
+
+
+def _predict_batch_in_worker(
+    model_directory: Text, trackers: List["DialogueStateTracker"]
+) -> List["PolicyPrediction"]:
+    from rasa.shared.nlu.interpreter import RegexInterpreter
+
+    policy_ensemble, domain = _load_worker_model(
+        model_directory, model_directory, _load_core_model
+    )
+    return policy_ensemble.probabilities_using_best_policy_batch(
+        trackers, domain, RegexInterpreter()
+    )
+
+
+def _featurizes_messages(interpreter: "NaturalLanguageInterpreter") -> bool:
+    from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
+
+    return (
+        type(interpreter).featurize_message
+        is not NaturalLanguageInterpreter.featurize_message
+    )
+
+
+def _get_inference_workers() -> Optional[int]:
+    workers = os.environ.get(constants.ENV_INFERENCE_WORKERS)
+    return int(workers) if workers else None
+
+
+def inference_executor() -> InferenceExecutor:
+    """Process global executor for NLU parsing and policy predictions.
+
+    If no executor exists yet, one is created from the `INFERENCE_EXECUTOR` and
+    `INFERENCE_WORKERS` environment variables.
+    """
+    global _executor
+
+    if _executor is None:
+        _executor = InferenceExecutor(
+            os.environ.get(
+                constants.ENV_INFERENCE_EXECUTOR, constants.DEFAULT_INFERENCE_EXECUTOR
+            ),
+            _get_inference_workers(),
+        )
+    return _executor
+
+
+def set_inference_executor(executor: Optional[InferenceExecutor]) -> None:
+    """Replaces the process global executor, e.g. to configure it in code."""
+    global _executor
+
+    if _executor is not None and _executor is not executor:
+        _executor.shutdown()
+    _executor = executor
+
+
+def shutdown_inference_executor() -> None:
+    """Stops the process global executor.
+
+    Another call to `inference_executor` will create a new executor.
+    """
+    set_inference_executor(None)
@@ -51,17 +51,22 @@ class TrackerFeaturizer:
         self.state_featurizer = state_featurizer
 
     @staticmethod
-    def _create_states(tracker: DialogueStateTracker, domain: Domain) -> List[State]:
+    def _create_states(
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        max_history: Optional[int] = None,
+    ) -> List[State]:
         """Create states for the given tracker.
 
         Args:
             tracker: a :class:`rasa.core.trackers.DialogueStateTracker`
             domain: a :class:`rasa.shared.core.domain.Domain`
+            max_history: Only create this many of the latest states.
 
         Returns:
             a list of states
         """
-        return tracker.past_states(domain)
+        return tracker.past_states(domain, max_history)
 
     def _featurize_states(
         self,
@@ -243,6 +248,7 @@ class TrackerFeaturizer:
         trackers: List[DialogueStateTracker],
         domain: Domain,
         use_text_for_last_user_input: bool = False,
+        max_history: Optional[int] = None,
     ) -> List[List[State]]:
         """Transforms list of trackers to lists of states for prediction.
 
@@ -251,6 +257,8 @@ class TrackerFeaturizer:
             domain: The domain
             use_text_for_last_user_input: Indicates whether to use text or intent label
                 for featurizing last user input.
+            max_history: Only create this many of the latest states. `None` for the
+                states which the featurizer uses.
 
         Returns:
             A list of states.
@@ -405,6 +413,7 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
         trackers: List[DialogueStateTracker],
         domain: Domain,
         use_text_for_last_user_input: bool = False,
+        max_history: Optional[int] = None,
     ) -> List[List[State]]:
         """Transforms list of trackers to lists of states for prediction.
 
@@ -413,12 +422,14 @@ class FullDialogueTrackerFeaturizer(TrackerFeaturizer):
             domain: The domain,
             use_text_for_last_user_input: Indicates whether to use text or intent label
                 for featurizing last user input.
+            max_history: Only create this many of the latest states. `None` for all
+                states.
 
         Returns:
             A list of states.
         """
         trackers_as_states = [
-            self._create_states(tracker, domain) for tracker in trackers
+            self._create_states(tracker, domain, max_history) for tracker in trackers
         ]
         self._choose_last_user_input(trackers_as_states, use_text_for_last_user_input)
 
@@ -560,6 +571,7 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
         trackers: List[DialogueStateTracker],
         domain: Domain,
         use_text_for_last_user_input: bool = False,
+        max_history: Optional[int] = None,
     ) -> List[List[State]]:
         """Transforms list of trackers to lists of states for prediction.
 
@@ -568,15 +580,21 @@ class MaxHistoryTrackerFeaturizer(TrackerFeaturizer):
             domain: The domain
             use_text_for_last_user_input: Indicates whether to use text or intent label
                 for featurizing last user input.
+            max_history: Only create this many of the latest states, if that's less
+                than the featurizer's `max_history`.
 
         Returns:
             A list of states.
         """
+        if not max_history or (self.max_history and self.max_history < max_history):
+            max_history = self.max_history
+
+        # only the latest states are created, as all others would be sliced off
         trackers_as_states = [
-            self._create_states(tracker, domain) for tracker in trackers
+            self._create_states(tracker, domain, max_history) for tracker in trackers
         ]
         trackers_as_states = [
-            self.slice_state_history(states, self.max_history)
+            self.slice_state_history(states, max_history)
             for states in trackers_as_states
         ]
         self._choose_last_user_input(trackers_as_states, use_text_for_last_user_input)
@@ -1,11 +1,25 @@
 import aiohttp
+import asyncio
+import inspect
 
 import logging
 
 import os
-from typing import Text, Dict, Any, Union, Optional
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Text,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
 
 from rasa.core import constants
+import rasa.core.executor
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.constants import INTENT_NAME_KEY
 import rasa.shared.utils.io
@@ -14,6 +28,9 @@ import rasa.shared.nlu.interpreter
 from rasa.shared.nlu.training_data.message import Message
 from rasa.utils.endpoints import EndpointConfig
 
+if TYPE_CHECKING:
+    from rasa.nlu.components import ComponentBuilder
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,19 +40,28 @@ def create_interpreter(
         EndpointConfig,
         Text,
         None,
-    ]
+    ],
+    component_builder: Optional["ComponentBuilder"] = None,
 ) -> "rasa.shared.nlu.interpreter.NaturalLanguageInterpreter":
-    """Factory to create a natural language interpreter."""
+    """Factory to create a natural language interpreter.
+
+    NLU models which are loaded from disk reuse the cached components of the
+    `component_builder`, if one is given.
+    """
 
     if isinstance(obj, rasa.shared.nlu.interpreter.NaturalLanguageInterpreter):
         return obj
     # bf>
     elif isinstance(obj, dict):
         from rasa_addons.core.interpreter import MultilingualNLUInterpreter
-        return MultilingualNLUInterpreter(model_directory=obj)
+        return MultilingualNLUInterpreter(
+            model_directory=obj, component_builder=component_builder
+        )
     # </bf
     elif isinstance(obj, str) and os.path.exists(obj):
-        return RasaNLUInterpreter(model_directory=obj)
+        return RasaNLUInterpreter(
+            model_directory=obj, component_builder=component_builder
+        )
     elif isinstance(obj, str):
         # user passed in a string, but file does not exist
         logger.warning(
@@ -116,16 +142,124 @@ class RasaNLUHttpInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpre
             return None
 
 
+class MicroBatcher:
+    """Gathers concurrent requests and processes them in batches.
+
+    A batch is processed once `max_batch_size` requests were submitted, or
+    `max_wait_time` seconds after the first request of the batch was submitted.
+    """
+
+    def __init__(
+        self,
+        process_batch: Callable[[List[Any]], Union[List[Any], Awaitable[List[Any]]]],
+        max_wait_time: float,
+        max_batch_size: int,
+    ) -> None:
+        self.process_batch = process_batch
+        self.max_wait_time = max_wait_time
+        self.max_batch_size = max_batch_size
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def submit(self, item: Any) -> Any:
+        """Adds `item` to the next batch and returns its result."""
+        loop = asyncio.get_event_loop()
+        result = loop.create_future()
+        self._pending.append((item, result))
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_time, self._flush)
+
+        return await result
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        asyncio.ensure_future(self._process(batch))
+
+    async def _process(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        try:
+            results = self.process_batch([item for item, _ in batch])
+            if inspect.isawaitable(results):
+                results = await results
+        except Exception as e:
+            for _, result in batch:
+                if not result.done():
+                    result.set_exception(e)
+            return
+
+        for (_, result), value in zip(batch, results):
+            # the request might have been cancelled in the meantime
+            if not result.done():
+                result.set_result(value)
+
+
+def _get_nlu_batch_wait_time() -> float:
+    return float(
+        os.environ.get(
+            constants.ENV_NLU_BATCH_WAIT_TIME, constants.DEFAULT_NLU_BATCH_WAIT_TIME
+        )
+    )
+
+
+def _get_nlu_max_batch_size() -> int:
+    return int(
+        os.environ.get(
+            constants.ENV_NLU_MAX_BATCH_SIZE, constants.DEFAULT_NLU_MAX_BATCH_SIZE
+        )
+    )
+
+
 class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter):
     def __init__(
         self,
         model_directory: Text,
         config_file: Optional[Text] = None,
         lazy_init: bool = False,
+        batch_wait_time: Optional[float] = None,
+        max_batch_size: Optional[int] = None,
+        component_builder: Optional["ComponentBuilder"] = None,
     ):
+        """Creates an interpreter for a trained NLU model.
+
+        Args:
+            model_directory: Directory of the NLU model.
+            config_file: Unused.
+            lazy_init: If `True`, the model is only loaded for the first parse.
+            batch_wait_time: Time in seconds to gather concurrent parse requests, so
+                that they are processed as a batch. Defaults to the
+                `NLU_BATCH_WAIT_TIME` environment variable. Batching is disabled
+                if this is 0.
+            max_batch_size: Maximum number of parse requests which are processed
+                as one batch. Defaults to the `NLU_MAX_BATCH_SIZE` environment
+                variable.
+            component_builder: Builder whose cached components (e.g. language
+                models) are reused when loading the model.
+        """
         self.model_directory = model_directory
+        self.component_builder = component_builder
         self.lazy_init = lazy_init
         self.config_file = config_file
+        # set by the agent, so that the cache is invalidated with every new model
+        self.parse_cache = None
+
+        if batch_wait_time is None:
+            batch_wait_time = _get_nlu_batch_wait_time()
+        if max_batch_size is None:
+            max_batch_size = _get_nlu_max_batch_size()
+        self.batcher = (
+            MicroBatcher(self._parse_batch, batch_wait_time, max_batch_size)
+            if batch_wait_time > 0
+            else None
+        )
 
         if not lazy_init:
             self._load_interpreter()
@@ -146,9 +280,23 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
         if self.lazy_init and self.interpreter is None:
             self._load_interpreter()
 
-        result = self.interpreter.parse(text)
+        if self.parse_cache is not None:
+            return await self.parse_cache.parse(text, None, lambda: self._parse(text))
 
-        return result
+        return await self._parse(text)
+
+    async def _parse(self, text: Text) -> Dict[Text, Any]:
+        if self.batcher is not None:
+            return await self.batcher.submit(text)
+
+        return await rasa.core.executor.inference_executor().parse(
+            self.interpreter, self.model_directory, text
+        )
+
+    async def _parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        return await rasa.core.executor.inference_executor().parse_batch(
+            self.interpreter, self.model_directory, texts
+        )
 
     def featurize_message(self, message: Message) -> Optional[Message]:
         """Featurize message using a trained NLU pipeline.
@@ -165,7 +313,9 @@ class RasaNLUInterpreter(rasa.shared.nlu.interpreter.NaturalLanguageInterpreter)
     def _load_interpreter(self) -> None:
         from rasa.nlu.model import Interpreter
 
-        self.interpreter = Interpreter.load(self.model_directory)
+        self.interpreter = Interpreter.load(
+            self.model_directory, self.component_builder
+        )
 
 
 def _create_from_endpoint_config(
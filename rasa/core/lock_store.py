@@ -2,14 +2,16 @@ import asyncio
 import json
 import logging
 import os
+import time
+from collections import deque
 
 from async_generator import asynccontextmanager
-from typing import Text, Union, Optional, AsyncGenerator
+from typing import Any, Dict, Text, Union, Optional, AsyncGenerator
 
 from rasa.shared.exceptions import RasaException
 import rasa.shared.utils.common
 from rasa.core.constants import DEFAULT_LOCK_LIFETIME
-from rasa.core.lock import TicketLock
+from rasa.core.lock import Ticket, TicketLock
 from rasa.utils.endpoints import EndpointConfig
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,54 @@ LOCK_LIFETIME = _get_lock_lifetime()
 DEFAULT_SOCKET_TIMEOUT_IN_SECONDS = 10
 
 DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX = "lock:"
+REDIS_LOCK_STORE_RELEASE_CHANNEL = "released"
+# member of the sorted set which marks that the lock exists, even if it has no tickets
+REDIS_LOCK_MARKER = "lock"
+
+# Locks are stored in Redis as sorted sets of ticket numbers scored by their
+# expiration time. The scripts below run atomically on the Redis server and all
+# receive the current time as first argument. Locks stored as JSON by previous
+# versions are replaced.
+_REDIS_REMOVE_EXPIRED_TICKETS = """
+if redis.call('TYPE', KEYS[1]).ok == 'string' then
+    redis.call('DEL', KEYS[1])
+end
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', '(' .. ARGV[1])
+"""
+
+_REDIS_ISSUE_TICKET = (
+    _REDIS_REMOVE_EXPIRED_TICKETS
+    + """
+local last_issued = -1
+for _, member in ipairs(redis.call('ZRANGE', KEYS[1], 0, -1)) do
+    local number = tonumber(member)
+    if number and number > last_issued then
+        last_issued = number
+    end
+end
+local ticket = last_issued + 1
+redis.call('ZADD', KEYS[1], 'inf', ARGV[3])
+redis.call('ZADD', KEYS[1], tonumber(ARGV[1]) + tonumber(ARGV[2]), ticket)
+return ticket
+"""
+)
+
+_REDIS_FINISH_SERVING = (
+    _REDIS_REMOVE_EXPIRED_TICKETS
+    + """
+redis.call('ZREM', KEYS[1], ARGV[2])
+"""
+)
+
+_REDIS_CLEANUP = (
+    _REDIS_FINISH_SERVING
+    + """
+if redis.call('ZCARD', KEYS[1]) <= 1 then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+)
 
 
 # noinspection PyUnresolvedReferences
@@ -94,8 +144,8 @@ class LockStore:
     ) -> AsyncGenerator[TicketLock, None]:
         """Acquire lock with lifetime `lock_lifetime`for `conversation_id`.
 
-        Try acquiring lock with a wait time of `wait_time_in_seconds` seconds
-        between attempts. Raise a `LockError` if lock has expired.
+        Try acquiring lock whenever a ticket of the lock was served, but at least
+        every `wait_time_in_seconds` seconds. Raise a `LockError` if lock has expired.
         """
         ticket = self.issue_ticket(conversation_id, lock_lifetime)
         try:
@@ -111,6 +161,10 @@ class LockStore:
     ) -> TicketLock:
         logger.debug(f"Acquiring lock for conversation '{conversation_id}'.")
         while True:
+            # wait for releases before fetching the lock, so that a release in
+            # between isn't missed
+            released = self._release_event(conversation_id)
+
             # fetch lock in every iteration because lock might no longer exist
             lock = self.get_lock(conversation_id)
 
@@ -128,14 +182,47 @@ class LockStore:
                 f"Retrying..."
             )
 
-            # sleep and update lock
-            await asyncio.sleep(wait_time_in_seconds)
+            # wait until a ticket was served (or the wait time is over) and update lock
+            await self._wait_for_release(released, wait_time_in_seconds)
             self.update_lock(conversation_id)
 
         raise LockError(
             f"Could not acquire lock for conversation_id '{conversation_id}'."
         )
 
+    def _release_events(self) -> Dict[Text, asyncio.Event]:
+        # created lazily as subclasses don't have to call `LockStore.__init__()`
+        if not hasattr(self, "_conversation_release_events"):
+            self._conversation_release_events = {}
+        return self._conversation_release_events
+
+    def _release_event(self, conversation_id: Text) -> asyncio.Event:
+        """Event which is set when a ticket of the lock for `conversation_id` is
+        served."""
+        release_events = self._release_events()
+        if conversation_id not in release_events:
+            release_events[conversation_id] = asyncio.Event()
+        return release_events[conversation_id]
+
+    def _on_release(self, conversation_id: Text) -> None:
+        """Wake up everyone in this process waiting for `conversation_id`."""
+        released = self._release_events().pop(conversation_id, None)
+        if released:
+            released.set()
+
+    def _notify_release(self, conversation_id: Text) -> None:
+        """Notify everyone waiting for `conversation_id` that a ticket was served."""
+        self._on_release(conversation_id)
+
+    async def _wait_for_release(
+        self, released: asyncio.Event, wait_time_in_seconds: float
+    ) -> None:
+        try:
+            await asyncio.wait_for(released.wait(), wait_time_in_seconds)
+        except asyncio.TimeoutError:
+            # poll in case a notification got lost
+            pass
+
     def update_lock(self, conversation_id: Text) -> None:
         """Fetch lock for `conversation_id`, remove expired tickets and save lock."""
 
@@ -175,6 +262,7 @@ class LockStore:
         if lock:
             lock.remove_ticket_for(ticket_number)
             self.save_lock(lock)
+            self._notify_release(conversation_id)
 
     def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
         """Remove lock for `conversation_id` if no one is waiting."""
@@ -183,6 +271,10 @@ class LockStore:
         if not self.is_someone_waiting(conversation_id):
             self.delete_lock(conversation_id)
 
+    async def close(self) -> None:
+        """Releases resources (e.g. connections) held by the lock store."""
+        pass
+
     @staticmethod
     def _log_deletion(conversation_id: Text, deletion_successful: bool) -> None:
         if deletion_successful:
@@ -221,7 +313,7 @@ class RedisLockStore(LockStore):
         """
         import redis
 
-        self.red = redis.StrictRedis(
+        self._connection_kwargs = dict(
             host=host,
             port=int(port),
             db=int(db),
@@ -229,6 +321,8 @@ class RedisLockStore(LockStore):
             ssl=use_ssl,
             socket_timeout=socket_timeout,
         )
+        self.red = redis.StrictRedis(**self._connection_kwargs)
+        self._register_scripts()
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -248,17 +342,166 @@ class RedisLockStore(LockStore):
     def _get_key_prefix(self) -> Text:
         return self.key_prefix
 
+    def _register_scripts(self) -> None:
+        # the scripts are sent to Redis by their SHA1 digest once they were loaded
+        self._scripts = {
+            script: self.red.register_script(script)
+            for script in [
+                _REDIS_REMOVE_EXPIRED_TICKETS,
+                _REDIS_ISSUE_TICKET,
+                _REDIS_FINISH_SERVING,
+                _REDIS_CLEANUP,
+            ]
+        }
+
+    def _run_script(self, script: Text, conversation_id: Text, *args: Any) -> Any:
+        return self._scripts[script](
+            keys=[self.key_prefix + conversation_id], args=[time.time(), *args]
+        )
+
     def get_lock(self, conversation_id: Text) -> Optional[TicketLock]:
-        serialised_lock = self.red.get(self.key_prefix + conversation_id)
-        if serialised_lock:
-            return TicketLock.from_dict(json.loads(serialised_lock))
+        import redis.exceptions
+
+        key = self.key_prefix + conversation_id
+        try:
+            members = self.red.zrange(key, 0, -1, withscores=True)
+        except redis.exceptions.ResponseError:
+            # lock stored as JSON by a previous version
+            return TicketLock.from_dict(json.loads(self.red.get(key)))
+
+        if not members:
+            return None
+
+        tickets = sorted(
+            (
+                Ticket(int(member), expires)
+                for member, expires in members
+                if member.decode() != REDIS_LOCK_MARKER
+            ),
+            key=lambda ticket: ticket.number,
+        )
+        return TicketLock(conversation_id, deque(tickets))
 
     def delete_lock(self, conversation_id: Text) -> None:
         deletion_successful = self.red.delete(self.key_prefix + conversation_id)
         self._log_deletion(conversation_id, deletion_successful)
 
     def save_lock(self, lock: TicketLock) -> None:
-        self.red.set(self.key_prefix + lock.conversation_id, lock.dumps())
+        key = self.key_prefix + lock.conversation_id
+        tickets = {str(ticket.number): ticket.expires for ticket in lock.tickets}
+        pipeline = self.red.pipeline()
+        pipeline.delete(key)
+        pipeline.zadd(key, {REDIS_LOCK_MARKER: float("inf"), **tickets})
+        pipeline.execute()
+
+    def issue_ticket(
+        self, conversation_id: Text, lock_lifetime: float = LOCK_LIFETIME
+    ) -> int:
+        """Issue new ticket with `lock_lifetime` for lock associated with
+        `conversation_id`.
+
+        Creates a new lock if none is found.
+        """
+        logger.debug(f"Issuing ticket for conversation '{conversation_id}'.")
+        try:
+            return int(
+                self._run_script(
+                    _REDIS_ISSUE_TICKET,
+                    conversation_id,
+                    lock_lifetime,
+                    REDIS_LOCK_MARKER,
+                )
+            )
+        except Exception as e:
+            raise LockError(f"Error while acquiring lock. Error:\n{e}")
+
+    def update_lock(self, conversation_id: Text) -> None:
+        """Remove expired tickets of the lock for `conversation_id`."""
+
+        self._run_script(_REDIS_REMOVE_EXPIRED_TICKETS, conversation_id)
+
+    def finish_serving(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finish serving ticket with `ticket_number` for `conversation_id`."""
+
+        self._run_script(_REDIS_FINISH_SERVING, conversation_id, ticket_number)
+        self._notify_release(conversation_id)
+
+    def cleanup(self, conversation_id: Text, ticket_number: int) -> None:
+        """Finish serving `ticket_number` and remove lock for `conversation_id` if no
+        one is waiting."""
+
+        deletion_successful = self._run_script(
+            _REDIS_CLEANUP, conversation_id, ticket_number
+        )
+        self._notify_release(conversation_id)
+        if deletion_successful:
+            self._log_deletion(conversation_id, deletion_successful)
+
+    def _release_channel(self) -> Text:
+        return self.key_prefix + REDIS_LOCK_STORE_RELEASE_CHANNEL
+
+    def _notify_release(self, conversation_id: Text) -> None:
+        # wake up waiters of this process right away and the ones of other
+        # Rasa instances through Redis pub/sub
+        super()._notify_release(conversation_id)
+        try:
+            self.red.publish(self._release_channel(), conversation_id)
+        except Exception as e:
+            logger.debug(f"Could not publish release of lock: {e}")
+
+    def _create_async_client(self) -> Optional[Any]:
+        """Creates the client used to subscribe to releases of other instances."""
+        import redis.asyncio
+
+        return redis.asyncio.StrictRedis(**self._connection_kwargs)
+
+    async def _listen_for_releases(self) -> None:
+        client = self._create_async_client()
+        if client is None:
+            return
+
+        pubsub = client.pubsub(ignore_subscribe_messages=True)
+        try:
+            await pubsub.subscribe(self._release_channel())
+            while True:
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message:
+                    conversation_id = message["data"]
+                    if isinstance(conversation_id, bytes):
+                        conversation_id = conversation_id.decode()
+                    self._on_release(conversation_id)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # waiters fall back to polling until the listener is restarted
+            logger.warning(f"Stopped listening for released locks: {e}")
+        finally:
+            await pubsub.reset()
+            await client.close()
+
+    async def _wait_for_release(
+        self, released: asyncio.Event, wait_time_in_seconds: float
+    ) -> None:
+        release_listener = getattr(self, "_release_listener", None)
+        if release_listener is None or release_listener.done():
+            self._release_listener = asyncio.ensure_future(self._listen_for_releases())
+        await super()._wait_for_release(released, wait_time_in_seconds)
+
+    async def close(self) -> None:
+        """Stops listening for released locks and closes the subscription."""
+        release_listener = getattr(self, "_release_listener", None)
+        self._release_listener = None
+        if release_listener is None or release_listener.done():
+            return
+
+        # the listener unsubscribes and closes its client once it's cancelled
+        release_listener.cancel()
+        try:
+            await release_listener
+        except asyncio.CancelledError:
+            pass
 
 
 class RedisClusterLockStore(RedisLockStore):
@@ -298,6 +541,7 @@ class RedisClusterLockStore(RedisLockStore):
             ssl=use_ssl,
             socket_timeout=socket_timeout,
         )
+        self._register_scripts()
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
         if key_prefix:
@@ -306,6 +550,11 @@ class RedisClusterLockStore(RedisLockStore):
 
         super(RedisLockStore, self).__init__()
 
+    def _create_async_client(self) -> Optional[Any]:
+        # pub/sub isn't supported by the asyncio cluster client, waiters of other
+        # instances rely on polling
+        return None
+
 
 class InMemoryLockStore(LockStore):
     """In-memory store for ticket locks."""
@@ -218,6 +218,29 @@ class PolicyEnsemble:
     ) -> PolicyPrediction:
         raise NotImplementedError
 
+    def probabilities_using_best_policy_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for several conversations at once.
+
+        Args:
+            trackers: the :class:`rasa.core.trackers.DialogueStateTracker`s
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            interpreter: Interpreter which may be used by the policies to create
+                additional features.
+
+        Returns:
+            The best policy prediction for every tracker.
+        """
+        return [
+            self.probabilities_using_best_policy(tracker, domain, interpreter, **kwargs)
+            for tracker in trackers
+        ]
+
     def _max_histories(self) -> List[Optional[int]]:
         """Return max history."""
 
@@ -229,6 +252,17 @@ class PolicyEnsemble:
                 max_histories.append(None)
         return max_histories
 
+    def _number_of_featurized_states(self) -> Optional[int]:
+        """Returns how many of the latest states the policies use (`None` for all)."""
+        numbers_of_states = [
+            p.number_of_prediction_states()
+            for p in self.policies
+            if p.featurizer is not None
+        ]
+        if not numbers_of_states or not all(numbers_of_states):
+            return None
+        return max(numbers_of_states)
+
     def _add_package_version_info(self, metadata: Dict[Text, Any]) -> None:
         """Adds version info for self.versioned_packages to metadata."""
 
@@ -654,7 +688,24 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         """
         # find rejected action before running the policies
         # because some of them might add events
-        rejected_action_name = None
+        rejected_action_name = self._rejected_action_name(tracker)
+
+        # the policies featurize the same conversation history, replay it only once
+        tracker.cache_past_states(domain, self._number_of_featurized_states())
+
+        predictions = {
+            f"policy_{i}_{type(p).__name__}": self._get_prediction(
+                p, tracker, domain, interpreter
+            )
+            for i, p in enumerate(self.policies)
+        }
+
+        return self._pick_best_policy_without_rejected_action(
+            domain, predictions, rejected_action_name
+        )
+
+    @staticmethod
+    def _rejected_action_name(tracker: DialogueStateTracker) -> Optional[Text]:
         last_action_event = next(
             (
                 event
@@ -667,15 +718,15 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         if len(tracker.events) > 0 and isinstance(
             last_action_event, ActionExecutionRejected
         ):
-            rejected_action_name = last_action_event.action_name
-
-        predictions = {
-            f"policy_{i}_{type(p).__name__}": self._get_prediction(
-                p, tracker, domain, interpreter
-            )
-            for i, p in enumerate(self.policies)
-        }
+            return last_action_event.action_name
+        return None
 
+    def _pick_best_policy_without_rejected_action(
+        self,
+        domain: Domain,
+        predictions: Dict[Text, PolicyPrediction],
+        rejected_action_name: Optional[Text],
+    ) -> PolicyPrediction:
         if rejected_action_name:
             logger.debug(
                 f"Execution of '{rejected_action_name}' was rejected. "
@@ -733,6 +784,29 @@ class SimplePolicyEnsemble(PolicyEnsemble):
 
         return prediction
 
+    @classmethod
+    def _get_predictions_batch(
+        cls,
+        policy: Policy,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+    ) -> List[PolicyPrediction]:
+        if (
+            getattr(type(policy), "predict_action_probabilities_batch", None)
+            is not Policy.predict_action_probabilities_batch
+        ):
+            return policy.predict_action_probabilities_batch(
+                trackers, domain, interpreter
+            )
+
+        # the policy predicts one tracker at a time anyway, this also supports
+        # custom policies which implement older versions of the interface
+        return [
+            cls._get_prediction(policy, tracker, domain, interpreter)
+            for tracker in trackers
+        ]
+
     def _fallback_after_listen(
         self, domain: Domain, prediction: PolicyPrediction
     ) -> PolicyPrediction:
@@ -794,6 +868,67 @@ class SimplePolicyEnsemble(PolicyEnsemble):
         """
         winning_prediction = self._best_policy_prediction(tracker, domain, interpreter)
 
+        return self._finalize_prediction(tracker, domain, winning_prediction)
+
+    def probabilities_using_best_policy_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for several conversations at once.
+
+        Every policy predicts all trackers in one go (see
+        `Policy.predict_action_probabilities_batch`), afterwards the best prediction
+        is picked for every tracker as in `probabilities_using_best_policy`.
+
+        Args:
+            trackers: the :class:`rasa.core.trackers.DialogueStateTracker`s
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            interpreter: Interpreter which may be used by the policies to create
+                additional features.
+
+        Returns:
+            The best policy prediction for every tracker.
+        """
+        # find rejected actions before running the policies
+        # because some of them might add events
+        rejected_action_names = [
+            self._rejected_action_name(tracker) for tracker in trackers
+        ]
+        number_of_featurized_states = self._number_of_featurized_states()
+        for tracker in trackers:
+            tracker.cache_past_states(domain, number_of_featurized_states)
+
+        predictions_by_policy = {
+            f"policy_{i}_{type(p).__name__}": self._get_predictions_batch(
+                p, trackers, domain, interpreter
+            )
+            for i, p in enumerate(self.policies)
+        }
+
+        winning_predictions = []
+        for i, tracker in enumerate(trackers):
+            predictions = {
+                policy_name: policy_predictions[i]
+                for policy_name, policy_predictions in predictions_by_policy.items()
+            }
+            winning_prediction = self._pick_best_policy_without_rejected_action(
+                domain, predictions, rejected_action_names[i]
+            )
+            winning_predictions.append(
+                self._finalize_prediction(tracker, domain, winning_prediction)
+            )
+
+        return winning_predictions
+
+    def _finalize_prediction(
+        self,
+        tracker: DialogueStateTracker,
+        domain: Domain,
+        winning_prediction: PolicyPrediction,
+    ) -> PolicyPrediction:
         if (
             tracker.latest_action_name == ACTION_LISTEN_NAME
             and winning_prediction.probabilities is not None
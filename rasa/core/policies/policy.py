@@ -126,6 +126,16 @@ class Policy:
         """Returns the policy's featurizer."""
         return self.__featurizer
 
+    def number_of_prediction_states(self) -> Optional[int]:
+        """Returns how many of the latest states the policy uses for predictions.
+
+        Returns:
+            The number of states, or `None` if the policy uses all of them.
+        """
+        if isinstance(self.featurizer, MaxHistoryTrackerFeaturizer):
+            return self.featurizer.max_history
+        return None
+
     @staticmethod
     def _get_valid_params(func: Callable, **kwargs: Any) -> Dict:
         """Filters out kwargs that cannot be passed to func.
@@ -232,6 +242,33 @@ class Policy:
         """
         raise NotImplementedError("Policy must have the capacity to predict.")
 
+    def predict_action_probabilities_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List["PolicyPrediction"]:
+        """Predicts the next action for several conversations at once.
+
+        Policies which can score several trackers together (e.g. in one forward pass
+        of their model) override this. By default every tracker is predicted on its
+        own.
+
+        Args:
+            trackers: the :class:`rasa.core.trackers.DialogueStateTracker`s
+            domain: the :class:`rasa.shared.core.domain.Domain`
+            interpreter: Interpreter which may be used by the policies to create
+                additional features.
+
+        Returns:
+             The policy's predictions in the order of `trackers`.
+        """
+        return [
+            self.predict_action_probabilities(tracker, domain, interpreter, **kwargs)
+            for tracker in trackers
+        ]
+
     def _prediction(
         self,
         probabilities: List[float],
@@ -1,8 +1,19 @@
 import logging
-from typing import List, Dict, Text, Optional, Any, Set, TYPE_CHECKING, Tuple
+from typing import (
+    List,
+    Dict,
+    Text,
+    Optional,
+    Any,
+    Set,
+    TYPE_CHECKING,
+    Tuple,
+    FrozenSet,
+)
 
 from tqdm import tqdm
 import numpy as np
+import itertools
 import json
 from collections import defaultdict
 
@@ -37,9 +48,10 @@ from rasa.shared.core.constants import (
     LOOP_NAME,
     SLOTS,
     ACTIVE_LOOP,
+    USER,
 )
 from rasa.shared.core.domain import InvalidDomain, State, Domain
-from rasa.shared.nlu.constants import ACTION_NAME, INTENT_NAME_KEY
+from rasa.shared.nlu.constants import ACTION_NAME, INTENT, INTENT_NAME_KEY
 import rasa.core.test
 import rasa.core.training.training
 
@@ -80,6 +92,109 @@ class InvalidRule(RasaException):
         )
 
 
+# a rule state as a set of (state type, feature, value) triples
+RuleState = FrozenSet[Tuple[Text, Text, Any]]
+
+
+def _freeze_rule_state(rule_state: State) -> RuleState:
+    return frozenset(
+        (
+            state_type,
+            key,
+            # json dumps and loads tuples as lists, so we need to convert them back
+            tuple(value) if isinstance(value, list) else value,
+        )
+        for state_type, sub_state in rule_state.items()
+        for key, value in sub_state.items()
+    )
+
+
+def _required_value(value: Any) -> Optional[Text]:
+    # rules which don't require a feature are stored under `None` for it
+    if isinstance(value, str) and value != SHOULD_NOT_BE_SET:
+        return value
+    return None
+
+
+def _index_features(
+    state: State,
+) -> Tuple[Optional[Text], Optional[Text], Optional[Text]]:
+    return (
+        _required_value(state.get(PREVIOUS_ACTION, {}).get(ACTION_NAME)),
+        _required_value(state.get(USER, {}).get(INTENT)),
+        _required_value(state.get(ACTIVE_LOOP, {}).get(LOOP_NAME)),
+    )
+
+
+class _RuleIndex:
+    """Index of the rules of a lookup by the features of their last state.
+
+    A rule can only apply to a conversation if the previous action, the intent and
+    the active loop which its last state requires are the ones of the last state of
+    the conversation. Hence, the candidates for a conversation are the rules which
+    either require the conversation's value or nothing for each of these features.
+
+    The rule keys are parsed once, the states of the rules are kept as frozen sets
+    in reversed order.
+    """
+
+    def __init__(self, lookup: Dict[Text, Text]) -> None:
+        self.lookup = lookup
+        self.number_of_rules = len(lookup)
+        self.reversed_rule_states: Dict[Text, Tuple[RuleState, ...]] = {}
+        self.max_rule_length = 0
+        self.active_loop_names: Dict[Text, Optional[Text]] = {}
+        self._rules: Dict[
+            Tuple[Optional[Text], Optional[Text], Optional[Text]], Set[Text]
+        ] = defaultdict(set)
+        # rules which start with the conversation only apply to conversation starts
+        self._conversation_start_rules: Set[Text] = set()
+        self._rules_without_states: Set[Text] = set()
+
+        # many rules share states, so they share their frozen states as well
+        frozen_states: Dict[RuleState, RuleState] = {}
+        for rule_key in lookup:
+            rule_states = RulePolicy._rule_key_to_state(rule_key)
+            self.reversed_rule_states[rule_key] = tuple(
+                frozen_states.setdefault(frozen_state, frozen_state)
+                for frozen_state in map(_freeze_rule_state, reversed(rule_states))
+            )
+            self.max_rule_length = max(self.max_rule_length, len(rule_states))
+            if not rule_states:
+                self._rules_without_states.add(rule_key)
+                continue
+
+            last_rule_state = rule_states[-1]
+            self.active_loop_names[rule_key] = get_active_loop_name(last_rule_state)
+            if not last_rule_state.get(PREVIOUS_ACTION):
+                self._conversation_start_rules.add(rule_key)
+            else:
+                self._rules[_index_features(last_rule_state)].add(rule_key)
+
+    def is_index_of(self, lookup: Dict[Text, Text]) -> bool:
+        """Checks whether the index is up to date with `lookup`."""
+        return self.lookup is lookup and self.number_of_rules == len(lookup)
+
+    def candidates(self, conversation_state: State) -> Set[Text]:
+        """Finds the rules whose last state might match `conversation_state`.
+
+        Args:
+            conversation_state: The last state of the conversation.
+
+        Returns:
+            The keys of the rules which have to be checked against the conversation.
+        """
+        if not conversation_state.get(PREVIOUS_ACTION):
+            return self._conversation_start_rules | self._rules_without_states
+
+        candidates = set(self._rules_without_states)
+        for features in itertools.product(
+            *({value, None} for value in _index_features(conversation_state))
+        ):
+            candidates.update(self._rules.get(features, ()))
+        return candidates
+
+
 class RulePolicy(MemoizationPolicy):
     """Policy which handles all the rules"""
 
@@ -138,6 +253,7 @@ class RulePolicy(MemoizationPolicy):
 
         self._prediction_source = None
         self._rules_sources = None
+        self._rule_indices: Dict[Text, _RuleIndex] = {}
 
         # max history is set to `None` in order to capture any lengths of rule stories
         super().__init__(
@@ -147,6 +263,7 @@ class RulePolicy(MemoizationPolicy):
             lookup=lookup,
             **kwargs,
         )
+        self._index_rules()
 
     @classmethod
     def validate_against_domain(
@@ -629,34 +746,31 @@ class RulePolicy(MemoizationPolicy):
                 rule_trackers, training_trackers, domain, interpreter
             )
 
+        self._index_rules()
         logger.debug(f"Memorized '{len(self.lookup[RULES])}' unique rules.")
 
     @staticmethod
-    def _does_rule_match_state(rule_state: State, conversation_state: State) -> bool:
-        for state_type, rule_sub_state in rule_state.items():
-            conversation_sub_state = conversation_state.get(state_type, {})
-            for key, value in rule_sub_state.items():
-                if isinstance(value, list):
-                    # json dumps and loads tuples as lists,
-                    # so we need to convert them back
-                    value = tuple(value)
-
-                if (
-                    # value should be set, therefore
-                    # check whether it is the same as in the state
-                    value
-                    and value != SHOULD_NOT_BE_SET
-                    and conversation_sub_state.get(key) != value
-                ) or (
-                    # value shouldn't be set, therefore
-                    # it should be None or non existent in the state
-                    value == SHOULD_NOT_BE_SET
-                    and conversation_sub_state.get(key)
-                    # during training `SHOULD_NOT_BE_SET` is provided. Hence, we also
-                    # have to check for the value of the slot state
-                    and conversation_sub_state.get(key) != SHOULD_NOT_BE_SET
-                ):
-                    return False
+    def _does_rule_match_state(
+        rule_state: RuleState, conversation_state: State
+    ) -> bool:
+        for state_type, key, value in rule_state:
+            conversation_value = conversation_state.get(state_type, {}).get(key)
+            if (
+                # value should be set, therefore
+                # check whether it is the same as in the state
+                value
+                and value != SHOULD_NOT_BE_SET
+                and conversation_value != value
+            ) or (
+                # value shouldn't be set, therefore
+                # it should be None or non existent in the state
+                value == SHOULD_NOT_BE_SET
+                and conversation_value
+                # during training `SHOULD_NOT_BE_SET` is provided. Hence, we also
+                # have to check for the value of the slot state
+                and conversation_value != SHOULD_NOT_BE_SET
+            ):
+                return False
 
         return True
 
@@ -665,21 +779,22 @@ class RulePolicy(MemoizationPolicy):
         return json.loads(rule_key)
 
     def _is_rule_applicable(
-        self, rule_key: Text, turn_index: int, conversation_state: State
+        self,
+        reversed_rule_states: Tuple[RuleState, ...],
+        turn_index: int,
+        conversation_state: State,
     ) -> bool:
         """Check if rule is satisfied with current state at turn.
 
         Args:
-            rule_key: the textual representation of learned rule
+            reversed_rule_states: the parsed states of the learned rule, the last
+                state first
             turn_index: index of a current dialogue turn
             conversation_state: the state that corresponds to turn_index
 
         Returns:
             a boolean that says whether the rule is applicable to current state
         """
-        # turn_index goes back in time
-        reversed_rule_states = list(reversed(self._rule_key_to_state(rule_key)))
-
         # the rule must be applicable because we got (without any applicability issues)
         # further in the conversation history than the rule's length
         if turn_index >= len(reversed_rule_states):
@@ -688,7 +803,10 @@ class RulePolicy(MemoizationPolicy):
         # a state has previous action if and only if it is not a conversation start
         # state
         current_previous_action = conversation_state.get(PREVIOUS_ACTION)
-        rule_previous_action = reversed_rule_states[turn_index].get(PREVIOUS_ACTION)
+        rule_previous_action = any(
+            state_type == PREVIOUS_ACTION
+            for state_type, _, _ in reversed_rule_states[turn_index]
+        )
 
         # current conversation state and rule state are conversation starters.
         # any slots with initial_value set will necessarily be in both states and don't
@@ -709,15 +827,51 @@ class RulePolicy(MemoizationPolicy):
             reversed_rule_states[turn_index], conversation_state
         )
 
-    def _get_possible_keys(
-        self, lookup: Dict[Text, Text], states: List[State]
-    ) -> Set[Text]:
-        possible_keys = set(lookup.keys())
+    def _rule_index(self, lookup_name: Text) -> _RuleIndex:
+        lookup = self.lookup[lookup_name]
+        index = self._rule_indices.get(lookup_name)
+        if index is None or not index.is_index_of(lookup):
+            index = self._rule_indices[lookup_name] = _RuleIndex(lookup)
+        return index
+
+    def number_of_prediction_states(self) -> Optional[int]:
+        """Returns how many of the latest states the rules are matched against.
+
+        The featurizer keeps the whole history, so that rules of any length can be
+        learned. A rule only checks as many of the latest states as it has though,
+        so earlier states can't change which rules apply.
+        """
+        return max(
+            [1]
+            + [
+                self._rule_index(lookup_name).max_rule_length
+                for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]
+                if lookup_name in self.lookup
+            ]
+        )
+
+    def _index_rules(self) -> None:
+        for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+            if lookup_name in self.lookup:
+                self._rule_index(lookup_name)
+
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        if not states:
+            return set(self.lookup[lookup_name].keys())
+
+        index = self._rule_index(lookup_name)
+        possible_keys = index.candidates(states[-1])
         for i, state in enumerate(reversed(states)):
+            # rules which are not longer than `i` turns are applicable anyway
+            if all(len(index.reversed_rule_states[key]) <= i for key in possible_keys):
+                break
             # find rule keys that correspond to current state
             possible_keys = set(
                 filter(
-                    lambda _key: self._is_rule_applicable(_key, i, state), possible_keys
+                    lambda _key: self._is_rule_applicable(
+                        index.reversed_rule_states[_key], i, state
+                    ),
+                    possible_keys,
                 )
             )
         return possible_keys
@@ -799,7 +953,10 @@ class RulePolicy(MemoizationPolicy):
             return None, None, False
 
         tracker_as_states = self.featurizer.prediction_states(
-            [tracker], domain, use_text_for_last_user_input
+            [tracker],
+            domain,
+            use_text_for_last_user_input,
+            max_history=self.number_of_prediction_states(),
         )
         states = tracker_as_states[0]
 
@@ -812,7 +969,7 @@ class RulePolicy(MemoizationPolicy):
         # to skip the validation of slots for its first execution after an unhappy path.
         returning_from_unhappy_path = False
 
-        rule_keys = self._get_possible_keys(self.lookup[RULES], states)
+        rule_keys = self._get_possible_keys(RULES, states)
         predicted_action_name = None
         best_rule_key = ""
         if rule_keys:
@@ -826,7 +983,7 @@ class RulePolicy(MemoizationPolicy):
         if active_loop_name:
             # find rules for unhappy path of the loop
             loop_unhappy_keys = self._get_possible_keys(
-                self.lookup[RULES_FOR_LOOP_UNHAPPY_PATH], states
+                RULES_FOR_LOOP_UNHAPPY_PATH, states
             )
             # there could be several unhappy path conditions
             unhappy_path_conditions = [
@@ -838,9 +995,11 @@ class RulePolicy(MemoizationPolicy):
             # was applied inside the loop.
             # Rules might not explicitly switch back to the loop.
             # Hence, we have to take care of that.
+            best_rule_loop_name = self._rule_index(RULES).active_loop_names.get(
+                best_rule_key
+            )
             predicted_listen_from_general_rule = (
-                predicted_action_name == ACTION_LISTEN_NAME
-                and not get_active_loop_name(self._rule_key_to_state(best_rule_key)[-1])
+                predicted_action_name == ACTION_LISTEN_NAME and not best_rule_loop_name
             )
             if predicted_listen_from_general_rule:
                 if DO_NOT_PREDICT_LOOP_ACTION not in unhappy_path_conditions:
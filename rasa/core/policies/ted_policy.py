@@ -51,6 +51,7 @@ from rasa.utils.tensorflow.model_data import (
 )
 from rasa.utils.tensorflow.model_data_utils import convert_to_data_format
 import rasa.utils.tensorflow.numpy
+from rasa.utils.tensorflow import model_data_storage
 from rasa.utils.tensorflow.constants import (
     LABEL,
     IDS,
@@ -128,6 +129,8 @@ STATE_LEVEL_FEATURES = [ENTITIES, SLOTS, ACTIVE_LOOP]
 PREDICTION_FEATURES = STATE_LEVEL_FEATURES + SENTENCE_FEATURES_TO_ENCODE + [DIALOGUE]
 
 SAVE_MODEL_FILE_NAME = "ted_policy"
+# maximum number of trackers which are predicted in one forward pass of the model
+PREDICTION_BATCH_SIZE = 256
 
 
 class TEDPolicy(Policy):
@@ -643,6 +646,118 @@ class TEDPolicy(Policy):
             ),
         )
 
+    def predict_action_probabilities_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        """Predicts the next action for several conversations at once.
+
+        The trackers are featurized together and scored in one forward pass of the
+        model per `PREDICTION_BATCH_SIZE` trackers.
+
+        See the docstring of the parent class `Policy` for more information.
+        """
+        if self.model is None:
+            return [
+                self._prediction(self._default_predictions(domain)) for _ in trackers
+            ]
+
+        predictions = []
+        for start in range(0, len(trackers), PREDICTION_BATCH_SIZE):
+            predictions += self._predict_batch(
+                trackers[start : start + PREDICTION_BATCH_SIZE], domain, interpreter
+            )
+        return predictions
+
+    def _predict_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+    ) -> List[PolicyPrediction]:
+        # every tracker is featurized to one or two examples of the batch,
+        # see `_featurize_tracker_for_e2e`
+        tracker_state_features = []
+        example_ranges = []
+        for tracker in trackers:
+            start = len(tracker_state_features)
+            tracker_state_features += self._featurize_tracker_for_e2e(
+                tracker, domain, interpreter
+            )
+            example_ranges.append((start, len(tracker_state_features)))
+
+        model_data = self._create_model_data(tracker_state_features)
+        output = self.model.predict(model_data)
+
+        # the model only scores the last turn of every dialogue, taking the
+        # different lengths of the dialogues in the batch into account
+        all_similarities = output["similarities"].numpy()[:, -1, :]
+        all_confidences = output["action_scores"].numpy()[:, -1, :]
+        diagnostic_data = rasa.utils.tensorflow.numpy.values_to_numpy(
+            output.get(DIAGNOSTIC_DATA)
+        )
+
+        predictions = []
+        for tracker, (start, end) in zip(trackers, example_ranges):
+            confidence, is_e2e_prediction = self._pick_confidence(
+                all_confidences[start:end], all_similarities[start:end]
+            )
+
+            if (
+                is_e2e_prediction
+                and self.config[ENTITY_RECOGNITION]
+                and tracker.latest_action_name == ACTION_LISTEN_NAME
+            ):
+                # the entities of a batch can't be assigned to its trackers
+                predictions.append(
+                    self.predict_action_probabilities(tracker, domain, interpreter)
+                )
+                continue
+
+            if (
+                self.config[RANKING_LENGTH] > 0
+                and self.config[MODEL_CONFIDENCE] == SOFTMAX
+            ):
+                confidence = rasa.utils.train_utils.normalize(
+                    confidence, self.config[RANKING_LENGTH]
+                )
+
+            predictions.append(
+                self._prediction(
+                    confidence.tolist(),
+                    is_end_to_end_prediction=is_e2e_prediction,
+                    diagnostic_data=self._diagnostic_data_for_examples(
+                        diagnostic_data,
+                        start,
+                        end,
+                        dialogue_length=len(tracker_state_features[start]),
+                    ),
+                )
+            )
+
+        return predictions
+
+    @staticmethod
+    def _diagnostic_data_for_examples(
+        diagnostic_data: Optional[Dict[Text, np.ndarray]],
+        start: int,
+        end: int,
+        dialogue_length: int,
+    ) -> Optional[Dict[Text, np.ndarray]]:
+        if not diagnostic_data:
+            return diagnostic_data
+
+        # the attention weights have the shape
+        # (layers x batch size x heads x dialogue length x dialogue length),
+        # where the dialogues are padded to the longest one in the batch
+        return {
+            name: values[:, start:end, ..., :dialogue_length, :dialogue_length]
+            for name, values in diagnostic_data.items()
+        }
+
     def _create_optional_event_for_entities(
         self,
         prediction_output: Dict[Text, tf.Tensor],
@@ -725,16 +840,15 @@ class TEDPolicy(Policy):
         io_utils.pickle_dump(
             model_path / f"{SAVE_MODEL_FILE_NAME}.meta.pkl", self.config
         )
-        io_utils.pickle_dump(
-            model_path / f"{SAVE_MODEL_FILE_NAME}.data_example.pkl", self.data_example
+        model_data_storage.persist_model_data(
+            self.data_example, model_path / f"{SAVE_MODEL_FILE_NAME}.data_example"
         )
         io_utils.pickle_dump(
             model_path / f"{SAVE_MODEL_FILE_NAME}.fake_features.pkl",
             self.fake_features,
         )
-        io_utils.pickle_dump(
-            model_path / f"{SAVE_MODEL_FILE_NAME}.label_data.pkl",
-            dict(self._label_data.data),
+        model_data_storage.persist_model_data(
+            self._label_data.data, model_path / f"{SAVE_MODEL_FILE_NAME}.label_data"
         )
 
         entity_tag_specs = (
@@ -772,14 +886,16 @@ class TEDPolicy(Policy):
 
         featurizer = TrackerFeaturizer.load(path)
 
-        if not (model_path / f"{SAVE_MODEL_FILE_NAME}.data_example.pkl").is_file():
+        if not model_data_storage.model_data_exists(
+            model_path / f"{SAVE_MODEL_FILE_NAME}.data_example"
+        ):
             return cls(featurizer=featurizer)
 
-        loaded_data = io_utils.pickle_load(
-            model_path / f"{SAVE_MODEL_FILE_NAME}.data_example.pkl"
+        loaded_data = model_data_storage.load_model_data(
+            model_path / f"{SAVE_MODEL_FILE_NAME}.data_example"
         )
-        label_data = io_utils.pickle_load(
-            model_path / f"{SAVE_MODEL_FILE_NAME}.label_data.pkl"
+        label_data = model_data_storage.load_model_data(
+            model_path / f"{SAVE_MODEL_FILE_NAME}.label_data"
         )
         fake_features = io_utils.pickle_load(
             model_path / f"{SAVE_MODEL_FILE_NAME}.fake_features.pkl"
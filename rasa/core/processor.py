@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional, Text, Tuple, Union
 import rasa.shared.utils.io
 import rasa.core.actions.action
 from rasa.core import jobs
+import rasa.core.executor
 from rasa.core.actions.action import Action
 from rasa.core.channels.channel import (
     CollectingOutputChannel,
@@ -70,6 +71,7 @@ class MessageProcessor:
         max_number_of_predictions: int = MAX_NUMBER_OF_PREDICTIONS,
         message_preprocessor: Optional[LambdaType] = None,
         on_circuit_break: Optional[LambdaType] = None,
+        model_directory: Optional[Text] = None,
     ):
         self.interpreter = interpreter
         self.nlg = generator
@@ -81,6 +83,7 @@ class MessageProcessor:
         self.message_preprocessor = message_preprocessor
         self.on_circuit_break = on_circuit_break
         self.action_endpoint = action_endpoint
+        self.model_directory = model_directory
 
     async def handle_message(
         self, message: UserMessage
@@ -92,7 +95,7 @@ class MessageProcessor:
 
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
             rasa.shared.utils.io.raise_warning(
                 "No policy ensemble or domain set. Skipping action prediction "
                 "and execution.",
@@ -103,7 +106,7 @@ class MessageProcessor:
         await self._predict_and_execute_next_action(message.output_channel, tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         if isinstance(message.output_channel, CollectingOutputChannel):
             return message.output_channel.messages
@@ -125,7 +128,7 @@ class MessageProcessor:
         result = self.predict_next_with_tracker(tracker)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return result
 
@@ -143,6 +146,62 @@ class MessageProcessor:
         Returns:
             The prediction for the next action. `None` if no domain or policies loaded.
         """
+        if not self._can_predict():
+            return None
+
+        prediction = self._get_next_action_probabilities(tracker)
+
+        return self._prediction_result(tracker, prediction, verbosity)
+
+    async def predict_next_with_trackers(
+        self,
+        trackers: List[DialogueStateTracker],
+        verbosity: EventVerbosity = EventVerbosity.AFTER_RESTART,
+    ) -> Optional[List[Dict[Text, Any]]]:
+        """Predict the next action for several conversation states at once.
+
+        The trackers are passed to the policies together, so that policies which
+        support it (e.g. `TEDPolicy`) score them in batches. The policies run in
+        the configured inference executor, so that the event loop is not blocked.
+
+        Args:
+            trackers: Trackers representing the conversation states.
+            verbosity: Verbosity for the returned conversation states.
+
+        Returns:
+            The predictions for the next action in the order of `trackers`. `None` if
+            no domain or policies loaded.
+        """
+        if not self._can_predict():
+            return None
+
+        predictions = [self._followup_action_prediction(t) for t in trackers]
+        trackers_to_predict = [
+            tracker
+            for tracker, prediction in zip(trackers, predictions)
+            if prediction is None
+        ]
+        executor = rasa.core.executor.inference_executor()
+        policy_predictions = iter(
+            await executor.probabilities_using_best_policy_batch(
+                self.policy_ensemble,
+                trackers_to_predict,
+                self.domain,
+                self.interpreter,
+                self.model_directory,
+            )
+        )
+        predictions = [
+            prediction or self._ensure_policy_prediction(next(policy_predictions))
+            for prediction in predictions
+        ]
+
+        return [
+            self._prediction_result(tracker, prediction, verbosity)
+            for tracker, prediction in zip(trackers, predictions)
+        ]
+
+    def _can_predict(self) -> bool:
         if not self.policy_ensemble or not self.domain:
             # save tracker state to continue conversation from this state
             rasa.shared.utils.io.raise_warning(
@@ -150,10 +209,15 @@ class MessageProcessor:
                 "You should set a policy before training a model.",
                 docs=DOCS_URL_POLICIES,
             )
-            return None
-
-        prediction = self._get_next_action_probabilities(tracker)
+            return False
+        return True
 
+    def _prediction_result(
+        self,
+        tracker: DialogueStateTracker,
+        prediction: PolicyPrediction,
+        verbosity: EventVerbosity,
+    ) -> Dict[Text, Any]:
         scores = [
             {"action": a, "score": p}
             for a, p in zip(self.domain.action_names_or_texts, prediction.probabilities)
@@ -231,7 +295,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
 
         await self._update_tracker_session(tracker, output_channel, metadata)
 
@@ -254,7 +318,7 @@ class MessageProcessor:
         Returns:
               Tracker for `sender_id`.
         """
-        tracker = self.get_tracker(sender_id)
+        tracker = await self.get_tracker_async(sender_id)
 
         # run session start only if the tracker is empty
         if not tracker.events:
@@ -283,6 +347,26 @@ class MessageProcessor:
             conversation_id, append_action_listen=False
         )
 
+    async def get_tracker_async(self, conversation_id: Text) -> DialogueStateTracker:
+        """Get the tracker for a conversation without blocking the event loop.
+
+        Non-blocking variant of `get_tracker` which awaits the tracker store's
+        `get_or_create_tracker_async`.
+
+        Args:
+            conversation_id: The ID of the conversation for which the history should be
+                retrieved.
+
+        Returns:
+            Tracker for the conversation. Creates an empty tracker in case it's a new
+            conversation.
+        """
+        conversation_id = conversation_id or DEFAULT_SENDER_ID
+
+        return await self.tracker_store.get_or_create_tracker_async(
+            conversation_id, append_action_listen=False
+        )
+
     def get_trackers_for_all_conversation_sessions(
         self, conversation_id: Text
     ) -> List[DialogueStateTracker]:
@@ -323,7 +407,7 @@ class MessageProcessor:
 
         if should_save_tracker:
             # save tracker state to continue conversation from this state
-            self._save_tracker(tracker)
+            await self._save_tracker(tracker)
         # bf >
         if message.output_channel.name() == 'bot_regression_test_output':
             # BOTFRONT TEST CHANNEL: send user messages to the output channel
@@ -365,7 +449,7 @@ class MessageProcessor:
         await self._run_action(action, tracker, output_channel, nlg, prediction)
 
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
         return tracker
 
@@ -379,6 +463,23 @@ class MessageProcessor:
         """
         prediction = self._get_next_action_probabilities(tracker)
 
+        return self._action_for_prediction(prediction)
+
+    async def predict_next_action_async(
+        self, tracker: DialogueStateTracker
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
+        """Predicts the next action the bot should take after seeing x.
+
+        Unlike `predict_next_action` the policies run in the configured inference
+        executor, so that the event loop is not blocked.
+        """
+        prediction = await self._get_next_action_probabilities_async(tracker)
+
+        return self._action_for_prediction(prediction)
+
+    def _action_for_prediction(
+        self, prediction: PolicyPrediction
+    ) -> Tuple[rasa.core.actions.action.Action, PolicyPrediction]:
         action = rasa.core.actions.action.action_for_index(
             prediction.max_confidence_index, self.domain, self.action_endpoint
         )
@@ -492,7 +593,7 @@ class MessageProcessor:
         )
         await self._predict_and_execute_next_action(output_channel, tracker)
         # save tracker state to continue conversation from this state
-        self._save_tracker(tracker)
+        await self._save_tracker(tracker)
 
     @staticmethod
     def _log_slots(tracker) -> None:
@@ -653,7 +754,7 @@ class MessageProcessor:
             and num_predicted_actions < self.max_number_of_predictions
         ):
             # this actually just calls the policy's method by the same name
-            action, prediction = self.predict_next_action(tracker)
+            action, prediction = await self.predict_next_action_async(tracker)
 
             should_predict_another_action = await self._run_action(
                 action, tracker, output_channel, self.nlg, prediction
@@ -891,13 +992,45 @@ class MessageProcessor:
 
         return has_expired
 
-    def _save_tracker(self, tracker: DialogueStateTracker) -> None:
-        self.tracker_store.save(tracker)
+    async def _save_tracker(self, tracker: DialogueStateTracker) -> None:
+        await self.tracker_store.save_async(tracker)
 
     def _get_next_action_probabilities(
         self, tracker: DialogueStateTracker
     ) -> PolicyPrediction:
         """Collect predictions from ensemble and return action and predictions."""
+        followup_prediction = self._followup_action_prediction(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        prediction = self.policy_ensemble.probabilities_using_best_policy(
+            tracker, self.domain, self.interpreter
+        )
+
+        return self._ensure_policy_prediction(prediction)
+
+    async def _get_next_action_probabilities_async(
+        self, tracker: DialogueStateTracker
+    ) -> PolicyPrediction:
+        """Collect predictions from ensemble in the inference executor."""
+        followup_prediction = self._followup_action_prediction(tracker)
+        if followup_prediction:
+            return followup_prediction
+
+        executor = rasa.core.executor.inference_executor()
+        prediction = await executor.probabilities_using_best_policy(
+            self.policy_ensemble,
+            tracker,
+            self.domain,
+            self.interpreter,
+            self.model_directory,
+        )
+
+        return self._ensure_policy_prediction(prediction)
+
+    def _followup_action_prediction(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[PolicyPrediction]:
         followup_action = tracker.followup_action
         if followup_action:
             tracker.clear_followup_action()
@@ -912,10 +1045,12 @@ class MessageProcessor:
                 "and predict the next action."
             )
 
-        prediction = self.policy_ensemble.probabilities_using_best_policy(
-            tracker, self.domain, self.interpreter
-        )
+        return None
 
+    @staticmethod
+    def _ensure_policy_prediction(
+        prediction: Union[PolicyPrediction, Tuple[List[float], Optional[Text]]]
+    ) -> PolicyPrediction:
         if isinstance(prediction, PolicyPrediction):
             return prediction
 
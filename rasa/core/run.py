@@ -19,9 +19,11 @@ from rasa.core.agent import Agent
 from rasa.core.brokers.broker import EventBroker
 from rasa.core.channels import console
 from rasa.core.channels.channel import InputChannel
+import rasa.core.executor
 import rasa.core.interpreter
 from rasa.core.lock_store import LockStore
 from rasa.core.tracker_store import TrackerStore
+from rasa_addons.core.parse_cache import ParseCache
 from rasa.core.utils import AvailableEndpoints
 import rasa.shared.utils.io
 from sanic import Sanic
@@ -254,6 +256,7 @@ async def load_agent_on_start(
     _broker = await EventBroker.create(endpoints.event_broker, loop=loop)
     _tracker_store = TrackerStore.create(endpoints.tracker_store, event_broker=_broker)
     _lock_store = LockStore.create(endpoints.lock_store)
+    _parse_cache = ParseCache.create(endpoints.parse_cache)
 
     model_server = endpoints.model if endpoints and endpoints.model else None
 
@@ -267,6 +270,7 @@ async def load_agent_on_start(
             tracker_store=_tracker_store,
             lock_store=_lock_store,
             action_endpoint=endpoints.action,
+            parse_cache=_parse_cache,
         )
     except Exception as e:
         rasa.shared.utils.io.raise_warning(
@@ -287,6 +291,7 @@ async def load_agent_on_start(
             action_endpoint=endpoints.action,
             model_server=model_server,
             remote_storage=remote_storage,
+            parse_cache=_parse_cache,
         )
 
     logger.info("Rasa server is up and running.")
@@ -300,11 +305,25 @@ async def close_resources(app: Sanic, _: AbstractEventLoop) -> None:
         app: The Sanic application.
         _: The current Sanic worker event loop.
     """
+    rasa.core.executor.shutdown_inference_executor()
+
     current_agent = getattr(app, "agent", None)
     if not current_agent:
         logger.debug("No agent found when shutting down server.")
         return
 
+    parse_cache_close = getattr(current_agent.parse_cache, "close", None)
+    if asyncio.iscoroutinefunction(parse_cache_close):
+        await parse_cache_close()
+
+    tracker_store_close = getattr(current_agent.tracker_store, "close", None)
+    if asyncio.iscoroutinefunction(tracker_store_close):
+        await tracker_store_close()
+
+    lock_store_close = getattr(current_agent.lock_store, "close", None)
+    if asyncio.iscoroutinefunction(lock_store_close):
+        await lock_store_close()
+
     event_broker = current_agent.tracker_store.event_broker
     if event_broker:
         if not asyncio.iscoroutinefunction(event_broker.close):
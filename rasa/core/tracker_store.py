@@ -12,10 +12,10 @@ from typing import (
     Callable,
     Dict,
     Iterable,
-    Iterator,
     List,
     Optional,
     Text,
+    Tuple,
     Union,
     TYPE_CHECKING,
 )
@@ -23,6 +23,7 @@ from typing import (
 from boto3.dynamodb.conditions import Key
 
 import rasa.core.utils as core_utils
+import rasa.shared.core.events
 import rasa.shared.utils.cli
 import rasa.shared.utils.common
 import rasa.shared.utils.io
@@ -35,7 +36,7 @@ from rasa.core.constants import (
 )
 from rasa.shared.core.conversation import Dialogue
 from rasa.shared.core.domain import Domain
-from rasa.shared.core.events import SessionStarted
+from rasa.shared.core.events import Event, SessionStarted
 from rasa.shared.core.trackers import (
     ActionExecuted,
     DialogueStateTracker,
@@ -53,6 +54,7 @@ if TYPE_CHECKING:
     from sqlalchemy.orm.session import Session
     from sqlalchemy import Sequence
     from sqlalchemy.orm.query import Query
+    from redis.client import Pipeline
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,12 @@ POSTGRESQL_DEFAULT_POOL_SIZE = 50
 # default value for key prefix in RedisTrackerStore
 DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX = "tracker:"
 
+# prefix for the keys which hold the number of stored events in RedisTrackerStore
+REDIS_EVENT_COUNT_KEY_PREFIX = "event_count:"
+
+# prefix for the keys which hold the event lists of append-only RedisTrackerStores
+REDIS_EVENTS_KEY_PREFIX = "events:"
+
 
 class TrackerStore:
     """Represents common behavior and interface for all `TrackerStore`s."""
@@ -71,6 +79,7 @@ class TrackerStore:
         self,
         domain: Optional[Domain],
         event_broker: Optional[EventBroker] = None,
+        snapshot_interval: Optional[int] = None,
         **kwargs: Dict[Text, Any],
     ) -> None:
         """Create a TrackerStore.
@@ -79,11 +88,16 @@ class TrackerStore:
             domain: The `Domain` to initialize the `DialogueStateTracker`.
             event_broker: An event broker to publish any new events to another
                 destination.
+            snapshot_interval: If set, tracker stores which support it persist a
+                snapshot of the tracker state whenever this many events were
+                added to the conversation session. Retrieving the tracker then
+                restores the snapshot and only replays the subsequent events.
             kwargs: Additional kwargs.
         """
         self.domain = domain
         self.event_broker = event_broker
         self.max_event_history = None
+        self.snapshot_interval = snapshot_interval
 
         # TODO: Remove this in Rasa Open Source 3.0
         self.retrieve_events_from_previous_conversation_sessions: Optional[bool] = None
@@ -152,6 +166,33 @@ class TrackerStore:
 
         return tracker
 
+    async def get_or_create_tracker_async(
+        self,
+        sender_id: Text,
+        max_event_history: Optional[int] = None,
+        append_action_listen: bool = True,
+    ) -> "DialogueStateTracker":
+        """Non-blocking variant of `get_or_create_tracker`.
+
+        Uses `retrieve_async` and `save_async`, so tracker stores which implement
+        those don't block the event loop while fetching or creating the tracker.
+
+        Args:
+            sender_id: Conversation ID associated with the requested tracker.
+            max_event_history: Value to update the tracker store's max event history to.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+        """
+        self.max_event_history = max_event_history
+
+        tracker = await self.retrieve_async(sender_id)
+
+        if tracker is None:
+            tracker = await self.create_tracker_async(
+                sender_id, append_action_listen=append_action_listen
+            )
+
+        return tracker
+
     def init_tracker(self, sender_id: Text) -> "DialogueStateTracker":
         """Returns a Dialogue State Tracker"""
         return DialogueStateTracker(
@@ -174,13 +215,38 @@ class TrackerStore:
         Returns:
             The newly created tracker for `sender_id`.
         """
+        tracker = self._new_tracker(sender_id, append_action_listen)
+
+        self.save(tracker)
+
+        return tracker
+
+    async def create_tracker_async(
+        self, sender_id: Text, append_action_listen: bool = True
+    ) -> DialogueStateTracker:
+        """Non-blocking variant of `create_tracker` which uses `save_async`.
+
+        Args:
+            sender_id: Conversation ID associated with the tracker.
+            append_action_listen: Whether or not to append an initial `action_listen`.
+
+        Returns:
+            The newly created tracker for `sender_id`.
+        """
+        tracker = self._new_tracker(sender_id, append_action_listen)
+
+        await self.save_async(tracker)
+
+        return tracker
+
+    def _new_tracker(
+        self, sender_id: Text, append_action_listen: bool
+    ) -> DialogueStateTracker:
         tracker = self.init_tracker(sender_id)
 
         if append_action_listen:
             tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
 
-        self.save(tracker)
-
         return tracker
 
     def save(self, tracker):
@@ -200,6 +266,35 @@ class TrackerStore:
         """
         raise NotImplementedError()
 
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        """Non-blocking variant of `save`.
+
+        The default implementation calls `self.save()`. Tracker stores which talk to
+        remote services can override this to avoid blocking the event loop.
+
+        Args:
+            tracker: The tracker to save.
+        """
+        self.save(tracker)
+
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        """Non-blocking variant of `retrieve`.
+
+        The default implementation calls `self.retrieve()`. Tracker stores which talk
+        to remote services can override this to avoid blocking the event loop.
+
+        Args:
+            sender_id: Conversation ID to fetch the tracker for.
+
+        Returns:
+            Tracker containing events from the latest conversation sessions.
+        """
+        return self.retrieve(sender_id)
+
+    async def close(self) -> None:
+        """Releases resources (e.g. connection pools) held by the tracker store."""
+        pass
+
     def retrieve_full_tracker(
         self, conversation_id: Text
     ) -> Optional[DialogueStateTracker]:
@@ -217,7 +312,12 @@ class TrackerStore:
         return self.retrieve(conversation_id)
 
     def stream_events(self, tracker: DialogueStateTracker) -> None:
-        """Streams events to a message broker"""
+        """Streams events to a message broker.
+
+        Like `save`, this expects `tracker` to contain the events which `retrieve`
+        returns followed by the new events. The first `number_of_existing_events`
+        events are skipped.
+        """
         offset = self.number_of_existing_events(tracker.sender_id)
         events = tracker.events
         for event in list(itertools.islice(events, offset, len(events))):
@@ -226,7 +326,19 @@ class TrackerStore:
             self.event_broker.publish(body)
 
     def number_of_existing_events(self, sender_id: Text) -> int:
-        """Return number of stored events for a given sender id."""
+        """Return number of stored events for a given sender id.
+
+        The default implementation retrieves (and replays) the whole tracker.
+        Tracker stores which can count their stored events more cheaply should
+        override this, as it is called on every `save` if an event broker is
+        configured.
+
+        Args:
+            sender_id: Conversation ID to count the stored events for.
+
+        Returns:
+            Number of events which `retrieve` would return for `sender_id`.
+        """
         old_tracker = self.retrieve(sender_id)
 
         return len(old_tracker.events) if old_tracker else 0
@@ -275,6 +387,141 @@ class TrackerStore:
 
         return tracker
 
+    @staticmethod
+    def serialise_events(events: Iterable[Event]) -> List[Text]:
+        """Serializes events one by one so they can be appended to stored events."""
+        return [json.dumps(event.as_dict()) for event in events]
+
+    def deserialise_events_to_tracker(
+        self,
+        sender_id: Text,
+        serialised_events: Iterable[Union[Text, bytes]],
+        snapshot: Optional[Dict[Text, Any]] = None,
+    ) -> DialogueStateTracker:
+        """Recreates a tracker from events serialized with `serialise_events`."""
+        return self._tracker_from_events_and_snapshot(
+            sender_id, [json.loads(event) for event in serialised_events], snapshot
+        )
+
+    def _should_snapshot(
+        self, number_of_stored_events: int, number_of_events: int
+    ) -> bool:
+        """Whether saving the new events crosses a multiple of `snapshot_interval`."""
+        if not self.snapshot_interval:
+            return False
+
+        return (
+            number_of_stored_events // self.snapshot_interval
+            != number_of_events // self.snapshot_interval
+        )
+
+    def _tracker_state_snapshot(
+        self, tracker: DialogueStateTracker
+    ) -> Optional[Dict[Text, Any]]:
+        """Creates a snapshot of the tracker state to be persisted with its events.
+
+        The snapshot covers the events since the latest `SessionStarted` event.
+        The first and the last covered events are remembered, so that snapshots
+        which don't match the retrieved events are ignored.
+        """
+        events = list(tracker.events)
+        session_events = events[self._index_of_latest_session_start(events) or 0 :]
+        if not session_events:
+            return None
+
+        snapshot = tracker.state_snapshot()
+        snapshot.update(
+            {
+                "number_of_events": len(session_events),
+                "first_event": [
+                    session_events[0].type_name,
+                    session_events[0].timestamp,
+                ],
+                "last_event": [
+                    session_events[-1].type_name,
+                    session_events[-1].timestamp,
+                ],
+            }
+        )
+
+        return snapshot
+
+    @staticmethod
+    def _snapshot_matches_events(
+        snapshot: Optional[Dict[Text, Any]], events: List[Dict[Text, Any]]
+    ) -> bool:
+        if not snapshot or not 0 < snapshot["number_of_events"] <= len(events):
+            return False
+
+        first_event = events[0]
+        last_event = events[snapshot["number_of_events"] - 1]
+
+        return snapshot["first_event"] == [
+            first_event.get("event"),
+            first_event.get("timestamp"),
+        ] and snapshot["last_event"] == [
+            last_event.get("event"),
+            last_event.get("timestamp"),
+        ]
+
+    def _tracker_from_events_and_snapshot(
+        self,
+        sender_id: Text,
+        serialised_events: List[Dict[Text, Any]],
+        snapshot: Optional[Dict[Text, Any]],
+    ) -> DialogueStateTracker:
+        """Recreates a tracker from its events and an optional state snapshot.
+
+        If the snapshot matches the events, its state is restored and only the
+        events after it are applied to the tracker. Otherwise all events are
+        applied. Both ways result in the same tracker state.
+
+        Args:
+            sender_id: Conversation ID of the tracker.
+            serialised_events: Serialised events of the tracker.
+            snapshot: Snapshot created with `_tracker_state_snapshot`.
+
+        Returns:
+            The recreated tracker.
+        """
+        tracker = self.init_tracker(sender_id)
+
+        number_of_restored_events = 0
+        if self._snapshot_matches_events(snapshot, serialised_events):
+            number_of_restored_events = snapshot["number_of_events"]
+            restored_events = rasa.shared.core.events.deserialise_events(
+                serialised_events[:number_of_restored_events]
+            )
+
+            if len(restored_events) == number_of_restored_events:
+                tracker.restore_state_snapshot(snapshot, restored_events)
+            else:
+                # events were dropped during deserialisation, which means the
+                # positions in the snapshot can't be relied on
+                number_of_restored_events = 0
+
+        for event in rasa.shared.core.events.deserialise_events(
+            serialised_events[number_of_restored_events:]
+        ):
+            tracker.update(event)
+
+        return tracker
+
+    @staticmethod
+    def _index_of_latest_session_start(
+        events: Iterable[Event], offset: int = 0
+    ) -> Optional[int]:
+        """Returns the index of the latest `SessionStarted` event shifted by `offset`.
+
+        Returns `None` if `events` don't contain a `SessionStarted` event.
+        """
+        index = None
+        for i, event in enumerate(events):
+            if isinstance(event, SessionStarted):
+                index = offset + i
+
+        return index
+
 
 class InMemoryTrackerStore(TrackerStore):
     """Stores conversation history in memory"""
@@ -283,19 +530,86 @@ class InMemoryTrackerStore(TrackerStore):
         self,
         domain: Domain,
         event_broker: Optional[EventBroker] = None,
+        append_only: bool = False,
         **kwargs: Dict[Text, Any],
     ) -> None:
+        """Create an `InMemoryTrackerStore`.
+
+        Args:
+            domain: The `Domain` to initialize the `DialogueStateTracker`.
+            event_broker: An event broker to publish any new events to another
+                destination.
+            append_only: If `True`, only new events are serialised and appended to
+                the stored events on `save`, and `retrieve` only deserialises the
+                events of the latest conversation session. Otherwise the whole
+                dialogue is serialised on every `save`.
+            kwargs: Additional kwargs.
+        """
         self.store = {}
+        self.append_only = append_only
+        # number of events stored per conversation ID, used as watermark when
+        # streaming new events to the event broker
+        self.event_counts: Dict[Text, int] = {}
+        # index of the latest `SessionStarted` event per conversation ID, only
+        # used in append-only mode
+        self.session_start_indices: Dict[Text, int] = {}
         super().__init__(domain, event_broker, **kwargs)
 
     def save(self, tracker: DialogueStateTracker) -> None:
         """Updates and saves the current conversation state"""
         if self.event_broker:
             self.stream_events(tracker)
+
+        if self.append_only:
+            self._append_events(tracker)
+            return
+
         serialised = InMemoryTrackerStore.serialise_tracker(tracker)
         self.store[tracker.sender_id] = serialised
+        self.event_counts[tracker.sender_id] = len(tracker.events)
+
+    def _append_events(self, tracker: DialogueStateTracker) -> None:
+        sender_id = tracker.sender_id
+        stored_events = self.store.setdefault(sender_id, [])
+
+        new_events = list(
+            itertools.islice(
+                tracker.events,
+                self.number_of_existing_events(sender_id),
+                len(tracker.events),
+            )
+        )
+        session_start_index = self._index_of_latest_session_start(
+            new_events, offset=len(stored_events)
+        )
+        if session_start_index is not None:
+            self.session_start_indices[sender_id] = session_start_index
+
+        stored_events.extend(self.serialise_events(new_events))
+        self.event_counts[sender_id] = len(stored_events)
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        number_of_events = self.event_counts.get(sender_id, 0)
+
+        if (
+            self.append_only
+            and not self.retrieve_events_from_previous_conversation_sessions
+        ):
+            # `retrieve` only returns the events of the latest session
+            number_of_events -= self.session_start_indices.get(sender_id, 0)
+
+        return number_of_events
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        if self.append_only:
+            return self._retrieve_appended_events(
+                sender_id,
+                fetch_events_from_all_sessions=bool(
+                    self.retrieve_events_from_previous_conversation_sessions
+                ),
+            )
+
         if sender_id in self.store:
             logger.debug(f"Recreating tracker for id '{sender_id}'")
             return self.deserialise_tracker(sender_id, self.store[sender_id])
@@ -304,6 +618,32 @@ class InMemoryTrackerStore(TrackerStore):
 
         return None
 
+    def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        if self.append_only:
+            return self._retrieve_appended_events(
+                conversation_id, fetch_events_from_all_sessions=True
+            )
+
+        return super().retrieve_full_tracker(conversation_id)
+
+    def _retrieve_appended_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        stored_events = self.store.get(sender_id)
+        if not stored_events:
+            logger.debug(f"Could not find tracker for conversation ID '{sender_id}'.")
+            return None
+
+        if not fetch_events_from_all_sessions:
+            stored_events = stored_events[
+                self.session_start_indices.get(sender_id, 0) :
+            ]
+
+        logger.debug(f"Recreating tracker for id '{sender_id}'")
+        return self.deserialise_events_to_tracker(sender_id, stored_events)
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Tracker Store in memory"""
         return self.store.keys()
@@ -323,6 +663,7 @@ class RedisTrackerStore(TrackerStore):
         record_exp: Optional[float] = None,
         key_prefix: Optional[Text] = None,
         use_ssl: bool = False,
+        append_only: bool = False,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import redis
@@ -331,6 +672,9 @@ class RedisTrackerStore(TrackerStore):
             host=host, port=port, db=db, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        # in append-only mode events are stored as a Redis list, and the tracker key
+        # only holds a small snapshot with the index of the latest session start
+        self.append_only = append_only
 
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         if key_prefix:
@@ -358,10 +702,138 @@ class RedisTrackerStore(TrackerStore):
         if not timeout and self.record_exp:
             timeout = self.record_exp
 
+        if self.append_only:
+            self._append_events(tracker, timeout)
+            return
+
         serialised_tracker = self.serialise_tracker(tracker)
-        self.red.set(
+        pipeline = self.red.pipeline()
+        pipeline.set(
             self.key_prefix + tracker.sender_id, serialised_tracker, ex=timeout
         )
+        pipeline.set(
+            self._event_count_key(tracker.sender_id), len(tracker.events), ex=timeout
+        )
+        pipeline.execute()
+
+    def _append_events(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        sender_id = tracker.sender_id
+        events_key = self._events_key(sender_id)
+        tracker_key = self.key_prefix + sender_id
+
+        def append(pipeline: "Pipeline") -> None:
+            # the reads are executed right away while the keys are watched
+            snapshot = self._parse_snapshot(pipeline.get(tracker_key))
+            number_of_stored_events = pipeline.llen(events_key)
+            pipeline.multi()
+            self._queue_appended_events(
+                pipeline, tracker, snapshot, number_of_stored_events, timeout
+            )
+
+        # if another save appends events after they were counted, the transaction
+        # fails and is retried with the new count instead of appending the same
+        # events twice
+        self.red.transaction(append, events_key, tracker_key)
+
+    def _queue_appended_events(
+        self,
+        pipeline: "Pipeline",
+        tracker: DialogueStateTracker,
+        snapshot: Optional[Dict[Text, Any]],
+        number_of_stored_events: int,
+        timeout: Optional[float],
+    ) -> None:
+        """Adds the commands which append the new events of `tracker` and update
+        its snapshot to `pipeline`."""
+        sender_id = tracker.sender_id
+        snapshot = snapshot or {}
+        session_start_index = snapshot.get("session_start_index", 0)
+
+        offset = number_of_stored_events
+        if not self.retrieve_events_from_previous_conversation_sessions:
+            offset -= session_start_index
+
+        new_events = list(
+            itertools.islice(tracker.events, max(offset, 0), len(tracker.events))
+        )
+        latest_session_start = self._index_of_latest_session_start(
+            new_events, offset=number_of_stored_events
+        )
+        tracker_state = snapshot.get("tracker_state")
+        if latest_session_start is not None:
+            session_start_index = latest_session_start
+            tracker_state = None
+
+        if self._should_snapshot(max(offset, 0), len(tracker.events)):
+            tracker_state = self._tracker_state_snapshot(tracker)
+
+        snapshot = {
+            "name": sender_id,
+            "session_start_index": session_start_index,
+            "number_of_events": number_of_stored_events + len(new_events),
+            "tracker_state": tracker_state,
+        }
+
+        events_key = self._events_key(sender_id)
+        if new_events:
+            pipeline.rpush(events_key, *self.serialise_events(new_events))
+        if timeout:
+            pipeline.expire(events_key, int(timeout))
+        pipeline.set(self.key_prefix + sender_id, json.dumps(snapshot), ex=timeout)
+
+    def _events_key(self, sender_id: Text) -> Text:
+        # like the count keys, the event list keys must not show up in `keys()`
+        return REDIS_EVENTS_KEY_PREFIX + self.key_prefix + sender_id
+
+    def _retrieve_snapshot(self, sender_id: Text) -> Optional[Dict[Text, Any]]:
+        """Retrieves the snapshot which is stored next to the appended events.
+
+        Returns `None` if there is no snapshot, or if the tracker was stored before
+        append-only mode was enabled.
+        """
+        return self._parse_snapshot(self.red.get(self.key_prefix + sender_id))
+
+    @staticmethod
+    def _parse_snapshot(stored: Optional[bytes]) -> Optional[Dict[Text, Any]]:
+        if stored is None:
+            return None
+
+        try:
+            snapshot = json.loads(stored)
+        except UnicodeDecodeError:
+            # pickled tracker
+            return None
+
+        if "session_start_index" not in snapshot:
+            return None
+
+        return snapshot
+
+    def _event_count_key(self, sender_id: Text) -> Text:
+        # the count keys must not match `self.key_prefix + "*"`, otherwise they
+        # would show up in `keys()`
+        return REDIS_EVENT_COUNT_KEY_PREFIX + self.key_prefix + sender_id
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id.
+
+        Trackers which were stored before the event counts were introduced are
+        retrieved once to count their events.
+        """
+        if self.append_only:
+            snapshot = self._retrieve_snapshot(sender_id)
+            if snapshot is not None:
+                if self.retrieve_events_from_previous_conversation_sessions:
+                    return snapshot["number_of_events"]
+                return snapshot["number_of_events"] - snapshot["session_start_index"]
+
+        stored_count = self.red.get(self._event_count_key(sender_id))
+        if stored_count is not None:
+            return int(stored_count)
+
+        return super().number_of_existing_events(sender_id)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         """Retrieves tracker for the latest conversation session.
@@ -374,12 +846,56 @@ class RedisTrackerStore(TrackerStore):
         Returns:
             Tracker containing events from the latest conversation sessions.
         """
+        if self.append_only:
+            return self._retrieve_appended_events(
+                sender_id,
+                fetch_events_from_all_sessions=bool(
+                    self.retrieve_events_from_previous_conversation_sessions
+                ),
+            )
+
         stored = self.red.get(self.key_prefix + sender_id)
         if stored is not None:
             return self.deserialise_tracker(sender_id, stored)
         else:
             return None
 
+    def retrieve_full_tracker(
+        self, conversation_id: Text
+    ) -> Optional[DialogueStateTracker]:
+        if self.append_only:
+            return self._retrieve_appended_events(
+                conversation_id, fetch_events_from_all_sessions=True
+            )
+
+        return super().retrieve_full_tracker(conversation_id)
+
+    def _retrieve_appended_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Optional[DialogueStateTracker]:
+        snapshot = self._retrieve_snapshot(sender_id)
+        if snapshot is None:
+            # the tracker might have been stored before append-only mode was
+            # enabled, it's migrated to the event list with the next `save`
+            stored = self.red.get(self.key_prefix + sender_id)
+            if stored is not None:
+                return self.deserialise_tracker(sender_id, stored)
+            return None
+
+        if fetch_events_from_all_sessions:
+            start = 0
+            # the tracker state only covers the latest session
+            tracker_state = None
+        else:
+            start = snapshot["session_start_index"]
+            tracker_state = snapshot.get("tracker_state")
+
+        serialised_events = self.red.lrange(self._events_key(sender_id), start, -1)
+
+        return self.deserialise_events_to_tracker(
+            sender_id, serialised_events, tracker_state
+        )
+
     def keys(self) -> Iterable[Text]:
         """Returns keys of the Redis Tracker Store."""
         return self.red.keys(self.key_prefix + "*")
@@ -399,6 +915,7 @@ class RedisClusterTrackerStore(RedisTrackerStore):
         record_exp: Optional[float] = None,
         key_prefix: Optional[Text] = None,
         use_ssl: bool = False,
+        append_only: bool = False,
         **kwargs: Dict[Text, Any],
     ) -> None:
         import redis
@@ -407,6 +924,9 @@ class RedisClusterTrackerStore(RedisTrackerStore):
             host=host, port=port, password=password, ssl=use_ssl
         )
         self.record_exp = record_exp
+        # in append-only mode events are stored as a Redis list, and the tracker key
+        # only holds a small snapshot with the index of the latest session start
+        self.append_only = append_only
 
         self.key_prefix = DEFAULT_REDIS_TRACKER_STORE_KEY_PREFIX
         if key_prefix:
@@ -415,6 +935,22 @@ class RedisClusterTrackerStore(RedisTrackerStore):
 
         super(RedisTrackerStore, self).__init__(domain, event_broker, **kwargs)
 
+    def _append_events(
+        self, tracker: DialogueStateTracker, timeout: Optional[float]
+    ) -> None:
+        # WATCH isn't supported in cluster mode, and the keys of a tracker are in
+        # different hash slots, so concurrent saves of a conversation aren't atomic
+        sender_id = tracker.sender_id
+        pipeline = self.red.pipeline()
+        self._queue_appended_events(
+            pipeline,
+            tracker,
+            self._retrieve_snapshot(sender_id),
+            self.red.llen(self._events_key(sender_id)),
+            timeout,
+        )
+        pipeline.execute()
+
 
 class DynamoTrackerStore(TrackerStore):
     """Stores conversation history in DynamoDB"""
@@ -522,7 +1058,7 @@ class DynamoTrackerStore(TrackerStore):
         """Serializes the tracker, returns object with decimal types."""
         d = tracker.as_dialogue().as_dict()
         d.update(
-            {"sender_id": tracker.sender_id,}
+            {"sender_id": tracker.sender_id, "number_of_events": len(tracker.events)}
         )
         # DynamoDB cannot store `float`s, so we'll convert them to `Decimal`s
         return core_utils.replace_floats_with_decimals(d)
@@ -548,6 +1084,28 @@ class DynamoTrackerStore(TrackerStore):
             sender_id, events_with_floats, self.domain.slots
         )
 
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id.
+
+        Only the `number_of_events` attribute is fetched. Items which were stored
+        without it are retrieved once to count their events.
+        """
+        dialogues = self.db.query(
+            KeyConditionExpression=Key("sender_id").eq(sender_id),
+            ProjectionExpression="number_of_events",
+            Limit=1,
+            ScanIndexForward=False,
+        )["Items"]
+
+        if not dialogues:
+            return 0
+
+        number_of_events = dialogues[0].get("number_of_events")
+        if number_of_events is None:
+            return super().number_of_existing_events(sender_id)
+
+        return int(number_of_events)
+
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the `DynamoTrackerStore`."""
         return [
@@ -616,12 +1174,21 @@ class MongoTrackerStore(TrackerStore):
         if self.event_broker:
             self.stream_events(tracker)
 
-        additional_events = self._additional_events(tracker)
+        number_of_stored_events = self._number_of_stored_events(
+            tracker.sender_id, fetch_events_from_all_sessions=False
+        )
+        additional_events = itertools.islice(
+            tracker.events, number_of_stored_events, len(tracker.events)
+        )
+
+        state = self._current_tracker_state_without_events(tracker)
+        if self._should_snapshot(number_of_stored_events, len(tracker.events)):
+            state["tracker_snapshot"] = self._tracker_state_snapshot(tracker)
 
         self.conversations.update_one(
             {"sender_id": tracker.sender_id},
             {
-                "$set": self._current_tracker_state_without_events(tracker),
+                "$set": state,
                 "$push": {
                     "events": {"$each": [e.as_dict() for e in additional_events]}
                 },
@@ -629,25 +1196,31 @@ class MongoTrackerStore(TrackerStore):
             upsert=True,
         )
 
-    def _additional_events(self, tracker: DialogueStateTracker) -> Iterator:
-        """Return events from the tracker which aren't currently stored.
-
-        Args:
-            tracker: Tracker to inspect.
-
-        Returns:
-            List of serialised events that aren't currently stored.
+    def _number_of_stored_events(
+        self, sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> int:
+        # only fetch the event types, which is all that's needed to find the
+        # latest session start
+        stored = (
+            self.conversations.find_one(
+                {"sender_id": sender_id}, projection={"events.event": True}
+            )
+            or {}
+        )
+        events = self._events_from_serialized_tracker(stored)
 
-        """
+        if not fetch_events_from_all_sessions:
+            events = self._events_since_last_session_start(events)
 
-        stored = self.conversations.find_one({"sender_id": tracker.sender_id}) or {}
-        all_events = self._events_from_serialized_tracker(stored)
-        number_events_since_last_session = len(
-            self._events_since_last_session_start(all_events)
-        )
+        return len(events)
 
-        return itertools.islice(
-            tracker.events, number_events_since_last_session, len(tracker.events)
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        return self._number_of_stored_events(
+            sender_id,
+            fetch_events_from_all_sessions=bool(
+                self.retrieve_events_from_previous_conversation_sessions
+            ),
         )
 
     @staticmethod
@@ -677,7 +1250,7 @@ class MongoTrackerStore(TrackerStore):
 
     def _retrieve(
         self, sender_id: Text, fetch_events_from_all_sessions: bool
-    ) -> Optional[List[Dict[Text, Any]]]:
+    ) -> Optional[DialogueStateTracker]:
         stored = self.conversations.find_one({"sender_id": sender_id})
 
         # look for conversations which have used an `int` sender_id in the past
@@ -696,10 +1269,16 @@ class MongoTrackerStore(TrackerStore):
 
         events = self._events_from_serialized_tracker(stored)
 
+        # the snapshot only covers the latest session
+        snapshot = None
         if not fetch_events_from_all_sessions:
             events = self._events_since_last_session_start(events)
+            snapshot = stored.get("tracker_snapshot")
 
-        return events
+        if not events:
+            return None
+
+        return self._tracker_from_events_and_snapshot(sender_id, events, snapshot)
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
         # TODO: Remove this in Rasa Open Source 3.0 along with the
@@ -707,24 +1286,12 @@ class MongoTrackerStore(TrackerStore):
         if self.retrieve_events_from_previous_conversation_sessions:
             return self.retrieve_full_tracker(sender_id)
 
-        events = self._retrieve(sender_id, fetch_events_from_all_sessions=False)
-
-        if not events:
-            return None
-
-        return DialogueStateTracker.from_dict(sender_id, events, self.domain.slots)
+        return self._retrieve(sender_id, fetch_events_from_all_sessions=False)
 
     def retrieve_full_tracker(
         self, conversation_id: Text
     ) -> Optional[DialogueStateTracker]:
-        events = self._retrieve(conversation_id, fetch_events_from_all_sessions=True)
-
-        if not events:
-            return None
-
-        return DialogueStateTracker.from_dict(
-            conversation_id, events, self.domain.slots
-        )
+        return self._retrieve(conversation_id, fetch_events_from_all_sessions=True)
 
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the Mongo Tracker Store."""
@@ -845,6 +1412,36 @@ class SQLTrackerStore(TrackerStore):
         intent_name = sa.Column(sa.String(255))
         action_name = sa.Column(sa.String(255))
         data = sa.Column(sa.Text)
+        # position of the event within its conversation. Tables which were created
+        # before this column was introduced don't have it, hence it's deferred so
+        # that it's never loaded when querying events.
+        sequence_number = sa.orm.deferred(sa.Column(sa.Integer))
+
+        __table_args__ = (
+            sa.Index(
+                "ix_events_sender_id_sequence_number", "sender_id", "sequence_number"
+            ),
+            sa.Index("ix_events_sender_id_timestamp", "sender_id", "timestamp"),
+        )
+
+    class SQLConversationSession(Base):
+        """Represents the latest conversation session of a sender in the SQL Tracker
+        Store"""
+
+        __tablename__ = "conversation_sessions"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        # timestamp of the latest `SessionStarted` event, `None` if the
+        # conversation was never started with a `SessionStarted` event
+        session_start = sa.Column(sa.Float)
+
+    class SQLTrackerSnapshot(Base):
+        """Represents a snapshot of the tracker state in the SQL Tracker Store"""
+
+        __tablename__ = "tracker_snapshots"
+
+        sender_id = sa.Column(sa.String(255), primary_key=True)
+        data = sa.Column(sa.Text)
 
     def __init__(
         self,
@@ -881,7 +1478,7 @@ class SQLTrackerStore(TrackerStore):
                     self._create_database_and_update_engine(db, engine_url)
 
                 try:
-                    self.Base.metadata.create_all(self.engine)
+                    self._create_tables()
                 except (
                     sqlalchemy.exc.OperationalError,
                     sqlalchemy.exc.ProgrammingError,
@@ -903,8 +1500,85 @@ class SQLTrackerStore(TrackerStore):
 
         logger.debug(f"Connection to SQL database '{db}' successful.")
 
+        self._use_sequence_numbers: Optional[bool] = None
+
         super().__init__(domain, event_broker, **kwargs)
 
+    def _create_tables(self) -> None:
+        """Creates missing tables and indices.
+
+        If the `conversation_sessions` table doesn't exist yet, it's filled with the
+        senders of the events which are already stored.
+        """
+        existing_tables = sa.inspect(self.engine).get_table_names()
+
+        self.Base.metadata.create_all(self.engine)
+        self._ensure_indices()
+
+        if self.SQLConversationSession.__tablename__ not in existing_tables:
+            self._fill_conversation_sessions()
+
+    def _ensure_indices(self) -> None:
+        """Creates indices which are missing on an existing events table."""
+        inspector = sa.inspect(self.engine)
+        table_name = self.SQLEvent.__tablename__
+        existing_indices = {
+            index["name"] for index in inspector.get_indexes(table_name)
+        }
+        existing_columns = {
+            column["name"] for column in inspector.get_columns(table_name)
+        }
+
+        for index in self.SQLEvent.__table__.indexes:
+            if index.name in existing_indices or any(
+                column.name not in existing_columns for column in index.columns
+            ):
+                continue
+
+            logger.debug(f"Creating index '{index.name}' on table '{table_name}'.")
+            index.create(bind=self.engine)
+
+    def _fill_conversation_sessions(self) -> None:
+        events = self.SQLEvent.__table__
+        latest_session_start = sa.func.max(
+            sa.case(
+                [(events.c.type_name == SessionStarted.type_name, events.c.timestamp)]
+            )
+        )
+
+        with self.engine.begin() as connection:
+            connection.execute(
+                self.SQLConversationSession.__table__.insert().from_select(
+                    ["sender_id", "session_start"],
+                    sa.select([events.c.sender_id, latest_session_start]).group_by(
+                        events.c.sender_id
+                    ),
+                )
+            )
+
+    @property
+    def use_sequence_numbers(self) -> bool:
+        """Whether the events table has the `sequence_number` column.
+
+        If it has, the number of stored events is looked up with the index on
+        the sequence numbers instead of counting the stored events.
+        """
+        if self._use_sequence_numbers is None:
+            self._use_sequence_numbers = self._has_sequence_number_column()
+
+        return self._use_sequence_numbers
+
+    def _has_sequence_number_column(self) -> bool:
+        columns = sa.inspect(self.engine).get_columns(self.SQLEvent.__tablename__)
+        if any(column["name"] == "sequence_number" for column in columns):
+            return True
+
+        logger.debug(
+            f"The '{self.SQLEvent.__tablename__}' table does not have a "
+            f"'sequence_number' column. Stored events will be counted on every save."
+        )
+        return False
+
     @staticmethod
     def get_db_url(
         dialect: Text = "sqlite",
@@ -1020,7 +1694,7 @@ class SQLTrackerStore(TrackerStore):
     def keys(self) -> Iterable[Text]:
         """Returns sender_ids of the SQLTrackerStore"""
         with self.session_scope() as session:
-            sender_ids = session.query(self.SQLEvent.sender_id).distinct().all()
+            sender_ids = session.query(self.SQLConversationSession.sender_id).all()
             return [sender_id for (sender_id,) in sender_ids]
 
     def retrieve(self, sender_id: Text) -> Optional[DialogueStateTracker]:
@@ -1051,8 +1725,14 @@ class SQLTrackerStore(TrackerStore):
 
             if self.domain and len(events) > 0:
                 logger.debug(f"Recreating tracker from sender id '{sender_id}'")
-                return DialogueStateTracker.from_dict(
-                    sender_id, events, self.domain.slots
+                # the snapshot only covers the latest session
+                snapshot = (
+                    None
+                    if fetch_events_from_all_sessions
+                    else self._retrieve_snapshot(session, sender_id)
+                )
+                return self._tracker_from_events_and_snapshot(
+                    sender_id, events, snapshot
                 )
             else:
                 logger.debug(
@@ -1062,6 +1742,20 @@ class SQLTrackerStore(TrackerStore):
                 )
                 return None
 
+    def _retrieve_snapshot(
+        self, session: "Session", sender_id: Text
+    ) -> Optional[Dict[Text, Any]]:
+        if not self.snapshot_interval:
+            return None
+
+        stored = (
+            session.query(self.SQLTrackerSnapshot)
+            .filter(self.SQLTrackerSnapshot.sender_id == sender_id)
+            .first()
+        )
+
+        return json.loads(stored.data) if stored else None
+
     def _event_query(
         self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
     ) -> "Query":
@@ -1077,23 +1771,27 @@ class SQLTrackerStore(TrackerStore):
         Returns:
             Query to get the conversation events.
         """
-        # Subquery to find the timestamp of the latest `SessionStarted` event
-        session_start_sub_query = (
-            session.query(sa.func.max(self.SQLEvent.timestamp).label("session_start"))
-            .filter(
-                self.SQLEvent.sender_id == sender_id,
-                self.SQLEvent.type_name == SessionStarted.type_name,
-            )
-            .subquery()
-        )
-
         event_query = session.query(self.SQLEvent).filter(
             self.SQLEvent.sender_id == sender_id
         )
-        if not fetch_events_from_all_sessions:
+        if fetch_events_from_all_sessions:
+            return event_query.order_by(self.SQLEvent.timestamp)
+
+        conversation_session = session.query(self.SQLConversationSession).get(sender_id)
+        if conversation_session is not None:
+            # Find events after the latest `SessionStarted` event or return all
+            # events
+            if conversation_session.session_start is not None:
+                event_query = event_query.filter(
+                    self.SQLEvent.timestamp >= conversation_session.session_start
+                )
+        else:
+            # the events might have been stored by a previous Rasa version which
+            # didn't keep track of the sessions
+            session_start_sub_query = self._session_start_query(
+                session, sender_id
+            ).subquery()
             event_query = event_query.filter(
-                # Find events after the latest `SessionStarted` event or return all
-                # events
                 sa.or_(
                     self.SQLEvent.timestamp >= session_start_sub_query.c.session_start,
                     session_start_sub_query.c.session_start.is_(None),
@@ -1102,6 +1800,44 @@ class SQLTrackerStore(TrackerStore):
 
         return event_query.order_by(self.SQLEvent.timestamp)
 
+    def _session_start_query(self, session: "Session", sender_id: Text) -> "Query":
+        """Query to find the timestamp of the latest stored `SessionStarted` event."""
+        return session.query(
+            sa.func.max(self.SQLEvent.timestamp).label("session_start")
+        ).filter(
+            self.SQLEvent.sender_id == sender_id,
+            self.SQLEvent.type_name == SessionStarted.type_name,
+        )
+
+    def _update_conversation_session(
+        self, session: "Session", sender_id: Text, new_events: List[Dict[Text, Any]]
+    ) -> None:
+        """Stores the timestamp of the latest session start of a sender.
+
+        Args:
+            session: Current database session.
+            sender_id: Sender id whose events are saved.
+            new_events: Serialised events which are saved.
+        """
+        session_starts = [
+            event["timestamp"]
+            for event in new_events
+            if event["type_name"] == SessionStarted.type_name
+        ]
+        session_start = max(session_starts) if session_starts else None
+
+        conversation_session = session.query(self.SQLConversationSession).get(sender_id)
+        if conversation_session is None:
+            if session_start is None:
+                session_start = self._session_start_query(session, sender_id).scalar()
+            session.add(
+                self.SQLConversationSession(
+                    sender_id=sender_id, session_start=session_start
+                )
+            )
+        elif session_start is not None:
+            conversation_session.session_start = session_start
+
     def save(self, tracker: DialogueStateTracker) -> None:
         """Update database with events from the current conversation."""
 
@@ -1109,43 +1845,116 @@ class SQLTrackerStore(TrackerStore):
             self.stream_events(tracker)
 
         with self.session_scope() as session:
+            (
+                number_of_stored_events,
+                next_sequence_number,
+            ) = self._number_of_stored_events(
+                session, tracker.sender_id, fetch_events_from_all_sessions=False
+            )
             # only store recent events
-            events = self._additional_events(session, tracker)
+            events = itertools.islice(
+                tracker.events, number_of_stored_events, len(tracker.events)
+            )
 
+            rows = []
             for event in events:
                 data = event.as_dict()
                 intent = (
                     data.get("parse_data", {}).get("intent", {}).get(INTENT_NAME_KEY)
                 )
-                action = data.get("name")
-                timestamp = data.get("timestamp")
-
-                # noinspection PyArgumentList
-                session.add(
-                    self.SQLEvent(
+                row = {
+                    "sender_id": tracker.sender_id,
+                    "type_name": event.type_name,
+                    "timestamp": data.get("timestamp"),
+                    "intent_name": intent,
+                    "action_name": data.get("name"),
+                    "data": json.dumps(data),
+                }
+                if next_sequence_number is not None:
+                    row["sequence_number"] = next_sequence_number + len(rows)
+                rows.append(row)
+
+            if rows:
+                self._update_conversation_session(session, tracker.sender_id, rows)
+                # insert all events with a single `executemany`
+                session.bulk_insert_mappings(self.SQLEvent, rows)
+
+            if self._should_snapshot(number_of_stored_events, len(tracker.events)):
+                session.merge(
+                    self.SQLTrackerSnapshot(
                         sender_id=tracker.sender_id,
-                        type_name=event.type_name,
-                        timestamp=timestamp,
-                        intent_name=intent,
-                        action_name=action,
-                        data=json.dumps(data),
+                        data=json.dumps(self._tracker_state_snapshot(tracker)),
                     )
                 )
             session.commit()
 
         logger.debug(f"Tracker with sender_id '{tracker.sender_id}' stored to database")
 
-    def _additional_events(
-        self, session: "Session", tracker: DialogueStateTracker
-    ) -> Iterator:
-        """Return events from the tracker which aren't currently stored."""
+    def _number_of_stored_events(
+        self, session: "Session", sender_id: Text, fetch_events_from_all_sessions: bool
+    ) -> Tuple[int, Optional[int]]:
+        """Returns the number of stored events for a sender.
+
+        Args:
+            session: Current database session.
+            sender_id: Sender id whose stored events should be counted.
+            fetch_events_from_all_sessions: Whether to count the events of all
+                conversation sessions. If `False`, only count the events of the
+                latest conversation session.
+
+        Returns:
+            The number of stored events, and the sequence number which the next
+            stored event gets. The latter is `None` if the events table has no
+            `sequence_number` column.
+        """
+        if not self.use_sequence_numbers:
+            number_of_events = self._event_query(
+                session,
+                sender_id,
+                fetch_events_from_all_sessions=fetch_events_from_all_sessions,
+            ).count()
+            return number_of_events, None
+
+        latest_sequence_number, session_start_sequence_number = (
+            session.query(
+                sa.func.max(self.SQLEvent.sequence_number),
+                sa.func.max(
+                    sa.case(
+                        [
+                            (
+                                self.SQLEvent.type_name == SessionStarted.type_name,
+                                self.SQLEvent.sequence_number,
+                            )
+                        ]
+                    )
+                ),
+            )
+            .filter(self.SQLEvent.sender_id == sender_id)
+            .one()
+        )
 
-        number_of_events_since_last_session = self._event_query(
-            session, tracker.sender_id, fetch_events_from_all_sessions=False
-        ).count()
-        return itertools.islice(
-            tracker.events, number_of_events_since_last_session, len(tracker.events)
+        next_sequence_number = (
+            latest_sequence_number + 1 if latest_sequence_number is not None else 0
         )
+        if fetch_events_from_all_sessions or session_start_sequence_number is None:
+            return next_sequence_number, next_sequence_number
+
+        return (
+            next_sequence_number - session_start_sequence_number,
+            next_sequence_number,
+        )
+
+    def number_of_existing_events(self, sender_id: Text) -> int:
+        """Return number of stored events for a given sender id."""
+        with self.session_scope() as session:
+            number_of_events, _ = self._number_of_stored_events(
+                session,
+                sender_id,
+                fetch_events_from_all_sessions=bool(
+                    self.retrieve_events_from_previous_conversation_sessions
+                ),
+            )
+            return number_of_events
 
 
 class FailSafeTrackerStore(TrackerStore):
@@ -1224,6 +2033,23 @@ class FailSafeTrackerStore(TrackerStore):
             self.on_tracker_store_error(e)
             self.fallback_tracker_store.save(tracker)
 
+    async def retrieve_async(self, sender_id: Text) -> Optional[DialogueStateTracker]:
+        try:
+            return await self._tracker_store.retrieve_async(sender_id)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            return None
+
+    async def save_async(self, tracker: DialogueStateTracker) -> None:
+        try:
+            await self._tracker_store.save_async(tracker)
+        except Exception as e:
+            self.on_tracker_store_error(e)
+            self.fallback_tracker_store.save(tracker)
+
+    async def close(self) -> None:
+        await self._tracker_store.close()
+
 
 def _create_from_endpoint_config(
     endpoint_config: Optional[EndpointConfig] = None,
@@ -1234,9 +2060,13 @@ def _create_from_endpoint_config(
 
     domain = domain or Domain.empty()
 
-    if endpoint_config is None or endpoint_config.type is None:
-        # default tracker store if no type is set
+    if endpoint_config is None:
         tracker_store = InMemoryTrackerStore(domain, event_broker)
+    elif endpoint_config.type is None:
+        # default tracker store if no type is set
+        tracker_store = InMemoryTrackerStore(
+            domain, event_broker, **endpoint_config.kwargs
+        )
     elif endpoint_config.type.lower() == "redis":
         tracker_store = RedisTrackerStore(
             domain=domain,
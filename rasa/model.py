@@ -13,7 +13,15 @@ from typing import Any, Text, Tuple, Union, Optional, List, Dict, NamedTuple
 
 from packaging import version
 
-from rasa.constants import MINIMUM_COMPATIBLE_VERSION
+from rasa.constants import (
+    DEFAULT_MODEL_COMPRESSION,
+    ENV_MODEL_COMPRESSION,
+    MINIMUM_COMPATIBLE_VERSION,
+    MODEL_ARCHIVE_EXTENSIONS,
+    MODEL_COMPRESSION_GZ,
+    MODEL_COMPRESSION_NONE,
+    MODEL_COMPRESSION_ZSTD,
+)
 import rasa.shared.utils.io
 import rasa.utils.io
 from rasa.cli.utils import create_output_path
@@ -43,6 +51,8 @@ Fingerprint = Dict[Text, Union[Text, List[Text], int, float]]
 
 FINGERPRINT_FILE_PATH = "fingerprint.json"
 
+GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+
 FINGERPRINT_CONFIG_KEY = "config"
 FINGERPRINT_CONFIG_CORE_KEY = "core-config"
 FINGERPRINT_CONFIG_NLU_KEY = "nlu-config"
@@ -153,7 +163,7 @@ def get_model(model_path: Text = DEFAULT_MODELS_PATH) -> TempDirectoryPath:
             raise ModelNotFound(
                 f"Could not find any Rasa model files in '{model_path}'."
             )
-    elif not model_path.endswith(".tar.gz"):
+    elif not model_path.endswith(tuple(MODEL_ARCHIVE_EXTENSIONS.values())):
         raise ModelNotFound(f"Path '{model_path}' does not point to a Rasa model file.")
 
     try:
@@ -178,7 +188,11 @@ def get_latest_model(model_path: Text = DEFAULT_MODELS_PATH) -> Optional[Text]:
     if not os.path.exists(model_path) or os.path.isfile(model_path):
         model_path = os.path.dirname(model_path)
 
-    list_of_files = glob.glob(os.path.join(model_path, "*.tar.gz"))
+    list_of_files = [
+        model_file
+        for extension in MODEL_ARCHIVE_EXTENSIONS.values()
+        for model_file in glob.glob(os.path.join(model_path, f"*{extension}"))
+    ]
 
     if len(list_of_files) == 0:
         return None
@@ -207,9 +221,14 @@ def unpack_model(
 
     # All files are in a subdirectory.
     try:
-        with tarfile.open(model_file, mode="r:gz") as tar:
-            tar.extractall(working_directory)
-            logger.debug(f"Extracted model to '{working_directory}'.")
+        compression = archive_compression(model_file)
+        if compression == MODEL_COMPRESSION_ZSTD:
+            rasa.utils.io.extract_zstd_tar(model_file, working_directory)
+        else:
+            mode = "r:" if compression == MODEL_COMPRESSION_NONE else "r:gz"
+            with tarfile.open(model_file, mode=mode) as tar:
+                tar.extractall(working_directory)
+        logger.debug(f"Extracted model to '{working_directory}'.")
     except Exception as e:
         logger.error(f"Failed to extract model at {model_file}. Error: {e}")
         raise
@@ -217,6 +236,25 @@ def unpack_model(
     return TempDirectoryPath(working_directory)
 
 
+def archive_compression(model_file: Union[Path, Text]) -> Text:
+    """Determines the compression of a model archive from its content.
+
+    Args:
+        model_file: Path to the model archive.
+
+    Returns:
+        `gz`, `zstd` or `none`.
+    """
+    with open(model_file, "rb") as f:
+        magic_number = f.read(len(rasa.utils.io.ZSTD_MAGIC_NUMBER))
+
+    if magic_number.startswith(GZIP_MAGIC_NUMBER):
+        return MODEL_COMPRESSION_GZ
+    if magic_number == rasa.utils.io.ZSTD_MAGIC_NUMBER:
+        return MODEL_COMPRESSION_ZSTD
+    return MODEL_COMPRESSION_NONE
+
+
 def get_model_subdirectories(
     unpacked_model_path: Text,
 ) -> Tuple[Optional[Text], Optional[Text]]:
@@ -268,6 +306,7 @@ def create_package_rasa(
     training_directory: Text,
     output_filename: Text,
     fingerprint: Optional[Fingerprint] = None,
+    compression: Optional[Text] = None,
 ) -> Text:
     """Create a zipped Rasa model from trained model files.
 
@@ -276,6 +315,8 @@ def create_package_rasa(
                             model files.
         output_filename: Name of the zipped model file to be created.
         fingerprint: A unique fingerprint to identify the model version.
+        compression: `gz`, `zstd` or `none`. If `None`, the compression is chosen
+                     by the extension of `output_filename`.
 
     Returns:
         Path to zipped model.
@@ -290,14 +331,37 @@ def create_package_rasa(
     if not os.path.exists(output_directory):
         os.makedirs(output_directory)
 
-    with tarfile.open(output_filename, "w:gz") as tar:
-        for elem in os.scandir(training_directory):
-            tar.add(elem.path, arcname=elem.name)
+    compression = compression or compression_from_extension(output_filename)
+    if compression == MODEL_COMPRESSION_ZSTD:
+        rasa.utils.io.create_zstd_tar(training_directory, output_filename)
+    else:
+        mode = "w" if compression == MODEL_COMPRESSION_NONE else "w:gz"
+        with tarfile.open(output_filename, mode) as tar:
+            for elem in os.scandir(training_directory):
+                tar.add(elem.path, arcname=elem.name)
 
     shutil.rmtree(training_directory)
     return output_filename
 
 
+def compression_from_extension(model_file: Text) -> Text:
+    """Returns the compression which belongs to the file extension of a model."""
+    for compression, extension in MODEL_ARCHIVE_EXTENSIONS.items():
+        if model_file.endswith(extension):
+            return compression
+    return DEFAULT_MODEL_COMPRESSION
+
+
+def _compression_from_env() -> Text:
+    compression = os.environ.get(ENV_MODEL_COMPRESSION, DEFAULT_MODEL_COMPRESSION)
+    if compression not in MODEL_ARCHIVE_EXTENSIONS:
+        raise ValueError(
+            f"Unknown model compression '{compression}'. Please set "
+            f"'{ENV_MODEL_COMPRESSION}' to one of {list(MODEL_ARCHIVE_EXTENSIONS)}."
+        )
+    return compression
+
+
 def project_fingerprint() -> Optional[Text]:
     """Create a hash for the project in the current working directory.
 
@@ -651,6 +715,9 @@ def package_model(
     """
     Compress a trained model.
 
+    The compression is set with the `MODEL_COMPRESSION` environment variable
+    (`gz` by default), unless the output path already has a model file extension.
+
     Args:
         fingerprint: fingerprint of the model
         output_directory: path to the directory in which the model should be stored
@@ -658,10 +725,13 @@ def package_model(
         fixed_model_name: name of the compressed model file
         model_prefix: prefix of the compressed model file
 
-    Returns: path to 'tar.gz' model file
+    Returns: path to 'tar.gz', 'tar' or 'tar.zst' model file
     """
     output_directory = create_output_path(
-        output_directory, prefix=model_prefix, fixed_name=fixed_model_name
+        output_directory,
+        prefix=model_prefix,
+        fixed_name=fixed_model_name,
+        extension=MODEL_ARCHIVE_EXTENSIONS[_compression_from_env()],
     )
     create_package_rasa(train_path, output_directory, fingerprint)
 
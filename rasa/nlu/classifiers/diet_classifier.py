@@ -21,7 +21,7 @@ from rasa.nlu.classifiers.classifier import IntentClassifier
 from rasa.nlu.extractors.extractor import EntityExtractor, EntityTagSpec
 from rasa.nlu.classifiers import LABEL_RANKING_LENGTH
 from rasa.utils import train_utils
-from rasa.utils.tensorflow import layers
+from rasa.utils.tensorflow import layers, model_data_storage
 from rasa.utils.tensorflow.models import RasaModel, TransformerRasaModel
 from rasa.utils.tensorflow.model_data import (
     RasaModelData,
@@ -840,18 +840,84 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     # process helpers
     def _predict(self, message: Message) -> Optional[Dict[Text, tf.Tensor]]:
+        return self._predict_batch([message])[0]
+
+    def _predict_batch(
+        self, messages: List[Message]
+    ) -> List[Optional[Dict[Text, tf.Tensor]]]:
+        """Predicts all messages with a single model call.
+
+        Returns:
+            The model output for each message (as a batch of 1).
+        """
         if self.model is None:
             logger.debug(
                 f"There is no trained model for '{self.__class__.__name__}': The "
                 f"component is either not trained or didn't receive enough training "
                 f"data."
             )
-            return None
+            return [None] * len(messages)
+
+        # create session data from messages and convert it into a single batch
+        model_data = self._create_model_data(messages, training=False)
+        predict_out = self.model.predict(model_data)
+
+        if len(messages) == 1:
+            return [predict_out]
+
+        # the sequence length of a message is the number of its tokens plus the
+        # sentence feature
+        sequence_lengths = model_data.get(TEXT, SEQUENCE_LENGTH)[0] + 1
+        return [
+            self._predictions_for_example(
+                predict_out, index, int(sequence_lengths[index])
+            )
+            for index in range(len(messages))
+        ]
 
-        # create session data from message and convert it into a batch of 1
-        model_data = self._create_model_data([message], training=False)
+    @staticmethod
+    def _predictions_for_example(
+        predict_out: Dict[Text, Any], index: int, sequence_length: int
+    ) -> Dict[Text, Any]:
+        # the sequences are padded to the longest one in the batch, so they are
+        # cut to the length of the example to match the predictions for a batch
+        # consisting only of this example
+        predictions = {}
+        for key, value in predict_out.items():
+            if key == DIAGNOSTIC_DATA:
+                predictions[key] = DIETClassifier._diagnostic_data_for_example(
+                    value, index, sequence_length
+                )
+            elif key.startswith("e_"):
+                # (batch size x sequence length)
+                predictions[key] = value[index : index + 1, :sequence_length]
+            else:
+                predictions[key] = value[index : index + 1]
 
-        return self.model.predict(model_data)
+        return predictions
+
+    @staticmethod
+    def _diagnostic_data_for_example(
+        diagnostic_data: Dict[Text, Any], index: int, sequence_length: int
+    ) -> Dict[Text, Any]:
+        attention_weights = diagnostic_data.get("attention_weights")
+        if attention_weights is not None:
+            # the attention weights have the shape
+            # (layers x batch size x heads x sequence length x sequence length)
+            attention_weights = attention_weights[
+                :, index : index + 1, :, :sequence_length, :sequence_length
+            ]
+
+        # the transformed text has the shape
+        # (batch size x sequence length x units)
+        text_transformed = diagnostic_data["text_transformed"][
+            index : index + 1, :sequence_length
+        ]
+
+        return {
+            "attention_weights": attention_weights,
+            "text_transformed": text_transformed,
+        }
 
     def _predict_label(
         self, predict_out: Optional[Dict[Text, tf.Tensor]]
@@ -937,8 +1003,19 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Augments the message with intents, entities, and diagnostic data."""
-        out = self._predict(message)
+        self._process_prediction(message, self._predict(message))
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Augments the messages with intents, entities, and diagnostic data.
+
+        All messages are predicted with a single model call.
+        """
+        for message, out in zip(messages, self._predict_batch(messages)):
+            self._process_prediction(message, out)
 
+    def _process_prediction(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
         if self.component_config[INTENT_CLASSIFICATION]:
             label, label_ranking = self._predict_label(out)
 
@@ -974,11 +1051,11 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
         else:
             self.model.save(str(tf_model_file))
 
-        io_utils.pickle_dump(
-            model_dir / f"{file_name}.data_example.pkl", self._data_example
+        model_data_storage.persist_model_data(
+            self._data_example, model_dir / f"{file_name}.data_example"
         )
-        io_utils.pickle_dump(
-            model_dir / f"{file_name}.label_data.pkl", dict(self._label_data.data)
+        model_data_storage.persist_model_data(
+            self._label_data.data, model_dir / f"{file_name}.label_data"
         )
         io_utils.json_pickle(
             model_dir / f"{file_name}.index_label_id_mapping.json",
@@ -1051,8 +1128,12 @@ class DIETClassifier(IntentClassifier, EntityExtractor):
 
         model_dir = Path(model_dir)
 
-        data_example = io_utils.pickle_load(model_dir / f"{file_name}.data_example.pkl")
-        label_data = io_utils.pickle_load(model_dir / f"{file_name}.label_data.pkl")
+        data_example = model_data_storage.load_model_data(
+            model_dir / f"{file_name}.data_example"
+        )
+        label_data = model_data_storage.load_model_data(
+            model_dir / f"{file_name}.label_data"
+        )
         label_data = RasaModelData(data=label_data)
         index_label_id_mapping = io_utils.json_unpickle(
             model_dir / f"{file_name}.index_label_id_mapping.json"
@@ -1,6 +1,7 @@
 from collections import defaultdict
 import itertools
 import logging
+from threading import RLock
 import typing
 from typing import Any, Dict, Hashable, List, Optional, Set, Text, Tuple, Type, Iterable
 
@@ -592,6 +593,21 @@ class Component(metaclass=ComponentMetaclass):
         """
         pass
 
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Processes a batch of incoming messages.
+
+        The default implementation calls
+        :meth:`rasa.nlu.components.Component.process` for each message.
+        Components which can process several messages at once more
+        efficiently (e.g. with a single model call) should override this.
+
+        Args:
+            messages: The :class:`rasa.shared.nlu.training_data.message.Message`
+                objects to process.
+        """
+        for message in messages:
+            self.process(message, **kwargs)
+
     def persist(self, file_name: Text, model_dir: Text) -> Optional[Dict[Text, Any]]:
         """Persists this component to disk for future loading.
 
@@ -751,6 +767,9 @@ class ComponentBuilder:
         # Reuse nlp and featurizers where possible to save memory,
         # every component that implements a cache-key will be cached
         self.component_cache = {}
+        # models can be loaded from several threads, which should not load the
+        # same cacheable component twice
+        self._lock = RLock()
 
     def __get_cached_component(
         self, component_meta: Dict[Text, Any], model_metadata: "Metadata"
@@ -784,6 +803,22 @@ class ComponentBuilder:
                 f"Added '{component.name}' to component cache. Key '{cache_key}'."
             )
 
+    def remove_from_cache(self, components: Iterable[Component]) -> None:
+        """Removes `components` from the cache, e.g. after their model was unloaded.
+
+        Args:
+            components: Components which must no longer be reused.
+        """
+        components = list(components)
+        with self._lock:
+            for cache_key, cached_component in list(self.component_cache.items()):
+                if any(cached_component is component for component in components):
+                    del self.component_cache[cache_key]
+                    logger.debug(
+                        f"Removed '{cached_component.name}' from component cache. "
+                        f"Key '{cache_key}'."
+                    )
+
     def load_component(
         self,
         component_meta: Dict[Text, Any],
@@ -811,16 +846,21 @@ class ComponentBuilder:
         from rasa.nlu import registry
 
         try:
-            cached_component, cache_key = self.__get_cached_component(
-                component_meta, model_metadata
-            )
-            component = registry.load_component_by_meta(
-                component_meta, model_dir, model_metadata, cached_component, **context
-            )
-            if not cached_component:
-                # If the component wasn't in the cache,
-                # let us add it if possible
-                self.__add_to_cache(component, cache_key)
+            with self._lock:
+                cached_component, cache_key = self.__get_cached_component(
+                    component_meta, model_metadata
+                )
+                component = registry.load_component_by_meta(
+                    component_meta,
+                    model_dir,
+                    model_metadata,
+                    cached_component,
+                    **context,
+                )
+                if not cached_component:
+                    # If the component wasn't in the cache,
+                    # let us add it if possible
+                    self.__add_to_cache(component, cache_key)
             return component
         except MissingArgumentError as e:  # pragma: no cover
             raise RasaException(
@@ -612,42 +612,45 @@ class CountVectorsFeaturizer(SparseFeaturizer):
     ) -> Tuple[
         List[Optional[scipy.sparse.spmatrix]], List[Optional[scipy.sparse.spmatrix]]
     ]:
+        sequence_features = [None] * len(all_tokens)
+        sentence_features = [None] * len(all_tokens)
+
         if not self.vectorizers.get(attribute):
-            return [None], [None]
-
-        sequence_features = []
-        sentence_features = []
-
-        for i, tokens in enumerate(all_tokens):
-            if not tokens:
-                # nothing to featurize
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            # vectorizer.transform returns a sparse matrix of size
-            # [n_samples, n_features]
-            # set input to list of tokens if sequence should be returned
-            # otherwise join all tokens to a single string and pass that as a list
-            if not tokens:
-                # attribute is not set (e.g. response not present)
-                sequence_features.append(None)
-                sentence_features.append(None)
-                continue
-
-            seq_vec = self.vectorizers[attribute].transform(tokens)
+            return sequence_features, sentence_features
+
+        # nothing to featurize for examples without tokens
+        # (e.g. response not present)
+        indices = [i for i, tokens in enumerate(all_tokens) if tokens]
+        if not indices:
+            return sequence_features, sentence_features
+
+        # the tokens of all examples are transformed at once and the resulting
+        # sparse matrices are split by example afterwards.
+        # vectorizer.transform returns a sparse matrix of size
+        # [n_samples, n_features]
+        # set input to list of tokens if sequence should be returned
+        # otherwise join all tokens to a single string and pass that as a list
+        vectorizer = self.vectorizers[attribute]
+        seq_vecs = vectorizer.transform(
+            [token for i in indices for token in all_tokens[i]]
+        ).tocsr()
+        sentence_vecs = None
+        if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
+            sentence_vecs = vectorizer.transform(
+                [" ".join(all_tokens[i]) for i in indices]
+            ).tocsr()
+
+        offset = 0
+        for row, i in enumerate(indices):
+            seq_vec = seq_vecs[offset : offset + len(all_tokens[i])]
+            offset += len(all_tokens[i])
             seq_vec.sort_indices()
+            sequence_features[i] = seq_vec.tocoo()
 
-            sequence_features.append(seq_vec.tocoo())
-
-            if attribute in DENSE_FEATURIZABLE_ATTRIBUTES:
-                tokens_text = [" ".join(tokens)]
-                sentence_vec = self.vectorizers[attribute].transform(tokens_text)
+            if sentence_vecs is not None:
+                sentence_vec = sentence_vecs[row]
                 sentence_vec.sort_indices()
-
-                sentence_features.append(sentence_vec.tocoo())
-            else:
-                sentence_features.append(None)
+                sentence_features[i] = sentence_vec.tocoo()
 
         return sequence_features, sentence_features
 
@@ -743,6 +746,13 @@ class CountVectorsFeaturizer(SparseFeaturizer):
 
     def process(self, message: Message, **kwargs: Any) -> None:
         """Process incoming message and compute and set features"""
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process incoming messages and compute and set features.
+
+        The tokens of all messages are vectorized at once.
+        """
 
         if self.vectorizers is None:
             logger.error(
@@ -753,17 +763,18 @@ class CountVectorsFeaturizer(SparseFeaturizer):
             return
         for attribute in self._attributes:
 
-            message_tokens = self._get_processed_message_tokens_by_attribute(
-                message, attribute
-            )
+            all_message_tokens = [
+                self._get_processed_message_tokens_by_attribute(message, attribute)
+                for message in messages
+            ]
 
-            # features shape (1, seq, dim)
+            # features shape (1, seq, dim) for each message
             sequence_features, sentence_features = self._create_features(
-                attribute, [message_tokens]
+                attribute, all_message_tokens
             )
 
             self._set_attribute_features(
-                attribute, sequence_features, sentence_features, [message]
+                attribute, sequence_features, sentence_features, messages
             )
 
     def _collect_vectorizer_vocabularies(self) -> Dict[Text, Optional[Dict[Text, int]]]:
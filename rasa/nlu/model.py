@@ -456,6 +456,42 @@ class Interpreter:
         output.update(message.as_dict(only_output_properties=only_output_properties))
         return output
 
+    def parse_batch(
+        self,
+        texts: List[Text],
+        time: Optional[datetime.datetime] = None,
+        only_output_properties: bool = True,
+    ) -> List[Dict[Text, Any]]:
+        """Parse several input texts at once and return the pipeline results.
+
+        Every component processes all messages with a single call to its
+        `process_batch` method. The results are the same as calling `parse`
+        for each text.
+        """
+        messages = []
+        for text in texts:
+            data = self.default_output_attributes()
+            data[TEXT] = text
+            messages.append(Message(data=data, time=time))
+
+        # Not all components are able to handle empty strings (see `parse`).
+        non_empty_messages = [message for message in messages if message.get(TEXT)]
+        if non_empty_messages:
+            for component in self.pipeline:
+                component.process_batch(non_empty_messages, **self.context)
+
+        outputs = []
+        for message in messages:
+            output = self.default_output_attributes()
+            if message.get(TEXT):
+                output.update(
+                    message.as_dict(only_output_properties=only_output_properties)
+                )
+            else:
+                output[TEXT] = ""
+            outputs.append(output)
+        return outputs
+
     def featurize_message(self, message: Message) -> Message:
         """
         Tokenize and featurize the input message
@@ -403,9 +403,10 @@ class ResponseSelector(DIETClassifier):
                     return search_key
         return None
 
-    def process(self, message: Message, **kwargs: Any) -> None:
+    def _process_prediction(
+        self, message: Message, out: Optional[Dict[Text, tf.Tensor]]
+    ) -> None:
         """Return the most likely response, the associated intent_response_key and its similarity to the input."""
-        out = self._predict(message)
         top_label, label_ranking = self._predict_label(out)
 
         # Get the exact intent_response_key and the associated
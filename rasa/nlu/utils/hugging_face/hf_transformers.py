@@ -731,14 +731,26 @@ class HFTransformersNLP(Component):
         Args:
             message: Incoming message object
         """
+        self.process_batch([message], **kwargs)
+
+    def process_batch(self, messages: List[Message], **kwargs: Any) -> None:
+        """Process incoming messages by computing their tokens and dense features.
+
+        The language model is run once for all messages.
+
+        Args:
+            messages: Incoming message objects
+        """
         # process of all featurizers operates only on TEXT and ACTION_TEXT attributes,
         # because all other attributes are labels which are featurized during training
         # and their features are stored by the model itself.
         for attribute in {TEXT, ACTION_TEXT}:
-            if message.get(attribute):
-                message.set(
-                    LANGUAGE_MODEL_DOCS[attribute],
-                    self._get_docs_for_batch(
-                        [message], attribute=attribute, inference_mode=True
-                    )[0],
+            non_empty_messages = [
+                message for message in messages if message.get(attribute)
+            ]
+            if non_empty_messages:
+                docs = self._get_docs_for_batch(
+                    non_empty_messages, attribute=attribute, inference_mode=True
                 )
+                for doc, message in zip(docs, non_empty_messages):
+                    message.set(LANGUAGE_MODEL_DOCS[attribute], doc)
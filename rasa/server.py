@@ -337,7 +337,7 @@ async def update_conversation_with_events(
         The tracker for `conversation_id` with the updated events.
     """
     if rasa.shared.core.events.do_events_begin_with_session_start(events):
-        tracker = processor.get_tracker(conversation_id)
+        tracker = await processor.get_tracker_async(conversation_id)
     else:
         tracker = await processor.fetch_tracker_with_initial_session(conversation_id)
 
@@ -673,14 +673,20 @@ def create_app(
     async def status(request: Request):
         """Respond with the model name and the fingerprint of that model."""
 
-        return response.json(
-            {
-                "model_file": app.agent.path_to_model_archive
-                or app.agent.model_directory,
-                "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
-                "num_active_training_jobs": app.active_training_processes.value,
-            }
-        )
+        status = {
+            "model_file": app.agent.path_to_model_archive or app.agent.model_directory,
+            "fingerprint": model.fingerprint_from_path(app.agent.model_directory),
+            "num_active_training_jobs": app.active_training_processes.value,
+        }
+        if app.agent.pending_model_directory:
+            # a new model is warming up, the current one still handles requests
+            status["pending_fingerprint"] = model.fingerprint_from_path(
+                app.agent.pending_model_directory
+            )
+        if app.agent.uses_parse_cache():
+            status["parse_cache"] = app.agent.parse_cache.metrics()
+
+        return response.json(status)
 
     @app.get("/conversations/<conversation_id:path>/tracker")
     @requires_auth(app, auth_token)
@@ -740,7 +746,7 @@ def create_app(
                         events, tracker, output_channel
                     )
 
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -794,7 +800,7 @@ def create_app(
                 )
 
                 # will override an existing tracker with the same id!
-                app.agent.tracker_store.save(tracker)
+                await app.agent.tracker_store.save_async(tracker)
 
             return response.json(tracker.current_state(verbosity))
         except Exception as e:
@@ -1268,7 +1274,11 @@ def create_app(
     @requires_auth(app, auth_token)
     @ensure_loaded_agent(app, require_core_is_ready=True)
     async def tracker_predict(request: Request) -> HTTPResponse:
-        """Given a list of events, predicts the next action."""
+        """Given a list of events, predicts the next action.
+
+        Given `{"trackers": [<list of events>, ...]}`, predicts the next action for
+        all these conversations at once.
+        """
         validate_request_body(
             request,
             "No events defined in request_body. Add events to request body in order to "
@@ -1277,6 +1287,9 @@ def create_app(
 
         verbosity = event_verbosity_parameter(request, EventVerbosity.AFTER_RESTART)
         request_params = request.json
+        if isinstance(request_params, dict) and "trackers" in request_params:
+            return await _predict_for_trackers(request_params["trackers"], verbosity)
+
         try:
             tracker = DialogueStateTracker.from_dict(
                 DEFAULT_SENDER_ID, request_params, app.agent.domain.slots
@@ -1304,6 +1317,47 @@ def create_app(
                 f"An unexpected error occurred. Error: {e}",
             )
 
+    async def _predict_for_trackers(
+        events_of_trackers: List[List[Dict[Text, Any]]], verbosity: EventVerbosity
+    ) -> HTTPResponse:
+        if not isinstance(events_of_trackers, list):
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                "The parameter `trackers` has to be a list of lists of events.",
+                {"parameter": "trackers", "in": "body"},
+            )
+
+        try:
+            trackers = [
+                DialogueStateTracker.from_dict(
+                    DEFAULT_SENDER_ID, events, app.agent.domain.slots
+                )
+                for events in events_of_trackers
+            ]
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.BAD_REQUEST,
+                "BadRequest",
+                f"Supplied events are not valid. {e}",
+                {"parameter": "trackers", "in": "body"},
+            )
+
+        try:
+            results = await app.agent.create_processor().predict_next_with_trackers(
+                trackers, verbosity
+            )
+
+            return response.json(results)
+        except Exception as e:
+            logger.debug(traceback.format_exc())
+            raise ErrorResponse(
+                HTTPStatus.INTERNAL_SERVER_ERROR,
+                "PredictionError",
+                f"An unexpected error occurred. Error: {e}",
+            )
+
     @app.post("/model/parse")
     @requires_auth(app, auth_token)
     @ensure_loaded_agent(app)
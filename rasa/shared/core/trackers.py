@@ -107,6 +107,165 @@ class AnySlotDict(dict):
         return True
 
 
+class _PastStatesCache:
+    """Keeps the past states of a tracker up to date while events are applied.
+
+    This mirrors `DialogueStateTracker.applied_events` and
+    `DialogueStateTracker.generate_all_prior_trackers`: the applied events are
+    replayed on a separate tracker and its state is stored before every action.
+    If only the latest states are needed, the earlier ones are not computed.
+    """
+
+    def __init__(
+        self,
+        tracker: "DialogueStateTracker",
+        domain: Domain,
+        max_history: Optional[int] = None,
+    ) -> None:
+        self.domain = domain
+        self.loop_names = {
+            event.name
+            for event in tracker.events
+            if isinstance(event, ActiveLoop) and event.name
+        }
+        self._reset(tracker)
+
+        applied_events = tracker.applied_events()
+        if max_history:
+            number_of_actions = sum(
+                isinstance(event, ActionExecuted) for event in applied_events
+            )
+            # the current state is one of the `max_history` states
+            self.number_of_skipped_states = max(
+                number_of_actions - (max_history - 1), 0
+            )
+
+        skipped_states = self.number_of_skipped_states
+        for event in applied_events:
+            if skipped_states and isinstance(event, ActionExecuted):
+                # the event still has to be replayed for the later states
+                skipped_states -= 1
+                self.applied_events.append(event)
+                self.prior_tracker.update(event)
+            else:
+                self._apply(event)
+        self.events_key = tracker._events_key()
+
+    def _reset(self, tracker: "DialogueStateTracker") -> None:
+        # the states before each of the applied actions, except for the first
+        # `number_of_skipped_states` ones which weren't computed
+        self.states: List[State] = []
+        self.number_of_skipped_states = 0
+        self.applied_events: List[Event] = []
+        self.prior_tracker = tracker.init_copy()
+        self.current_state: Optional[State] = None
+
+    def has_states(self, max_history: Optional[int]) -> bool:
+        """Checks if the latest `max_history` states are known.
+
+        Args:
+            max_history: The number of states. `None` for all states.
+        """
+        if not self.number_of_skipped_states:
+            return True
+        return bool(max_history) and len(self.states) + 1 >= max_history
+
+    def _apply(self, event: Event) -> None:
+        if isinstance(event, ActionExecuted):
+            self.states.append(self.domain.get_active_states(self.prior_tracker))
+        self.applied_events.append(event)
+        self.prior_tracker.update(event)
+        self.current_state = None
+
+    def update(self, tracker: "DialogueStateTracker", event: Event) -> bool:
+        """Applies an event which was added to the tracker.
+
+        Args:
+            tracker: The tracker the event was added to.
+            event: The event.
+
+        Returns:
+            `False` if the event changes earlier states and the cache has to be
+            rebuilt.
+        """
+        if isinstance(event, (Restarted, SessionStarted)):
+            self._reset(tracker)
+        elif isinstance(event, (ActionReverted, UserUtteranceReverted)):
+            return False
+        elif (
+            isinstance(event, ActiveLoop)
+            and event.name
+            and event.name not in self.loop_names
+        ):
+            # earlier executions of the loop might have to be undone now
+            if any(
+                isinstance(e, ActionExecuted) and e.action_name == event.name
+                for e in self.applied_events
+            ):
+                return False
+            self.loop_names.add(event.name)
+            self._apply(event)
+        elif (
+            isinstance(event, ActionExecuted)
+            and event.action_name in self.loop_names
+            and not tracker._first_loop_execution_or_unhappy_path(
+                event.action_name, self.applied_events
+            )
+        ):
+            # the loop continues its previous execution, which replaces this one
+            self._undo_till_previous_loop_execution(tracker, event.action_name)
+        else:
+            self._apply(event)
+
+        self.events_key = tracker._events_key()
+        return True
+
+    def _undo_till_previous_loop_execution(
+        self, tracker: "DialogueStateTracker", loop_action_name: Text
+    ) -> None:
+        tracker._undo_till_previous_loop_execution(
+            loop_action_name, self.applied_events
+        )
+        number_of_actions = sum(
+            isinstance(event, ActionExecuted) for event in self.applied_events
+        )
+        self.number_of_skipped_states = min(
+            self.number_of_skipped_states, number_of_actions
+        )
+        del self.states[number_of_actions - self.number_of_skipped_states :]
+
+        # the states before the remaining actions stay the same, only the prior
+        # tracker has to be rewound by replaying the remaining events
+        self.prior_tracker = tracker.init_copy()
+        for event in self.applied_events:
+            self.prior_tracker.update(event)
+        self.current_state = None
+
+    def compute_current_state(self) -> None:
+        """Computes the state after all applied events if it isn't known yet."""
+        if self.current_state is None:
+            self.current_state = self.domain.get_active_states(self.prior_tracker)
+
+    def past_states(self, max_history: Optional[int] = None) -> List[State]:
+        """Returns copies of the past states including the current state.
+
+        Args:
+            max_history: Only return this many of the latest states. Must be covered
+                by `has_states`.
+        """
+        self.compute_current_state()
+
+        states = self.states + [self.current_state]
+        if max_history:
+            states = states[-max_history:]
+
+        # featurizers modify the states they get, e.g. to remove the user text
+        return [
+            {key: dict(sub_state) for key, sub_state in state.items()}
+            for state in states
+        ]
+
+
 class DialogueStateTracker:
     """Maintains the state of a conversation.
 
@@ -189,6 +348,8 @@ class DialogueStateTracker:
         self.sender_source = sender_source
         # whether the tracker belongs to a rule-based data
         self.is_rule_tracker = is_rule_tracker
+        # the past states, which are kept up to date after they were needed once
+        self._past_states_cache: Optional[_PastStatesCache] = None
 
         ###
         # current state of the tracker - MUST be re-creatable by processing
@@ -273,16 +434,82 @@ class DialogueStateTracker:
             }.items()
         )
 
-    def past_states(self, domain: Domain) -> List[State]:
+    def past_states(
+        self, domain: Domain, max_history: Optional[int] = None
+    ) -> List[State]:
         """Generate the past states of this tracker based on the history.
 
+        The states are cached and updated with every new event, so that only the
+        state after the latest action has to be computed. Events which change the
+        history (e.g. `UserUtteranceReverted`) make the states be recomputed.
+
         Args:
             domain: a :class:`rasa.shared.core.domain.Domain`
+            max_history: Only create this many of the latest states. The events are
+                still replayed from the beginning, so e.g. slots which were set
+                early in the conversation are part of the states. `None` for all
+                states.
 
         Returns:
             a list of states
         """
-        return domain.states_for_tracker_history(self)
+        self.cache_past_states(domain, max_history)
+        return self._past_states_cache.past_states(max_history)
+
+    def cache_past_states(
+        self, domain: Domain, max_history: Optional[int] = None
+    ) -> None:
+        """Brings the cached past states of this tracker up to date.
+
+        Afterwards `past_states` returns copies of the cached states until the
+        next event is applied. This lets all policies of an ensemble share the
+        states when predicting the next action.
+
+        Args:
+            domain: a :class:`rasa.shared.core.domain.Domain`
+            max_history: The number of latest states which are needed. `None` for
+                all states.
+        """
+        cache = self._up_to_date_past_states_cache()
+        if (
+            cache is None
+            or cache.domain is not domain
+            or not cache.has_states(max_history)
+        ):
+            cache = self._past_states_cache = _PastStatesCache(
+                self, domain, max_history
+            )
+
+        cache.compute_current_state()
+
+    def __getstate__(self) -> Dict[Text, Any]:
+        # the cached past states hold the domain and a copy of the tracker, they
+        # are computed again when they are needed
+        state = self.__dict__.copy()
+        state["_past_states_cache"] = None
+        return state
+
+    def _events_key(self) -> Tuple[int, Optional[Event]]:
+        # the latest event is needed as well, since the number of events stays the
+        # same once `max_event_history` is reached
+        return len(self.events), self.events[-1] if self.events else None
+
+    def _up_to_date_past_states_cache(self) -> Optional[_PastStatesCache]:
+        # trackers which were pickled by older versions don't have a cache
+        cache = getattr(self, "_past_states_cache", None)
+        if cache is None:
+            return None
+
+        number_of_events, latest_event = cache.events_key
+        current_number_of_events, current_latest_event = self._events_key()
+        if (
+            number_of_events != current_number_of_events
+            or latest_event is not current_latest_event
+        ):
+            # the events were changed without `update`
+            return None
+
+        return cache
 
     def change_loop_to(self, loop_name: Optional[Text]) -> None:
         """Set the currently active loop.
@@ -586,6 +813,82 @@ class DialogueStateTracker:
         self.events.extend(dialogue.events)
         self.replay_events()
 
+    def state_snapshot(self) -> Dict[Text, Any]:
+        """Returns a serializable snapshot of the state derived from the events.
+
+        The snapshot can be restored with `restore_state_snapshot` instead of
+        replaying the events which lead to it. The latest user and bot utterances
+        are referenced by their position counted from the latest event.
+
+        Returns:
+            The snapshot of the tracker's current state.
+        """
+        events = list(self.events)
+
+        return {
+            "slots": self.current_slot_values(),
+            ACTIVE_LOOP: self.active_loop,
+            "latest_action": self.latest_action,
+            FOLLOWUP_ACTION: self.followup_action,
+            "paused": self._paused,
+            "latest_message_position": self._position_from_end(
+                self.latest_message, events
+            ),
+            # these attributes of the latest message are modified by subsequent
+            # events and not persisted with the message itself
+            ENTITIES: self.latest_message.entities,
+            "use_text_for_featurization": (
+                self.latest_message.use_text_for_featurization
+            ),
+            "latest_bot_utterance_position": self._position_from_end(
+                self.latest_bot_utterance, events
+            ),
+        }
+
+    @staticmethod
+    def _position_from_end(event: Event, events: List[Event]) -> Optional[int]:
+        for position, e in enumerate(reversed(events), 1):
+            if e is event:
+                return position
+
+        return None
+
+    def restore_state_snapshot(
+        self, snapshot: Dict[Text, Any], events: List[Event]
+    ) -> None:
+        """Restores the state from a snapshot without replaying events.
+
+        Args:
+            snapshot: Snapshot which was created by `state_snapshot` after the
+                `events` were applied to a tracker.
+            events: The events which lead to the snapshot. They are added to the
+                tracker's events without being applied.
+        """
+        self._reset()
+        self.events.extend(events)
+
+        for key, value in snapshot["slots"].items():
+            if key in self.slots:
+                self.slots[key].value = value
+
+        self.active_loop = snapshot[ACTIVE_LOOP]
+        self.latest_action = snapshot["latest_action"]
+        self.followup_action = snapshot[FOLLOWUP_ACTION]
+        self._paused = snapshot["paused"]
+
+        latest_message_position = snapshot["latest_message_position"]
+        if latest_message_position is not None:
+            self.latest_message = events[-latest_message_position]
+        # modify the entities in place as the events do
+        self.latest_message.entities[:] = snapshot[ENTITIES]
+        self.latest_message.use_text_for_featurization = snapshot[
+            "use_text_for_featurization"
+        ]
+
+        latest_bot_utterance_position = snapshot["latest_bot_utterance_position"]
+        if latest_bot_utterance_position is not None:
+            self.latest_bot_utterance = events[-latest_bot_utterance_position]
+
     def copy(self) -> "DialogueStateTracker":
         """Creates a duplicate of this tracker"""
         return self.travel_back_in_time(float("inf"))
@@ -620,9 +923,22 @@ class DialogueStateTracker:
         if not isinstance(event, Event):  # pragma: no cover
             raise ValueError("event to log must be an instance of a subclass of Event.")
 
+        past_states_cache = self._up_to_date_past_states_cache()
+        # the first event drops out of the history if it is full
+        drops_event = self._max_event_history is not None and (
+            len(self.events) >= self._max_event_history
+        )
+
         self.events.append(event)
         event.apply_to(self)
 
+        if (
+            past_states_cache is None
+            or drops_event
+            or not past_states_cache.update(self, event)
+        ):
+            self._past_states_cache = None
+
         if domain and isinstance(event, (UserUttered, EntitiesAdded)):
             if isinstance(event, UserUttered):
                 # Rather get entities from `parse_data` as
@@ -90,7 +90,7 @@ class EndpointConfig:
         self.type = kwargs.pop("store_type", kwargs.pop("type", None))
         self.kwargs = kwargs
 
-    def session(self) -> aiohttp.ClientSession:
+    def session(self, **kwargs: Any) -> aiohttp.ClientSession:
         # create authentication parameters
         if self.basic_auth:
             auth = aiohttp.BasicAuth(
@@ -103,6 +103,7 @@ class EndpointConfig:
             headers=self.headers,
             auth=auth,
             timeout=aiohttp.ClientTimeout(total=DEFAULT_REQUEST_TIMEOUT),
+            **kwargs,
         )
 
     def combine_parameters(
@@ -17,6 +17,8 @@ import rasa.shared.utils.io
 if TYPE_CHECKING:
     from prompt_toolkit.validation import Validator
 
+ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+
 
 def configure_colored_logging(loglevel: Text) -> None:
     import coloredlogs
@@ -97,6 +99,64 @@ def unarchive(byte_array: bytes, directory: Text) -> Text:
         return directory
 
 
+def unarchive_file(path: Text, directory: Text) -> Text:
+    """Tries to unpack the archive at `path` without reading it into memory.
+
+    Tries to use tar first to unpack, if that fails, zip will be used."""
+
+    if is_zstd_file(path):
+        extract_zstd_tar(path, directory)
+        return directory
+
+    try:
+        with tarfile.open(path) as tar:
+            tar.extractall(directory)
+    except tarfile.TarError:
+        with zipfile.ZipFile(path) as zip_ref:
+            zip_ref.extractall(directory)
+    return directory
+
+
+def is_zstd_file(path: Union[Text, Path]) -> bool:
+    """Checks if the file at `path` is compressed with zstd."""
+    with open(path, "rb") as f:
+        return f.read(len(ZSTD_MAGIC_NUMBER)) == ZSTD_MAGIC_NUMBER
+
+
+def _import_zstandard() -> Any:
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        raise ImportError(
+            "Archives compressed with zstd require the `zstandard` package. "
+            "Please install it with `pip install zstandard`."
+        )
+
+
+def create_zstd_tar(
+    directory: Union[Text, Path], output_filename: Union[Text, Path]
+) -> None:
+    """Packs the contents of `directory` into a zstd compressed tar archive."""
+    zstandard = _import_zstandard()
+
+    compressor = zstandard.ZstdCompressor(threads=-1)
+    with open(output_filename, "wb") as f, compressor.stream_writer(f) as writer:
+        with tarfile.open(fileobj=writer, mode="w|") as tar:
+            for elem in os.scandir(directory):
+                tar.add(elem.path, arcname=elem.name)
+
+
+def extract_zstd_tar(path: Union[Text, Path], directory: Union[Text, Path]) -> None:
+    """Unpacks a zstd compressed tar archive while decompressing it."""
+    zstandard = _import_zstandard()
+
+    with open(path, "rb") as f, zstandard.ZstdDecompressor().stream_reader(f) as reader:
+        with tarfile.open(fileobj=reader, mode="r|") as tar:
+            tar.extractall(directory)
+
+
 def create_temporary_file(data: Any, suffix: Text = "", mode: Text = "w+") -> Text:
     """Creates a tempfile.NamedTemporaryFile object for data.
 
@@ -0,0 +1,236 @@
+import json
+import logging
+import os
+import shutil
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Text, Union
+
+import numpy as np
+import scipy.sparse
+
+import rasa.utils.io as io_utils
+from rasa.utils.tensorflow.model_data import Data, FeatureArray
+
+logger = logging.getLogger(__name__)
+
+MODEL_DATA_INDEX_FILE = "index.json"
+MODEL_DATA_FORMAT_VERSION = 1
+
+# arrays are opened copy-on-write, so that the pages of a model are shared by all
+# processes which load it, unless they are modified. Windows can't remove a mapped
+# file, which would break removing the temporary directory of an unpacked model.
+DEFAULT_MMAP_MODE = None if sys.platform == "win32" else "c"
+
+
+class _BlockWriter:
+    """Writes the numpy arrays of one model data directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self.number_of_blocks = 0
+
+    def write(self, array: np.ndarray, allow_pickle: bool = False) -> Dict[Text, Any]:
+        name = f"{self.number_of_blocks}.npy"
+        self.number_of_blocks += 1
+        np.save(self.directory / name, array, allow_pickle=allow_pickle)
+        return {"file": name, "size": int(array.size), "pickled": allow_pickle}
+
+
+def _object_array(items: List[Any], shape: Optional[List[int]] = None) -> np.ndarray:
+    # assigning one by one keeps numpy from stacking arrays of the same shape
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array.reshape(shape) if shape is not None else array
+
+
+def _encode(array: np.ndarray, writer: _BlockWriter) -> Dict[Text, Any]:
+    array = np.asarray(array)
+    if array.dtype != object:
+        return {"type": "dense", "values": writer.write(array)}
+
+    items = list(array.ravel())
+    shape = list(array.shape)
+
+    if items and all(isinstance(item, scipy.sparse.spmatrix) for item in items):
+        matrices = [item.tocoo() for item in items]
+        formats = [item.getformat() for item in items]
+        return {
+            "type": "sparse",
+            "shape": shape,
+            # a single format unless the matrices were stored in different formats
+            "format": formats[0] if len(set(formats)) == 1 else formats,
+            "row": writer.write(np.concatenate([m.row for m in matrices])),
+            "col": writer.write(np.concatenate([m.col for m in matrices])),
+            "data": writer.write(np.concatenate([m.data for m in matrices])),
+            "offsets": writer.write(np.cumsum([0] + [m.nnz for m in matrices])),
+            "shapes": writer.write(np.array([m.shape for m in matrices])),
+        }
+
+    if (
+        items
+        and all(isinstance(item, np.ndarray) for item in items)
+        and all(item.dtype != object for item in items)
+        and len({item.dtype for item in items}) == 1
+    ):
+        # ragged arrays, e.g. the sequence features of every example, are stored
+        # back to back, so that every example is a view on one block
+        return {
+            "type": "ragged",
+            "shape": shape,
+            "values": writer.write(np.concatenate([item.ravel() for item in items])),
+            "offsets": writer.write(np.cumsum([0] + [item.size for item in items])),
+            "shapes": writer.write(
+                np.array([item.shape for item in items], dtype=np.int64)
+            ),
+        }
+
+    if (
+        items
+        and all(isinstance(item, np.ndarray) for item in items)
+        and all(item.dtype == object and item.ndim == 1 for item in items)
+    ):
+        # e.g. the features of every turn of every dialogue
+        return {
+            "type": "nested",
+            "shape": shape,
+            "lengths": writer.write(np.array([len(item) for item in items])),
+            "items": _encode(_object_array(list(np.concatenate(items))), writer),
+        }
+
+    return {"type": "pickle", "values": writer.write(array, allow_pickle=True)}
+
+
+def _read(directory: Path, block: Dict[Text, Any], mmap_mode: Optional[Text]) -> Any:
+    # empty arrays and python objects can't be memory-mapped
+    if block["pickled"] or not block["size"]:
+        mmap_mode = None
+    return np.load(
+        directory / block["file"], mmap_mode=mmap_mode, allow_pickle=block["pickled"]
+    )
+
+
+def _decode(
+    encoded: Dict[Text, Any], directory: Path, mmap_mode: Optional[Text]
+) -> np.ndarray:
+    def read(name: Text) -> np.ndarray:
+        return _read(directory, encoded[name], mmap_mode)
+
+    if encoded["type"] in ["dense", "pickle"]:
+        return read("values")
+
+    if encoded["type"] == "sparse":
+        row, col, data = read("row"), read("col"), read("data")
+        offsets, shapes = read("offsets"), read("shapes")
+        formats = encoded["format"]
+        if isinstance(formats, str):
+            formats = [formats] * len(shapes)
+        items = []
+        for i in range(len(shapes)):
+            entries = slice(offsets[i], offsets[i + 1])
+            matrix = scipy.sparse.coo_matrix(
+                (data[entries], (row[entries], col[entries])), shape=tuple(shapes[i])
+            )
+            items.append(matrix.asformat(formats[i]))
+    elif encoded["type"] == "ragged":
+        values, offsets, shapes = read("values"), read("offsets"), read("shapes")
+        items = [
+            values[offsets[i] : offsets[i + 1]].reshape(tuple(shapes[i]))
+            for i in range(len(shapes))
+        ]
+    elif encoded["type"] == "nested":
+        lengths = read("lengths")
+        flat_items = _decode(encoded["items"], directory, mmap_mode)
+        boundaries = np.cumsum(lengths)[:-1]
+        items = [
+            _object_array(list(group)) for group in np.split(flat_items, boundaries)
+        ]
+    else:
+        raise ValueError(f"Unknown model data block type '{encoded['type']}'.")
+
+    return _object_array(items, encoded["shape"])
+
+
+def persist_model_data(data: Data, path: Union[Text, Path]) -> None:
+    """Saves the features of a `RasaModelData` as numpy files.
+
+    Every feature array is stored as a few `.npy` blocks in the directory `path`:
+    dense arrays as they are, the examples of ragged and sparse arrays back to back.
+    When loading, the blocks are memory-mapped instead of being deserialized.
+
+    Args:
+        data: The features, e.g. `RasaModelData.data` or a data example.
+        path: Directory to store the features in. It is replaced if it exists.
+    """
+    directory = Path(path)
+    if directory.exists():
+        shutil.rmtree(directory)
+    directory.mkdir(parents=True)
+
+    writer = _BlockWriter(directory)
+    index = {}
+    for key, attribute_data in data.items():
+        index[key] = {}
+        for sub_key, features in attribute_data.items():
+            index[key][sub_key] = [
+                {
+                    "number_of_dimensions": feature_array.number_of_dimensions,
+                    "is_sparse": bool(feature_array.is_sparse),
+                    "units": None
+                    if feature_array.units is None
+                    else int(feature_array.units),
+                    "array": _encode(feature_array.view(np.ndarray), writer),
+                }
+                for feature_array in features
+            ]
+
+    with open(directory / MODEL_DATA_INDEX_FILE, "w") as f:
+        json.dump({"version": MODEL_DATA_FORMAT_VERSION, "data": index}, f)
+
+
+def model_data_exists(path: Union[Text, Path]) -> bool:
+    """Checks if features were persisted at `path` (in any format)."""
+    return (Path(path) / MODEL_DATA_INDEX_FILE).is_file() or os.path.isfile(
+        f"{path}.pkl"
+    )
+
+
+def load_model_data(
+    path: Union[Text, Path], mmap_mode: Optional[Text] = DEFAULT_MMAP_MODE
+) -> Data:
+    """Loads features which were saved with `persist_model_data`.
+
+    Models which were trained before the features were stored as numpy files have
+    pickled them to `<path>.pkl`, these are unpickled.
+
+    Args:
+        path: Directory the features were stored in.
+        mmap_mode: How to memory-map the numpy blocks (see `numpy.load`). `None`
+            reads them into memory.
+
+    Returns:
+        The features.
+    """
+    directory = Path(path)
+    if not (directory / MODEL_DATA_INDEX_FILE).is_file():
+        return io_utils.pickle_load(f"{path}.pkl")
+
+    with open(directory / MODEL_DATA_INDEX_FILE) as f:
+        index = json.load(f)
+
+    data = {}
+    for key, attribute_index in index["data"].items():
+        data[key] = {}
+        for sub_key, features in attribute_index.items():
+            data[key][sub_key] = []
+            for feature in features:
+                feature_array = np.asarray(
+                    _decode(feature["array"], directory, mmap_mode)
+                ).view(FeatureArray)
+                feature_array.number_of_dimensions = feature["number_of_dimensions"]
+                feature_array.is_sparse = feature["is_sparse"]
+                feature_array.units = feature["units"]
+                data[key][sub_key].append(feature_array)
+
+    return data
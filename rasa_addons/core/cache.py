@@ -0,0 +1,149 @@
+import json
+import time
+from collections import OrderedDict
+from threading import RLock
+
+
+_MISSING = object()
+
+
+def _json_size(value):
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by number of entries, bytes and age.
+
+    Entries expire `ttl` seconds after they were last written. When `max_size` or
+    `max_bytes` is exceeded, the least recently used entries are evicted. The size
+    of an entry is measured with `get_size` (only if `max_bytes` is set).
+    `on_evict` is called with the key of every entry which was evicted or expired,
+    after the cache's lock was released.
+    """
+
+    def __init__(
+        self, max_size=None, max_bytes=None, ttl=None, get_size=None, on_evict=None
+    ):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.get_size = get_size or _json_size
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.bytes = 0
+        # key -> (value, size, time of the last write)
+        self._entries = OrderedDict()
+        self._lock = RLock()
+
+    def _is_expired(self, written_at, now):
+        return self.ttl is not None and written_at < now - self.ttl
+
+    def _remove(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def _notify(self, keys):
+        if self.on_evict:
+            for key in keys:
+                self.on_evict(key)
+
+    def get(self, key, default=None):
+        expired = False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._is_expired(entry[2], time.time()):
+                self._remove(key)
+                self.expirations += 1
+                entry, expired = None, True
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+        if expired:
+            self._notify([key])
+        return default if entry is None else entry[0]
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        size = self.get_size(value) if self.max_bytes is not None else 0
+        evicted = []
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, time.time())
+            self.bytes += size
+            while len(self._entries) > 1 and (
+                (self.max_size is not None and len(self._entries) > self.max_size)
+                or (self.max_bytes is not None and self.bytes > self.max_bytes)
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+                evicted.append(oldest)
+        self._notify(evicted)
+
+    def __delitem__(self, key):
+        with self._lock:
+            self._remove(key)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+            value = self._entries[key][0]
+            self._remove(key)
+            return value
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries.keys())
+
+    def clear(self):
+        """Removes all entries without counting them as evictions."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def expire(self):
+        """Removes all expired entries."""
+        if self.ttl is None:
+            return
+        now = time.time()
+        with self._lock:
+            expired = [
+                key
+                for key, (_, _, written_at) in self._entries.items()
+                if self._is_expired(written_at, now)
+            ]
+            for key in expired:
+                self._remove(key)
+            self.expirations += len(expired)
+        self._notify(expired)
+
+    def metrics(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "bytes": self.bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
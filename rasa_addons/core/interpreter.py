@@ -1,22 +1,166 @@
-from typing import Text, Dict, Any, Optional
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from threading import Lock, RLock, Thread
+from typing import Text, Dict, Any, List, Optional, TYPE_CHECKING
 import rasa.core.interpreter
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter
 
+if TYPE_CHECKING:
+    from rasa.nlu.components import Component, ComponentBuilder
+
+logger = logging.getLogger(__name__)
+
+# environment variables to configure the loading of the per-language NLU models
+ENV_NLU_LAZY_LOADING = "NLU_LAZY_LOADING"
+ENV_NLU_MAX_LOADED_LANGUAGES = "NLU_MAX_LOADED_LANGUAGES"
+ENV_NLU_PRELOAD_LANGUAGES = "NLU_PRELOAD_LANGUAGES"
+
+
+def _lazy_loading_from_env() -> bool:
+    return os.environ.get(ENV_NLU_LAZY_LOADING, "false").lower() == "true"
+
+
+def _max_loaded_languages_from_env() -> Optional[int]:
+    max_loaded_languages = os.environ.get(ENV_NLU_MAX_LOADED_LANGUAGES)
+    return int(max_loaded_languages) if max_loaded_languages else None
+
+
+def _preload_languages_from_env() -> List[Text]:
+    languages = os.environ.get(ENV_NLU_PRELOAD_LANGUAGES, "")
+    return [language.strip() for language in languages.split(",") if language.strip()]
+
 
 class MultilingualNLUInterpreter(NaturalLanguageInterpreter):
+    """Parses messages with the NLU model of their language.
+
+    By default the models of all languages are loaded right away. With `lazy_init`
+    a language's model is only loaded for the first message in that language, and
+    at most `max_loaded_languages` models are kept in memory: the least recently
+    used one is unloaded to make room for another language. The models of the
+    `preload_languages` are loaded in a background thread and are never unloaded.
+
+    The languages' models are loaded with the same `component_builder`, so that
+    components with the same cache key are only loaded once. When a language is
+    unloaded, its components which no other loaded language uses are removed from
+    the builder's cache.
+    """
+
     def __init__(
         self,
         model_directory: Dict[Text, Optional[Text]],
         config_file: Optional[Text] = None,
-        lazy_init: bool = False,
+        lazy_init: Optional[bool] = None,
+        max_loaded_languages: Optional[int] = None,
+        preload_languages: Optional[List[Text]] = None,
+        component_builder: Optional["ComponentBuilder"] = None,
     ):
-        self.lazy_init = lazy_init
+        from rasa.nlu.components import ComponentBuilder
+
+        self.model_directory = model_directory
+        # all languages share the components which can be cached, e.g. a
+        # multilingual language model is only loaded once
+        self.component_builder = component_builder or ComponentBuilder(use_cache=True)
+        self.lazy_init = (
+            lazy_init if lazy_init is not None else _lazy_loading_from_env()
+        )
+        self.max_loaded_languages = (
+            max_loaded_languages or _max_loaded_languages_from_env()
+        )
+        if preload_languages is None:
+            preload_languages = _preload_languages_from_env()
+        self.preload_languages = [
+            lang for lang in preload_languages if lang in model_directory
+        ]
         self.config_file = config_file
-        self.interpreters = {
-            lang: rasa.core.interpreter.create_interpreter(model_path)
-            for lang, model_path in model_directory.items()
-        }
+        # set by the agent, so that the cache is invalidated with every new model
+        self.parse_cache = None
+
+        # loaded interpreters, from the least to the most recently used language
+        self.interpreters = OrderedDict()
+        self._lock = RLock()
+        # makes sure that a language is only loaded once at a time
+        self._loading_locks = {lang: Lock() for lang in model_directory}
+
+        if not self.lazy_init:
+            for lang in model_directory:
+                self.load_language(lang)
+        elif self.preload_languages:
+            Thread(target=self._preload, daemon=True).start()
+
+    def _preload(self) -> None:
+        for lang in self.preload_languages:
+            try:
+                self.load_language(lang)
+            except Exception as e:
+                logger.error(f"Could not preload NLU model for '{lang}': {e}")
+
+    def _loaded_interpreter(self, lang: Text) -> Optional[NaturalLanguageInterpreter]:
+        with self._lock:
+            interpreter = self.interpreters.get(lang)
+            if interpreter is not None:
+                self.interpreters.move_to_end(lang)
+            return interpreter
+
+    def load_language(self, lang: Text) -> NaturalLanguageInterpreter:
+        """Returns the interpreter for `lang` and loads it if necessary."""
+        interpreter = self._loaded_interpreter(lang)
+        if interpreter is not None:
+            return interpreter
+
+        if lang not in self.model_directory:
+            raise Exception(f"No NLU model for language '{lang}'.")
+
+        with self._loading_locks[lang]:
+            interpreter = self._loaded_interpreter(lang)
+            if interpreter is not None:
+                return interpreter
+
+            logger.debug(f"Loading NLU model for '{lang}'.")
+            interpreter = rasa.core.interpreter.create_interpreter(
+                self.model_directory[lang], self.component_builder
+            )
+            with self._lock:
+                self.interpreters[lang] = interpreter
+                self._unload_least_recently_used()
+
+        return interpreter
+
+    def _unload_least_recently_used(self) -> None:
+        if not self.lazy_init or not self.max_loaded_languages:
+            return
+
+        unloadable = [
+            lang for lang in self.interpreters if lang not in self.preload_languages
+        ]
+        # the language which was loaded last is the one which is about to be used
+        for lang in unloadable[:-1]:
+            if len(self.interpreters) <= self.max_loaded_languages:
+                break
+            logger.debug(f"Unloading NLU model for '{lang}'.")
+            self._release_components(self.interpreters.pop(lang))
+
+    def _release_components(self, interpreter: NaturalLanguageInterpreter) -> None:
+        # the builder's cache would keep the components of the unloaded model in
+        # memory, unless they are shared with a language which is still loaded
+        shared = [
+            component
+            for loaded_interpreter in self.interpreters.values()
+            for component in self._components(loaded_interpreter)
+        ]
+        self.component_builder.remove_from_cache(
+            component
+            for component in self._components(interpreter)
+            if not any(component is other for other in shared)
+        )
+
+    @staticmethod
+    def _components(interpreter: NaturalLanguageInterpreter) -> List["Component"]:
+        # only the interpreters of Rasa NLU models have a pipeline of components
+        nlu_interpreter = getattr(interpreter, "interpreter", None)
+        return list(getattr(nlu_interpreter, "pipeline", None) or [])
 
     async def parse(
         self,
@@ -34,5 +178,15 @@ class MultilingualNLUInterpreter(NaturalLanguageInterpreter):
         lang = (metadata or {}).get("language") or fallback_language
         if lang is None:
             raise Exception("No language specified.")
-        interpreter = self.interpreters.get(lang)
-        return await interpreter.parse(text)
+
+        interpreter = self._loaded_interpreter(lang)
+        if interpreter is None:
+            # loading a model takes a while, don't block the event loop meanwhile
+            interpreter = await asyncio.get_event_loop().run_in_executor(
+                None, self.load_language, lang
+            )
+
+        if self.parse_cache is None:
+            return await interpreter.parse(text)
+
+        return await self.parse_cache.parse(text, lang, lambda: interpreter.parse(text))
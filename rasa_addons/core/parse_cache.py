@@ -0,0 +1,175 @@
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional, Text, Union
+
+from rasa.utils.endpoints import EndpointConfig
+from rasa_addons.core.cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PARSE_CACHE_SIZE = 10000
+DEFAULT_PARSE_CACHE_TTL = 3600
+DEFAULT_PARSE_CACHE_KEY_PREFIX = "parse"
+
+
+class ParseCache:
+    """Caches parse results by text, language and model fingerprint.
+
+    Results are kept in an in-process LRU cache of at most `max_size` entries and,
+    if a Redis client is given, in Redis so that they are shared between server
+    instances. Entries expire `ttl` seconds after they were written. Setting a new
+    fingerprint (which happens whenever the agent loads a model) drops the local
+    entries; Redis entries of older models are never read again and expire.
+
+    Texts are not normalized, as e.g. casing, whitespace or the Unicode form can
+    change the intent and the positions of extracted entities.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_PARSE_CACHE_SIZE,
+        ttl: Optional[float] = DEFAULT_PARSE_CACHE_TTL,
+        redis: Optional[Any] = None,
+        key_prefix: Text = DEFAULT_PARSE_CACHE_KEY_PREFIX,
+    ):
+        self.ttl = ttl
+        self.key_prefix = key_prefix
+        self.fingerprint = None
+        self.red = redis
+        self.redis_hits = 0
+        self.redis_errors = 0
+        self._local = LRUCache(max_size=max_size, ttl=ttl)
+
+    @classmethod
+    def create(
+        cls, obj: Union["ParseCache", EndpointConfig, None]
+    ) -> Optional["ParseCache"]:
+        """Creates a parse cache from its endpoint configuration.
+
+        Args:
+            obj: Endpoint configuration of type `in_memory` (default) or `redis`, or
+                an already created cache.
+
+        Returns:
+            The cache or `None` if no cache is configured.
+        """
+        if obj is None or isinstance(obj, ParseCache):
+            return obj
+
+        kwargs = dict(obj.kwargs)
+        client = None
+        if obj.type == "redis":
+            import redis.asyncio
+
+            client = redis.asyncio.StrictRedis(
+                host=obj.url or "localhost",
+                port=kwargs.pop("port", 6379),
+                db=kwargs.pop("db", 0),
+                password=kwargs.pop("password", None),
+                ssl=kwargs.pop("use_ssl", False),
+            )
+        elif obj.type not in [None, "in_memory"]:
+            raise ValueError(
+                f"Unknown parse cache type '{obj.type}'. Please use 'in_memory' or "
+                f"'redis'."
+            )
+
+        return cls(
+            max_size=kwargs.get("max_size", DEFAULT_PARSE_CACHE_SIZE),
+            ttl=kwargs.get("ttl", DEFAULT_PARSE_CACHE_TTL),
+            redis=client,
+            key_prefix=kwargs.get("key_prefix", DEFAULT_PARSE_CACHE_KEY_PREFIX),
+        )
+
+    def set_fingerprint(self, fingerprint: Optional[Text]) -> None:
+        """Invalidates the cached results if the model changed."""
+        if fingerprint != self.fingerprint:
+            self.fingerprint = fingerprint
+            self._local.clear()
+
+    def _key(self, text: Text, language: Optional[Text]) -> Text:
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return f"{self.key_prefix}:{self.fingerprint}:{language}:{digest}"
+
+    async def get(
+        self, text: Text, language: Optional[Text] = None
+    ) -> Optional[Dict[Text, Any]]:
+        """Returns the cached parse result for `text` or `None`."""
+        return await self._get(self._key(text, language), text)
+
+    async def _get(self, key: Text, text: Text) -> Optional[Dict[Text, Any]]:
+        result = self._local.get(key)
+
+        if result is None and self.red is not None:
+            try:
+                serialized = await self.red.get(key)
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Could not read parse result from Redis: {e}")
+                serialized = None
+
+            if serialized is not None:
+                self.redis_hits += 1
+                result = json.loads(serialized)
+                self._local[key] = result
+
+        if result is None:
+            return None
+
+        result = copy.deepcopy(result)
+        result["text"] = text
+        return result
+
+    async def set(
+        self, text: Text, language: Optional[Text], result: Dict[Text, Any]
+    ) -> None:
+        """Caches the parse result for `text`."""
+        await self._set(self._key(text, language), result)
+
+    async def _set(self, key: Text, result: Dict[Text, Any]) -> None:
+        self._local[key] = copy.deepcopy(result)
+
+        if self.red is not None:
+            try:
+                ttl = int(self.ttl) if self.ttl is not None else None
+                await self.red.set(key, json.dumps(result), ex=ttl)
+            except Exception as e:
+                self.redis_errors += 1
+                logger.warning(f"Could not write parse result to Redis: {e}")
+
+    async def parse(
+        self,
+        text: Text,
+        language: Optional[Text],
+        parse: Callable[[], Awaitable[Dict[Text, Any]]],
+    ) -> Dict[Text, Any]:
+        """Returns the cached parse result for `text` or caches the one of `parse`.
+
+        The key is computed before parsing, so that a result of the previous model
+        is not cached for a new model which was loaded in the meantime.
+        """
+        key = self._key(text, language)
+        result = await self._get(key, text)
+        if result is None:
+            result = await parse()
+            await self._set(key, result)
+        return result
+
+    def metrics(self) -> Dict[Text, Any]:
+        metrics = self._local.metrics()
+        lookups = metrics["hits"] + metrics["misses"]
+        hits = metrics["hits"] + self.redis_hits
+        metrics.update(
+            {
+                "redis_hits": self.redis_hits,
+                "redis_errors": self.redis_errors,
+                "hit_rate": hits / lookups if lookups else 0.0,
+            }
+        )
+        return metrics
+
+    async def close(self) -> None:
+        if self.red is not None:
+            await self.red.close()
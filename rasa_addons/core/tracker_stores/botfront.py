@@ -1,13 +1,17 @@
+import asyncio
 import logging
+import aiohttp
 import jsonpickle
 import requests
 import time
 import os
 import re
+from collections import OrderedDict
 from threading import Thread
 
 from rasa.core.tracker_store import TrackerStore
 from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
+from rasa_addons.core.cache import LRUCache
 
 from sgqlc.endpoint.http import HTTPEndpoint
 import urllib.error
@@ -62,6 +66,18 @@ mutation updateTracker(
 """
 
 
+DEFAULT_GRAPHQL_TIMEOUT = 10
+DEFAULT_GRAPHQL_RETRIES = 2
+DEFAULT_GRAPHQL_RETRY_BACKOFF = 0.1
+DEFAULT_GRAPHQL_POOL_SIZE = 100
+DEFAULT_GRAPHQL_KEEPALIVE_TIMEOUT = 30
+DEFAULT_WRITE_BEHIND_INTERVAL = 0.5
+DEFAULT_WRITE_BEHIND_BATCH_SIZE = 50
+DEFAULT_WRITE_BEHIND_MAX_PENDING = 1000
+DEFAULT_TRACKER_CACHE_SIZE = 10000
+DEFAULT_TRACKER_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
 def _start_sweeper(tracker_store, break_time):
     while True:
         try:
@@ -77,17 +93,66 @@ class BotfrontTrackerStore(TrackerStore):
         self.tracker_persist_time = kwargs.get("tracker_persist_time", 3600)
         self.test_tracker_persist_time = kwargs.get("test_tracker_persist_time", 240)
         self.max_events = kwargs.get("max_events", 100)
-        self.trackers = {}
-        self.test_trackers = {}
-        self.trackers_info = (
-            {}
-        )  # in this stucture we will keep the last index and the last timestamp of events in the db for a said tracker
+        tracker_cache_size = kwargs.get(
+            "tracker_cache_size", DEFAULT_TRACKER_CACHE_SIZE
+        )
+        self.trackers = LRUCache(
+            max_size=tracker_cache_size,
+            max_bytes=kwargs.get(
+                "tracker_cache_max_bytes", DEFAULT_TRACKER_CACHE_MAX_BYTES
+            ),
+            ttl=self.tracker_persist_time,
+            on_evict=self._forget_tracker_info,
+        )
+        self.test_trackers = LRUCache(
+            max_size=tracker_cache_size, ttl=self.test_tracker_persist_time
+        )
+        # in this stucture we will keep the last index and the last timestamp of events in the db for a said tracker
+        # it has to be evicted together with the local copy of the tracker, otherwise
+        # the next `retrieve` would merge the local copy with the whole remote tracker
+        self.trackers_info = LRUCache(
+            max_size=tracker_cache_size,
+            ttl=self.tracker_persist_time,
+            on_evict=self._forget_tracker,
+        )
         self.sweeper = Thread(target=_start_sweeper, args=(self, 30))
         self.sweeper.setDaemon(True)
         self.sweeper.start()
         api_key = os.environ.get("API_KEY")
-        headers = [{"Authorization": api_key}] if api_key else []
+        self.graphql_headers = {"Authorization": api_key} if api_key else {}
+        headers = [self.graphql_headers] if api_key else []
         self.graphql_endpoint = HTTPEndpoint(host, *headers)
+        # settings of the `aiohttp` session used by `retrieve_async` / `save_async`
+        self.graphql_timeout = kwargs.get("graphql_timeout", DEFAULT_GRAPHQL_TIMEOUT)
+        self.graphql_retries = kwargs.get("graphql_retries", DEFAULT_GRAPHQL_RETRIES)
+        self.graphql_retry_backoff = kwargs.get(
+            "graphql_retry_backoff", DEFAULT_GRAPHQL_RETRY_BACKOFF
+        )
+        self.graphql_pool_size = kwargs.get(
+            "graphql_pool_size", DEFAULT_GRAPHQL_POOL_SIZE
+        )
+        self.graphql_keepalive_timeout = kwargs.get(
+            "graphql_keepalive_timeout", DEFAULT_GRAPHQL_KEEPALIVE_TIMEOUT
+        )
+        self._session = None
+        # with `write_behind`, `save_async` only queues the tracker; the queued
+        # trackers are sent in batches by a background task
+        self.write_behind = kwargs.get("write_behind", False)
+        self.write_behind_interval = kwargs.get(
+            "write_behind_interval", DEFAULT_WRITE_BEHIND_INTERVAL
+        )
+        self.write_behind_batch_size = kwargs.get(
+            "write_behind_batch_size", DEFAULT_WRITE_BEHIND_BATCH_SIZE
+        )
+        self.write_behind_max_pending = kwargs.get(
+            "write_behind_max_pending", DEFAULT_WRITE_BEHIND_MAX_PENDING
+        )
+        # sender_id -> (latest serialised tracker, whether it has to be inserted,
+        # timestamp of the last event stored in Botfront when it was queued)
+        self._pending_saves = OrderedDict()
+        self._flusher = None
+        self._flush_requested = None
+        self._flush_lock = None
         self.host = host
         self.environement = os.environ.get("BOTFRONT_ENV", "development")
         self.botfront_test_regex = re.compile('^bot_regression_test_')
@@ -146,6 +211,237 @@ class BotfrontTrackerStore(TrackerStore):
         )
         return data.get("updateTrackerStore")
 
+    def _get_session(self):
+        # the session is created lazily as it has to be bound to the running event
+        # loop; it's shared by all requests so that connections are kept alive
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                headers=self.graphql_headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.graphql_pool_size,
+                    keepalive_timeout=self.graphql_keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.graphql_timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._flusher is not None:
+            await self.flush()
+            self._flusher.cancel()
+            self._flusher = None
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    async def _graphql_query_async(
+        self, query, params, idempotent=True, operation="getting the tracker from"
+    ):
+        # queries are retried on any network error or timeout. Mutations are only
+        # retried if the connection could not be established, as otherwise Botfront
+        # might have stored the events already.
+        retry_on = (
+            (aiohttp.ClientError, asyncio.TimeoutError)
+            if idempotent
+            else aiohttp.ClientConnectorError
+        )
+        session = self._get_session()
+        attempt = 0
+        while True:
+            try:
+                async with session.post(
+                    self.host, json={"query": query, "variables": params}
+                ) as resp:
+                    resp.raise_for_status()
+                    response = await resp.json(content_type=None)
+                break
+            except retry_on as e:
+                if attempt >= self.graphql_retries:
+                    logger.error(f"Something went wrong {operation} {self.host}: {e!r}")
+                    return {}
+                await asyncio.sleep(self.graphql_retry_backoff * 2 ** attempt)
+                attempt += 1
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                logger.error(f"Something went wrong {operation} {self.host}: {e!r}")
+                return {}
+
+        if response.get("errors"):
+            message = ", ".join([e.get("message") for e in response.get("errors")])
+            logger.error(f"Something went wrong {operation} {self.host}: {message}")
+        # fields which were resolved are returned even if others failed
+        return response.get("data") or {}
+
+    async def _fetch_tracker_async(self, sender_id, lastIndex):
+        data = await self._graphql_query_async(
+            GET_TRACKER,
+            {
+                "senderId": sender_id,
+                "projectId": self.project_id,
+                "after": lastIndex,
+                "maxEvents": self.max_events,
+            },
+        )
+        return data.get("trackerStore")
+
+    async def _insert_tracker_gql_async(self, sender_id, tracker):
+        data = await self._graphql_query_async(
+            INSERT_TRACKER,
+            {
+                "senderId": sender_id,
+                "projectId": self.project_id,
+                "tracker": tracker,
+                "env": self.environement,
+            },
+            idempotent=False,
+            operation="inserting the tracker into",
+        )
+        return data.get("insertTrackerStore")
+
+    async def _update_tracker_gql_async(self, sender_id, tracker):
+        data = await self._graphql_query_async(
+            UPDATE_TRACKER,
+            {
+                "senderId": sender_id,
+                "projectId": self.project_id,
+                "tracker": tracker,
+                "env": self.environement,
+            },
+            idempotent=False,
+            operation="updating the tracker in",
+        )
+        return data.get("updateTrackerStore")
+
+    def _batch_mutation(self, saves):
+        # a single GraphQL document with one aliased mutation per tracker
+        definitions = ["$projectId: String!", "$env: Environement"]
+        fields = []
+        variables = {"projectId": self.project_id, "env": self.environement}
+        for i, (sender_id, tracker, is_new) in enumerate(saves):
+            definitions += [f"$senderId{i}: String!", f"$tracker{i}: Any"]
+            mutation = "insertTrackerStore" if is_new else "updateTrackerStore"
+            fields.append(
+                f"t{i}: {mutation}(senderId: $senderId{i}, projectId: $projectId, "
+                f"tracker: $tracker{i}, env: $env) {{ lastIndex lastTimestamp }}"
+            )
+            variables[f"senderId{i}"] = sender_id
+            variables[f"tracker{i}"] = tracker
+        query = "mutation saveTrackers({}) {{\n    {}\n}}".format(
+            ", ".join(definitions), "\n    ".join(fields)
+        )
+        return query, variables
+
+    def _ensure_flusher(self):
+        if self._flusher is None or self._flusher.done():
+            self._flush_requested = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flusher = asyncio.ensure_future(self._flush_periodically())
+
+    async def _flush_periodically(self):
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._flush_requested.wait(), self.write_behind_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+            ## wraped in a try block so if an exception occurs it does not stop the flushes
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Could not save trackers to {self.host}: {e}")
+
+    async def flush(self):
+        """Sends all queued trackers to Botfront."""
+        if not self._pending_saves:
+            return
+        # flushes must not overlap, as the events to send depend on the last
+        # timestamp stored by the previous flush
+        async with self._flush_lock:
+            pending, self._pending_saves = self._pending_saves, OrderedDict()
+            saves = [
+                (
+                    sender_id,
+                    serialized_tracker
+                    if is_new
+                    else self._new_events_only(
+                        sender_id, serialized_tracker, last_timestamp
+                    ),
+                    is_new,
+                )
+                for sender_id, (
+                    serialized_tracker,
+                    is_new,
+                    last_timestamp,
+                ) in pending.items()
+            ]
+            for start in range(0, len(saves), self.write_behind_batch_size):
+                batch = saves[start : start + self.write_behind_batch_size]
+                query, variables = self._batch_mutation(batch)
+                try:
+                    data = await self._graphql_query_async(
+                        query,
+                        variables,
+                        idempotent=False,
+                        operation="saving the trackers to",
+                    )
+                except Exception as e:
+                    logger.error(f"Could not save trackers to {self.host}: {e}")
+                    data = {}
+                for i, (sender_id, _, is_new) in enumerate(batch):
+                    tracker_info = data.get(f"t{i}")
+                    if tracker_info is None:
+                        # failed saves are sent again with the next flush
+                        self._requeue_save(sender_id, *pending[sender_id])
+                    else:
+                        self._on_tracker_saved(sender_id, tracker_info)
+
+    def _requeue_save(self, sender_id, serialized_tracker, is_new, last_timestamp):
+        queued = self._pending_saves.get(sender_id)
+        if queued:
+            # the tracker was saved again in the meantime, its latest version
+            # contains the events of the failed save
+            serialized_tracker, is_new = queued[0], queued[1] or is_new
+        # nothing was stored, so the events after the same timestamp are sent again
+        self._pending_saves[sender_id] = (serialized_tracker, is_new, last_timestamp)
+
+    def _on_tracker_saved(self, sender_id, tracker_info):
+        if sender_id in self.trackers:
+            self._store_tracker_info(sender_id, tracker_info)
+        # otherwise the local copy was evicted while the tracker was sent, and the
+        # next `retrieve` has to fetch the whole tracker again
+        queued = self._pending_saves.get(sender_id)
+        if queued:
+            # the tracker was saved again while it was sent, only the events after
+            # the ones which were just stored are new
+            self._pending_saves[sender_id] = (
+                queued[0],
+                False,
+                tracker_info["lastTimestamp"] or 0,
+            )
+
+    async def _queue_save(self, sender_id, serialized_tracker):
+        self._ensure_flusher()
+        if (
+            sender_id not in self._pending_saves
+            and len(self._pending_saves) >= self.write_behind_max_pending
+        ):
+            # back-pressure: wait for the queued trackers to be sent
+            await self.flush()
+        queued = self._pending_saves.get(sender_id)
+        if queued:
+            _, is_new, last_timestamp = queued
+        else:
+            # the timestamp is kept with the queued tracker, as the tracker info can
+            # be evicted before the tracker is sent
+            is_new = sender_id not in self.trackers
+            last_timestamp = self._get_last_timestamp(sender_id)
+        # the latest tracker contains all events of the previous saves
+        self._pending_saves[sender_id] = (serialized_tracker, is_new, last_timestamp)
+        self.trackers[sender_id] = serialized_tracker
+        if len(self._pending_saves) >= self.write_behind_batch_size:
+            self._flush_requested.set()
+
     def _get_last_index(self, sender_id):
         info = self.trackers_info.get(sender_id, -1)
         if info == -1:
@@ -171,11 +467,30 @@ class BotfrontTrackerStore(TrackerStore):
                 "last_timestamp": tracker_info["lastTimestamp"],
             }
 
-    def save(self, canonical_tracker):
-        serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
+    def _save_test_tracker(self, canonical_tracker):
         sender_id = canonical_tracker.sender_id
         if self.botfront_test_regex.match(sender_id):
             self.test_trackers[sender_id] = canonical_tracker
+            return True
+        return False
+
+    def _new_events_only(self, sender_id, serialized_tracker, last_timestamp=None):
+        # Insert only the new examples
+        if last_timestamp is None:
+            last_timestamp = self._get_last_timestamp(sender_id)
+        new_events = list(
+            filter(
+                lambda x: x["timestamp"] > last_timestamp, serialized_tracker["events"],
+            )
+        )
+        tracker_shallow_copy = {key: val for key, val in serialized_tracker.items()}
+        tracker_shallow_copy["events"] = new_events
+        return tracker_shallow_copy
+
+    def save(self, canonical_tracker):
+        serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
+        sender_id = canonical_tracker.sender_id
+        if self._save_test_tracker(canonical_tracker):
             return serialized_tracker["events"]
         # call the event broker below the test exit so that the logs aren't filled with testing data
         if self.event_broker:
@@ -186,27 +501,51 @@ class BotfrontTrackerStore(TrackerStore):
 
         if tracker is None:  # the tracker does not exist localy ( first save)
             updated_info = self._insert_tracker_gql(sender_id, serialized_tracker)
-            self.trackers[sender_id] = serialized_tracker
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            return serialized_tracker["events"]
         else:  # the tracker  exist localy
-            # Insert only the new examples
-            last_timestamp = self._get_last_timestamp(sender_id)
-            new_events = list(
-                filter(
-                    lambda x: x["timestamp"] > last_timestamp,
-                    serialized_tracker["events"],
-                )
-            )
-            tracker_shallow_copy = {key: val for key, val in serialized_tracker.items()}
-            tracker_shallow_copy["events"] = new_events
             # only send the new events to the remote tracker
-            updated_info = self._update_tracker_gql(sender_id, tracker_shallow_copy)
-            # update the last index and last time stamp for future uses
-            self._store_tracker_info(sender_id, updated_info)
-            self.trackers[sender_id] = serialized_tracker
+            updated_info = self._update_tracker_gql(
+                sender_id, self._new_events_only(sender_id, serialized_tracker)
+            )
+        self.trackers[sender_id] = serialized_tracker
+        # update the last index and last time stamp for future uses
+        self._store_tracker_info(sender_id, updated_info)
+        return serialized_tracker["events"]
+
+    async def save_async(self, canonical_tracker):
+        serialized_tracker = self._serialize_tracker_to_dict(canonical_tracker)
+        sender_id = canonical_tracker.sender_id
+        if self._save_test_tracker(canonical_tracker):
             return serialized_tracker["events"]
+        if self.event_broker:
+            self.stream_events(canonical_tracker)
+
+        if self.write_behind:
+            await self._queue_save(sender_id, serialized_tracker)
+            return serialized_tracker["events"]
+
+        tracker = self.trackers.get(sender_id)
+
+        if tracker is None:
+            updated_info = await self._insert_tracker_gql_async(
+                sender_id, serialized_tracker
+            )
+        else:
+            updated_info = await self._update_tracker_gql_async(
+                sender_id, self._new_events_only(sender_id, serialized_tracker)
+            )
+        self.trackers[sender_id] = serialized_tracker
+        self._store_tracker_info(sender_id, updated_info)
+        return serialized_tracker["events"]
+
+    def number_of_existing_events(self, sender_id):
+        # the local copy is synced with Botfront on every `retrieve`, so there is
+        # no need to fetch the remote tracker again just to count its events
+        tracker = self.trackers.get(sender_id)
+        if tracker is None:
+            # the local copy was evicted (or the tracker is new), so the tracker
+            # which `retrieve` returns has to be fetched to count its events
+            return super().number_of_existing_events(sender_id)
+        return len(tracker.get("events", []))
 
     def _convert_tracker(self, sender_id, tracker):
         if self.domain:
@@ -240,12 +579,7 @@ class BotfrontTrackerStore(TrackerStore):
             self.trackers[sender_id] = remote_tracker
             return remote_tracker
 
-    def retrieve(self, sender_id):
-        if self.botfront_test_regex.match(sender_id):
-            return self.test_trackers.get(sender_id)
-        last_index = self._get_last_index(sender_id)
-        # retreive all new info since the last sync (given by last index)
-        new_tracker_info = self._fetch_tracker(sender_id, last_index)
+    def _merge_remote_tracker(self, sender_id, new_tracker_info):
         current_tracker = self.trackers.get(sender_id)
         # do not chane the order of these ifs
         # ortherwise you will get synchornication issues when working with multiple rasa instances
@@ -262,33 +596,39 @@ class BotfrontTrackerStore(TrackerStore):
         # the tracker exist localy an there is no new infos
         return self._convert_tracker(sender_id, current_tracker)
 
-    def cleanup_trackers(self, trackers, persist_time):
-        for key in list(
-            trackers.keys()
-        ):
-            ## wraped in a try block so if an exception occurs it does not stop the sweep mechanism
-            try:
-                tracker = trackers.get(key)
-                max_event_time = time.time() - persist_time
-                latest_event = float("inf")
-                try:
-                    latest_event = tracker.latest_message.timestamp
-                except:
-                    latest_event = tracker.get("latest_event_time", float("inf"))
-                    pass
-                if latest_event < max_event_time:
-                    logger.debug("SWEEPER: Removing botfront test tracker {}".format(key))
-                    if key in trackers:
-                        del trackers[key]
-                    if key in self.trackers_info:
-                        del self.trackers_info[key]
-            except Exception as e:
-                print(e)
-                pass
+    def retrieve(self, sender_id):
+        if self.botfront_test_regex.match(sender_id):
+            return self.test_trackers.get(sender_id)
+        last_index = self._get_last_index(sender_id)
+        # retreive all new info since the last sync (given by last index)
+        new_tracker_info = self._fetch_tracker(sender_id, last_index)
+        return self._merge_remote_tracker(sender_id, new_tracker_info)
+
+    async def retrieve_async(self, sender_id):
+        if self.botfront_test_regex.match(sender_id):
+            return self.test_trackers.get(sender_id)
+        last_index = self._get_last_index(sender_id)
+        new_tracker_info = await self._fetch_tracker_async(sender_id, last_index)
+        return self._merge_remote_tracker(sender_id, new_tracker_info)
+
+    def _forget_tracker_info(self, sender_id):
+        logger.debug("Removing local copy of tracker {}".format(sender_id))
+        self.trackers_info.pop(sender_id)
+
+    def _forget_tracker(self, sender_id):
+        self.trackers.pop(sender_id)
 
     def sweep(self):
-        self.cleanup_trackers(self.test_trackers, self.test_tracker_persist_time)
-        self.cleanup_trackers(self.trackers, self.tracker_persist_time)
+        self.test_trackers.expire()
+        self.trackers.expire()
+        self.trackers_info.expire()
+
+    def cache_metrics(self):
+        return {
+            "trackers": self.trackers.metrics(),
+            "test_trackers": self.test_trackers.metrics(),
+            "trackers_info": self.trackers_info.metrics(),
+        }
 
     @staticmethod
     def _serialize_tracker_to_dict(canonical_tracker):
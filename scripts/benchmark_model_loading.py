@@ -0,0 +1,97 @@
+"""Compares the start-up time of a Rasa model packaged with different compressions.
+
+    python scripts/benchmark_model_loading.py models/my-model.tar.gz --load-agent
+
+The model is repackaged as `tar.gz`, uncompressed `tar` and (if `zstandard` is
+installed) `tar.zst`. For every format the time to unpack the model and, with
+`--load-agent`, the time to load the agent from it are measured in a fresh process.
+The archives are read once beforehand, so all formats start with a warm page cache.
+"""
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+from typing import Dict, List, Text
+
+from rasa.constants import MODEL_ARCHIVE_EXTENSIONS, MODEL_COMPRESSION_ZSTD
+
+
+def _package(model_path: Text, directory: Text) -> Dict[Text, Text]:
+    from rasa.model import create_package_rasa, unpack_model
+
+    try:
+        import zstandard  # noqa: F401
+
+        compressions = list(MODEL_ARCHIVE_EXTENSIONS)
+    except ImportError:
+        compressions = [
+            compression
+            for compression in MODEL_ARCHIVE_EXTENSIONS
+            if compression != MODEL_COMPRESSION_ZSTD
+        ]
+
+    archives = {}
+    for compression in compressions:
+        output_path = os.path.join(
+            directory, f"model{MODEL_ARCHIVE_EXTENSIONS[compression]}"
+        )
+        create_package_rasa(unpack_model(model_path), output_path)
+        archives[compression] = output_path
+    return archives
+
+
+def _measure(model_path: Text, load_agent: bool, results: Dict) -> None:
+    from rasa.core.agent import Agent
+    from rasa.model import unpack_model
+
+    start = time.perf_counter()
+    unpacked_model = unpack_model(model_path)
+    unpacked = time.perf_counter()
+    if load_agent:
+        Agent.load(unpacked_model)
+
+    results[model_path] = (unpacked - start, time.perf_counter() - start)
+
+
+def _warm_page_cache(paths: List[Text]) -> None:
+    for path in paths:
+        with open(path, "rb") as f:
+            while f.read(1024 * 1024):
+                pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("model", help="Path to a trained model archive.")
+    parser.add_argument(
+        "--load-agent",
+        action="store_true",
+        help="Also measure loading the agent from the unpacked model.",
+    )
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Manager().dict()
+    with tempfile.TemporaryDirectory() as directory:
+        archives = _package(args.model, directory)
+        _warm_page_cache(list(archives.values()))
+
+        for archive in archives.values():
+            process = context.Process(
+                target=_measure, args=(archive, args.load_agent, results)
+            )
+            process.start()
+            process.join()
+
+        for compression, archive in archives.items():
+            unpack_time, total_time = results[archive]
+            size = os.path.getsize(archive) / 1024 ** 2
+            line = f"{compression}: {size:.1f}MB, unpacked in {unpack_time:.2f}s"
+            if args.load_agent:
+                line += f", agent loaded after {total_time:.2f}s"
+            print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measures the response latency of a running Rasa server under concurrent load.
+
+Start the server with the inference executor which should be measured, e.g.
+
+    INFERENCE_EXECUTOR=process INFERENCE_WORKERS=4 rasa run --enable-api
+
+and run
+
+    python scripts/benchmark_rest_latency.py --clients 100 --messages 20
+
+Every client is a separate conversation which sends its messages one after the
+other to the REST channel, so the number of clients is the number of requests
+which are in flight at the same time.
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Text
+
+import aiohttp
+import numpy as np
+
+DEFAULT_MESSAGES = ["hello", "I am sad", "yes", "no", "goodbye"]
+
+
+async def _client(
+    session: aiohttp.ClientSession,
+    url: Text,
+    sender_id: Text,
+    number_of_messages: int,
+    latencies: List[float],
+) -> None:
+    for i in range(number_of_messages):
+        message = DEFAULT_MESSAGES[i % len(DEFAULT_MESSAGES)]
+        start = time.perf_counter()
+        async with session.post(
+            url, json={"sender": sender_id, "message": message}
+        ) as response:
+            response.raise_for_status()
+            await response.read()
+        latencies.append(time.perf_counter() - start)
+
+
+async def run_benchmark(url: Text, clients: int, messages: int) -> List[float]:
+    latencies = []
+    connector = aiohttp.TCPConnector(limit=clients)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        await asyncio.gather(
+            *[
+                _client(session, url, f"benchmark-{i}", messages, latencies)
+                for i in range(clients)
+            ]
+        )
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--url", default="http://localhost:5005/webhooks/rest/webhook")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--messages", type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    latencies = asyncio.get_event_loop().run_until_complete(
+        run_benchmark(args.url, args.clients, args.messages)
+    )
+    duration = time.perf_counter() - start
+
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99]) * 1000
+    print(
+        f"{len(latencies)} requests in {duration:.1f}s "
+        f"({len(latencies) / duration:.1f} requests/s)\n"
+        f"p50: {p50:.0f}ms, p95: {p95:.0f}ms, p99: {p99:.0f}ms, "
+        f"max: {max(latencies) * 1000:.0f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Measures how long a `RulePolicy` with many rules takes to predict an action.
+
+    python scripts/benchmark_rule_policy.py --intents 500 --predictions 1000
+
+Rules are generated the way Botfront generates them for every intent: one rule
+which answers the intent and one which answers it differently if a slot is set.
+The policy is trained on them and predicts the next action for random
+conversations, once with the rule index and once checking every rule.
+"""
+import argparse
+import random
+import time
+from typing import List, Set, Text
+
+from rasa.core.policies.rule_policy import RulePolicy
+from rasa.shared.core.constants import ACTION_LISTEN_NAME, RULE_SNIPPET_ACTION_NAME
+from rasa.shared.core.domain import Domain, State
+from rasa.shared.core.events import ActionExecuted, SlotSet, UserUttered
+from rasa.shared.core.generator import TrackerWithCachedStates
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.interpreter import RegexInterpreter
+
+
+class _RulePolicyWithoutIndex(RulePolicy):
+    def _get_possible_keys(self, lookup_name: Text, states: List[State]) -> Set[Text]:
+        reversed_rule_states = self._rule_index(lookup_name).reversed_rule_states
+        possible_keys = set(self.lookup[lookup_name].keys())
+        for i, state in enumerate(reversed(states)):
+            possible_keys = {
+                key
+                for key in possible_keys
+                if self._is_rule_applicable(reversed_rule_states[key], i, state)
+            }
+        return possible_keys
+
+
+def _domain(number_of_intents: int) -> Domain:
+    intents = [f"intent_{i}" for i in range(number_of_intents)]
+    return Domain.from_dict(
+        {
+            "intents": intents,
+            "slots": {"logged_in": {"type": "bool"}},
+            "actions": [f"utter_{intent}" for intent in intents]
+            + [f"utter_{intent}_logged_in" for intent in intents],
+        }
+    )
+
+
+def _rules(domain: Domain) -> List[TrackerWithCachedStates]:
+    rules = []
+    for intent in domain.intents:
+        for logged_in in [False, True]:
+            condition = [SlotSet("logged_in", True)] if logged_in else []
+            action_name = (
+                f"utter_{intent}_logged_in" if logged_in else f"utter_{intent}"
+            )
+            rules.append(
+                TrackerWithCachedStates.from_events(
+                    f"{intent} {logged_in}",
+                    domain=domain,
+                    slots=domain.slots,
+                    evts=condition
+                    + [
+                        ActionExecuted(RULE_SNIPPET_ACTION_NAME),
+                        ActionExecuted(ACTION_LISTEN_NAME),
+                        UserUttered(intent={"name": intent}),
+                        ActionExecuted(action_name),
+                        ActionExecuted(ACTION_LISTEN_NAME),
+                    ],
+                    is_rule_tracker=True,
+                )
+            )
+    return rules
+
+
+def _conversations(
+    domain: Domain, number_of_conversations: int
+) -> List[DialogueStateTracker]:
+    conversations = []
+    for i in range(number_of_conversations):
+        events = [ActionExecuted(ACTION_LISTEN_NAME)]
+        for _ in range(random.randint(1, 5)):
+            intent = random.choice(domain.intents)
+            events += [
+                UserUttered(intent={"name": intent}),
+                ActionExecuted(f"utter_{intent}"),
+                ActionExecuted(ACTION_LISTEN_NAME),
+            ]
+        events.append(UserUttered(intent={"name": random.choice(domain.intents)}))
+        conversations.append(
+            DialogueStateTracker.from_events(str(i), events, domain.slots)
+        )
+    return conversations
+
+
+def _measure(
+    policy: RulePolicy, conversations: List[DialogueStateTracker], domain: Domain
+) -> float:
+    interpreter = RegexInterpreter()
+    start = time.perf_counter()
+    for tracker in conversations:
+        policy.predict_action_probabilities(tracker, domain, interpreter)
+    return (time.perf_counter() - start) / len(conversations)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "--intents",
+        type=int,
+        default=500,
+        help="Number of intents. Two rules are generated per intent.",
+    )
+    parser.add_argument(
+        "--predictions", type=int, default=1000, help="Number of predictions."
+    )
+    args = parser.parse_args()
+
+    random.seed(42)
+    domain = _domain(args.intents)
+    rules = _rules(domain)
+    conversations = _conversations(domain, args.predictions)
+
+    for name, policy_class in [
+        ("indexed", RulePolicy),
+        ("without index", _RulePolicyWithoutIndex),
+    ]:
+        policy = policy_class(check_for_contradictions=False)
+        policy.train(rules, domain, RegexInterpreter())
+        seconds = _measure(policy, conversations, domain)
+        print(f"{name}: {len(rules)} rules, {seconds * 1000:.2f}ms per prediction")
+
+
+if __name__ == "__main__":
+    main()
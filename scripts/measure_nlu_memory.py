@@ -0,0 +1,70 @@
+"""Measures start-up time and memory of loading all languages of a Rasa model.
+
+    python scripts/measure_nlu_memory.py models/my-model.tar.gz
+
+The model's languages are loaded once with one component builder shared by all
+languages (components with the same cache key, e.g. a multilingual language model,
+are loaded once) and once with a separate builder per language. Every variant runs
+in a fresh process, so that the peak memory of one does not hide the other.
+"""
+import argparse
+import multiprocessing
+import resource
+import sys
+import time
+from typing import Dict, Text
+
+
+def _peak_memory_in_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes everywhere else
+    return peak / 1024 ** 2 if sys.platform == "darwin" else peak / 1024
+
+
+def _load(model_path: Text, share_components: bool, results: Dict) -> None:
+    import rasa.core.interpreter
+    from rasa.model import get_model, get_model_subdirectories
+    from rasa.nlu.components import ComponentBuilder
+
+    unpacked_model = get_model(model_path)
+    _, nlu_models = get_model_subdirectories(unpacked_model)
+    memory_before = _peak_memory_in_mb()
+    shared_builder = ComponentBuilder(use_cache=True)
+
+    start = time.perf_counter()
+    for nlu_model in nlu_models.values():
+        component_builder = shared_builder if share_components else ComponentBuilder()
+        rasa.core.interpreter.create_interpreter(nlu_model, component_builder)
+
+    results[share_components] = (
+        len(nlu_models),
+        time.perf_counter() - start,
+        _peak_memory_in_mb() - memory_before,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("model", help="Path to a trained model archive or directory.")
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Manager().dict()
+    for share_components in [False, True]:
+        process = context.Process(
+            target=_load, args=(args.model, share_components, results)
+        )
+        process.start()
+        process.join()
+
+    for share_components in [False, True]:
+        languages, duration, memory = results[share_components]
+        label = "shared builder" if share_components else "builder per language"
+        print(
+            f"{label}: {languages} languages loaded in {duration:.1f}s, "
+            f"+{memory:.0f}MB peak memory"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+from _pytest.monkeypatch import MonkeyPatch
+
+import rasa.core.interpreter
+from rasa.nlu.components import ComponentBuilder
+from rasa.shared.nlu.interpreter import RegexInterpreter
+from rasa_addons.core.interpreter import MultilingualNLUInterpreter
+
+LANGUAGES = {"en": "nlu-en", "fr": "nlu-fr", "de": "nlu-de"}
+
+
+@pytest.fixture
+def loaded_models(monkeypatch: MonkeyPatch):
+    loaded_models = []
+
+    def create_interpreter(model_path, component_builder=None):
+        loaded_models.append(model_path)
+        return RegexInterpreter()
+
+    monkeypatch.setattr(rasa.core.interpreter, "create_interpreter", create_interpreter)
+    return loaded_models
+
+
+async def _parse(interpreter, language):
+    return await interpreter.parse("/greet", metadata={"language": language})
+
+
+def test_all_languages_are_loaded_by_default(loaded_models):
+    interpreter = MultilingualNLUInterpreter(LANGUAGES, lazy_init=False)
+
+    assert loaded_models == ["nlu-en", "nlu-fr", "nlu-de"]
+    assert list(interpreter.interpreters) == ["en", "fr", "de"]
+
+
+async def test_languages_are_loaded_on_first_message(loaded_models):
+    interpreter = MultilingualNLUInterpreter(LANGUAGES, lazy_init=True)
+    assert loaded_models == []
+
+    result = await _parse(interpreter, "fr")
+    await _parse(interpreter, "fr")
+
+    assert result["intent"]["name"] == "greet"
+    assert loaded_models == ["nlu-fr"]
+
+
+async def test_least_recently_used_language_is_unloaded(loaded_models):
+    interpreter = MultilingualNLUInterpreter(
+        LANGUAGES, lazy_init=True, max_loaded_languages=2
+    )
+
+    for language in ["en", "fr", "en", "de"]:
+        await _parse(interpreter, language)
+
+    assert list(interpreter.interpreters) == ["en", "de"]
+
+    await _parse(interpreter, "fr")
+
+    assert loaded_models == ["nlu-en", "nlu-fr", "nlu-de", "nlu-fr"]
+
+
+async def test_preloaded_languages_stay_loaded(loaded_models):
+    interpreter = MultilingualNLUInterpreter(
+        LANGUAGES, lazy_init=True, max_loaded_languages=1, preload_languages=["en"]
+    )
+
+    deadline = time.time() + 5
+    while "en" not in interpreter.interpreters and time.time() < deadline:
+        time.sleep(0.01)
+
+    for language in ["fr", "de"]:
+        await _parse(interpreter, language)
+
+    assert set(interpreter.interpreters) == {"en", "de"}
+
+
+async def test_parse_with_unknown_language(loaded_models):
+    interpreter = MultilingualNLUInterpreter(LANGUAGES, lazy_init=True)
+
+    with pytest.raises(Exception):
+        await _parse(interpreter, "it")
+
+
+def test_languages_share_component_builder(monkeypatch: MonkeyPatch):
+    component_builders = []
+
+    def create_interpreter(model_path, component_builder=None):
+        component_builders.append(component_builder)
+        return RegexInterpreter()
+
+    monkeypatch.setattr(rasa.core.interpreter, "create_interpreter", create_interpreter)
+
+    interpreter = MultilingualNLUInterpreter(LANGUAGES, lazy_init=False)
+
+    assert len(component_builders) == len(LANGUAGES)
+    assert all(
+        builder is interpreter.component_builder for builder in component_builders
+    )
+
+
+def test_unloaded_language_is_removed_from_component_cache(monkeypatch: MonkeyPatch):
+    component_builder = ComponentBuilder(use_cache=True)
+    shared_component = Mock()
+    components = {"en": Mock(), "fr": Mock()}
+    component_builder.component_cache = {
+        "shared": shared_component,
+        "en": components["en"],
+        "fr": components["fr"],
+    }
+
+    def create_interpreter(model_path, component_builder=None):
+        language = model_path.split("-")[-1]
+        return Mock(interpreter=Mock(pipeline=[shared_component, components[language]]))
+
+    monkeypatch.setattr(rasa.core.interpreter, "create_interpreter", create_interpreter)
+
+    interpreter = MultilingualNLUInterpreter(
+        {"en": "nlu-en", "fr": "nlu-fr"},
+        lazy_init=True,
+        max_loaded_languages=1,
+        component_builder=component_builder,
+    )
+    interpreter.load_language("en")
+    interpreter.load_language("fr")
+
+    # the component which "fr" shares stays cached
+    assert component_builder.component_cache == {
+        "shared": shared_component,
+        "fr": components["fr"],
+    }
@@ -0,0 +1,155 @@
+import fakeredis
+from fakeredis import aioredis
+
+from rasa.core.agent import Agent
+from rasa.core.interpreter import RasaNLUInterpreter
+from rasa.shared.nlu.interpreter import RegexInterpreter
+from rasa.utils.endpoints import EndpointConfig
+from rasa_addons.core.interpreter import MultilingualNLUInterpreter
+from rasa_addons.core.parse_cache import ParseCache
+
+
+class CountingInterpreter(RegexInterpreter):
+    def __init__(self):
+        self.parsed = []
+
+    async def parse(self, text, message_id=None, tracker=None, metadata=None):
+        self.parsed.append(text)
+        return {"text": text, "intent": {"name": "greet", "confidence": 1.0}}
+
+
+def _multilingual_interpreter(parse_cache):
+    interpreter = MultilingualNLUInterpreter({"en": None, "fr": None}, lazy_init=True)
+    interpreter.interpreters.update(
+        {"en": CountingInterpreter(), "fr": CountingInterpreter()}
+    )
+    interpreter.parse_cache = parse_cache
+    return interpreter
+
+
+async def test_parse_results_are_cached_per_language():
+    interpreter = _multilingual_interpreter(ParseCache())
+
+    for language in ["en", "en", "fr"]:
+        result = await interpreter.parse("hello", metadata={"language": language})
+        assert result["intent"]["name"] == "greet"
+
+    assert interpreter.interpreters["en"].parsed == ["hello"]
+    assert interpreter.interpreters["fr"].parsed == ["hello"]
+    metrics = interpreter.parse_cache.metrics()
+    assert metrics["hits"] == 1
+    assert metrics["misses"] == 2
+    assert metrics["hit_rate"] == 1 / 3
+
+
+async def test_parse_cache_is_bounded():
+    parse_cache = ParseCache(max_size=2)
+    parse_cache.set_fingerprint("model")
+
+    for text in ["a", "b", "c"]:
+        await parse_cache.set(text, "en", {"text": text})
+
+    assert await parse_cache.get("a", "en") is None
+    assert await parse_cache.get("c", "en") == {"text": "c"}
+    assert parse_cache.metrics()["evictions"] == 1
+
+
+async def test_parse_cache_keys_on_exact_text():
+    parse_cache = ParseCache()
+    parse_cache.set_fingerprint("model")
+    composed, decomposed = "caf\u00e9 ok", "cafe\u0301 ok"
+    entity = {"entity": "word", "start": 5, "end": 7, "value": "ok"}
+
+    await parse_cache.set(composed, "en", {"text": composed, "entities": [entity]})
+
+    # the decomposed text has a different length, so the entity offsets differ
+    assert await parse_cache.get(decomposed, "en") is None
+    assert (await parse_cache.get(composed, "en"))["entities"] == [entity]
+
+
+async def test_parse_cache_is_shared_through_redis():
+    server = fakeredis.FakeServer()
+    first = ParseCache(redis=aioredis.FakeRedis(server=server))
+    second = ParseCache(redis=aioredis.FakeRedis(server=server))
+    for parse_cache in [first, second]:
+        parse_cache.set_fingerprint("model")
+
+    await first.set("hello", "en", {"text": "hello", "entities": []})
+
+    assert await second.get("hello", "en") == {"text": "hello", "entities": []}
+    assert second.metrics()["redis_hits"] == 1
+    # the result is kept locally afterwards
+    assert await second.get("hello", "en") is not None
+    assert second.metrics()["redis_hits"] == 1
+
+    second.set_fingerprint("other model")
+    assert await second.get("hello", "en") is None
+
+
+def test_create_parse_cache_from_endpoint_config():
+    parse_cache = ParseCache.create(
+        EndpointConfig(type="in_memory", max_size=5, ttl=10)
+    )
+
+    assert parse_cache.red is None
+    assert parse_cache.ttl == 10
+    assert ParseCache.create(None) is None
+
+
+async def test_parse_cache_is_invalidated_when_model_is_updated():
+    parse_cache = ParseCache()
+    interpreter = _multilingual_interpreter(None)
+    agent = Agent(interpreter=interpreter, fingerprint="old", parse_cache=parse_cache)
+
+    assert interpreter.parse_cache is parse_cache
+    await interpreter.parse("hello", metadata={"language": "en"})
+    assert parse_cache.metrics()["size"] == 1
+
+    new_interpreter = _multilingual_interpreter(None)
+    agent.update_model(None, None, "new", new_interpreter)
+
+    assert parse_cache.fingerprint == "new"
+    assert parse_cache.metrics()["size"] == 0
+    assert new_interpreter.parse_cache is parse_cache
+
+
+async def test_parse_result_is_cached_for_model_which_parsed_it():
+    parse_cache = ParseCache()
+    parse_cache.set_fingerprint("old")
+
+    async def parse():
+        # a new model is loaded while the old one parses the message
+        parse_cache.set_fingerprint("new")
+        return {"text": "hello", "intent": {"name": "old_intent"}}
+
+    await parse_cache.parse("hello", "en", parse)
+
+    assert await parse_cache.get("hello", "en") is None
+
+
+async def test_parse_cache_is_used_by_rasa_nlu_interpreter(monkeypatch):
+    parse_cache = ParseCache()
+    interpreter = RasaNLUInterpreter("model", lazy_init=True)
+    interpreter.interpreter = object()
+    parsed = []
+
+    async def parse(text):
+        parsed.append(text)
+        return {"text": text}
+
+    monkeypatch.setattr(interpreter, "_parse", parse)
+    agent = Agent(interpreter=interpreter, fingerprint="model", parse_cache=parse_cache)
+
+    for _ in range(2):
+        assert await interpreter.parse("hello") == {"text": "hello"}
+
+    assert agent.uses_parse_cache()
+    assert parsed == ["hello"]
+
+
+def test_parse_cache_is_not_used_by_regex_interpreter():
+    agent = Agent(
+        interpreter=RegexInterpreter(), fingerprint="model", parse_cache=ParseCache()
+    )
+
+    assert not agent.uses_parse_cache()
@@ -0,0 +1,317 @@
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa_addons.core.tracker_stores.botfront import BotfrontTrackerStore
+
+STUB_LATENCY = 0.1
+
+
+def _stub_graphql_app(requests, failures=0, failing_senders=()):
+    # answers like Botfront would, after some latency
+    remaining_failures = [failures]
+
+    async def handler(request):
+        body = await request.json()
+        requests.append(body)
+        if remaining_failures[0] > 0:
+            remaining_failures[0] -= 1
+            return web.Response(status=503)
+        await asyncio.sleep(STUB_LATENCY)
+        info = {"lastIndex": len(requests), "lastTimestamp": time.time()}
+        if body["query"].strip().startswith("query"):
+            return web.json_response({"data": {"trackerStore": None}})
+        if "saveTrackers" in body["query"]:
+            variables = body["variables"]
+            senders = [k for k in variables if k.startswith("senderId")]
+            data = {
+                f"t{i}": {
+                    "lastIndex": len(requests),
+                    "lastTimestamp": max(
+                        e["timestamp"] for e in variables[f"tracker{i}"]["events"]
+                    ),
+                }
+                for i in range(len(senders))
+            }
+            errors = []
+            for i in range(len(senders)):
+                if variables[f"senderId{i}"] in failing_senders:
+                    data[f"t{i}"] = None
+                    errors.append({"message": "could not save", "path": [f"t{i}"]})
+            return web.json_response({"data": data, "errors": errors})
+        if "insertTracker" in body["query"]:
+            return web.json_response({"data": {"insertTrackerStore": info}})
+        return web.json_response({"data": {"updateTrackerStore": info}})
+
+    app = web.Application()
+    app.router.add_post("/graphql", handler)
+    return app
+
+
+async def _start_stub_server(requests, failures=0, failing_senders=()):
+    server = TestServer(_stub_graphql_app(requests, failures, failing_senders))
+    await server.start_server()
+    return server
+
+
+async def test_retrieve_async_does_not_block_event_loop():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(), str(server.make_url("/graphql"))
+    )
+    number_of_conversations = 20
+
+    start = time.time()
+    trackers = await asyncio.gather(
+        *[
+            tracker_store.retrieve_async(f"sender_{i}")
+            for i in range(number_of_conversations)
+        ]
+    )
+    duration = time.time() - start
+
+    await tracker_store.close()
+    await server.close()
+
+    assert trackers == [None] * number_of_conversations
+    assert len(requests) == number_of_conversations
+    # blocking calls would take at least `number_of_conversations * STUB_LATENCY`
+    assert duration < number_of_conversations * STUB_LATENCY / 2
+
+
+async def test_save_async_only_sends_new_events():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(), str(server.make_url("/graphql"))
+    )
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted("action_listen", timestamp=1)]
+    )
+
+    await tracker_store.save_async(tracker)
+    tracker.update(UserUttered("hi", timestamp=time.time() + 10))
+    await tracker_store.save_async(tracker)
+
+    await tracker_store.close()
+    await server.close()
+
+    insert, update = requests
+    assert "insertTracker" in insert["query"]
+    assert len(insert["variables"]["tracker"]["events"]) == 1
+    assert "updateTracker" in update["query"]
+    assert [e["event"] for e in update["variables"]["tracker"]["events"]] == ["user"]
+    assert len(tracker_store.trackers["sender"]["events"]) == 2
+
+
+async def test_retrieve_async_retries_failed_requests():
+    requests = []
+    server = await _start_stub_server(requests, failures=2)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        graphql_retries=2,
+        graphql_retry_backoff=0,
+    )
+
+    await tracker_store.retrieve_async("sender")
+    await tracker_store.close()
+    await server.close()
+
+    assert len(requests) == 3
+
+
+async def test_save_async_does_not_retry_mutations_after_response():
+    requests = []
+    server = await _start_stub_server(requests, failures=1)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        graphql_retries=2,
+        graphql_retry_backoff=0,
+    )
+    tracker = DialogueStateTracker.from_events(
+        "sender", [ActionExecuted("action_listen")]
+    )
+
+    await tracker_store.save_async(tracker)
+    await tracker_store.close()
+    await server.close()
+
+    assert len(requests) == 1
+
+
+def _tracker(sender_id, number_of_events):
+    return DialogueStateTracker.from_events(
+        sender_id,
+        [ActionExecuted("action_listen", timestamp=i) for i in range(number_of_events)],
+    )
+
+
+async def test_write_behind_coalesces_saves_per_sender():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+    )
+
+    for number_of_events in [1, 2]:
+        for sender_id in ["sender_1", "sender_2"]:
+            await tracker_store.save_async(_tracker(sender_id, number_of_events))
+
+    assert requests == []
+    # the local copies are up to date before the trackers were sent
+    assert len(tracker_store.trackers["sender_1"]["events"]) == 2
+
+    await tracker_store.flush()
+
+    (batch,) = requests
+    assert batch["query"].count("insertTrackerStore") == 2
+    assert len(batch["variables"]["tracker0"]["events"]) == 2
+    assert len(batch["variables"]["tracker1"]["events"]) == 2
+    assert tracker_store.trackers_info["sender_1"]["last_index"] == 1
+
+    await tracker_store.save_async(_tracker("sender_1", 3))
+    await tracker_store.close()
+    await server.close()
+
+    # trackers which are still queued are sent on shutdown
+    assert len(requests) == 2
+    assert "updateTrackerStore" in requests[1]["query"]
+    # only the event which wasn't sent yet
+    assert len(requests[1]["variables"]["tracker0"]["events"]) == 1
+
+
+async def test_write_behind_flushes_when_batch_is_full():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+        write_behind_batch_size=2,
+    )
+
+    await tracker_store.save_async(_tracker("sender_1", 1))
+    await tracker_store.save_async(_tracker("sender_2", 1))
+    await asyncio.sleep(STUB_LATENCY * 3)
+
+    assert len(requests) == 1
+
+    await tracker_store.close()
+    await server.close()
+
+
+async def test_write_behind_applies_back_pressure():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+        write_behind_max_pending=2,
+    )
+
+    for sender_id in ["sender_1", "sender_2", "sender_3"]:
+        await tracker_store.save_async(_tracker(sender_id, 1))
+
+    # the third save had to wait until the first two trackers were sent
+    assert len(requests) == 1
+    assert list(tracker_store._pending_saves.keys()) == ["sender_3"]
+
+    await tracker_store.close()
+    await server.close()
+
+
+async def test_write_behind_requeues_failed_batches():
+    requests = []
+    server = await _start_stub_server(requests, failures=1)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+    )
+
+    await tracker_store.save_async(_tracker("sender", 1))
+    await tracker_store.flush()
+
+    # the tracker still has to be inserted
+    assert tracker_store._pending_saves["sender"][1] is True
+
+    await tracker_store.save_async(_tracker("sender", 2))
+    await tracker_store.flush()
+
+    assert len(requests) == 2
+    assert "insertTrackerStore" in requests[1]["query"]
+    assert len(requests[1]["variables"]["tracker0"]["events"]) == 2
+    assert tracker_store._pending_saves == {}
+
+    await tracker_store.close()
+    await server.close()
+
+
+async def test_write_behind_requeues_only_failed_saves_of_batch():
+    requests = []
+    server = await _start_stub_server(requests, failing_senders=["sender_2"])
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+    )
+
+    for sender_id in ["sender_1", "sender_2"]:
+        await tracker_store.save_async(_tracker(sender_id, 1))
+    await tracker_store.flush()
+
+    assert "sender_1" in tracker_store.trackers_info
+    assert "sender_2" not in tracker_store.trackers_info
+    assert list(tracker_store._pending_saves.items()) == [
+        ("sender_2", (tracker_store.trackers["sender_2"], True, 0))
+    ]
+
+    await tracker_store.close()
+    await server.close()
+
+
+async def test_write_behind_sends_only_new_events_of_evicted_trackers():
+    requests = []
+    server = await _start_stub_server(requests)
+    tracker_store = BotfrontTrackerStore(
+        Domain.empty(),
+        str(server.make_url("/graphql")),
+        write_behind=True,
+        write_behind_interval=60,
+        tracker_cache_size=1,
+    )
+
+    await tracker_store.save_async(_tracker("sender_1", 2))
+    await tracker_store.flush()
+    await tracker_store.save_async(_tracker("sender_1", 3))
+    # evicts the local copy and the tracker info of the queued tracker
+    await tracker_store.save_async(_tracker("sender_2", 1))
+    assert "sender_1" not in tracker_store.trackers_info
+
+    await tracker_store.flush()
+    await tracker_store.close()
+    await server.close()
+
+    batch = requests[1]
+    assert batch["variables"]["senderId0"] == "sender_1"
+    assert "t0: updateTrackerStore" in batch["query"]
+    # only the event which wasn't sent yet
+    assert len(batch["variables"]["tracker0"]["events"]) == 1
+    # without a local copy the next `retrieve` has to fetch the whole tracker
+    assert "sender_1" not in tracker_store.trackers_info
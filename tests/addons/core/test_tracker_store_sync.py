@@ -1,36 +1,92 @@
 from rasa_addons.core.tracker_stores.botfront import BotfrontTrackerStore
 from unittest.mock import MagicMock
+
+from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from test_tracker_store_sync_data import *
 
 # case where a client connect to a different rasa instance in between ( eg:rasa1, rasa2, rasa1 )
 # the local data should be updated
 def test_should_properly_update_tracker():
 
-    testTrackerStore = BotfrontTrackerStore(domain=None, host='test')
-    #tracker with 1 event
-    testTrackerStore._fetch_tracker = MagicMock(return_value = tracker1 )
-    testTrackerStore.retrieve('test')
+    testTrackerStore = BotfrontTrackerStore(domain=None, host="test")
+    # tracker with 1 event
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker1)
+    testTrackerStore.retrieve("test")
 
-    #tracker with  new 1 event
-    testTrackerStore._fetch_tracker = MagicMock(return_value = tracker2)
-    testTrackerStore.retrieve('test')
-    assert (
-            testTrackerStore.trackers['test'] == merged_tracker_1
-        ) 
+    # tracker with  new 1 event
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker2)
+    testTrackerStore.retrieve("test")
+    assert testTrackerStore.trackers["test"] == merged_tracker_1
 
 
 # case where a client connect to the same rasa instance everytime
 # the local data should not be updated
 def test_should_not_update_events():
 
-    testTrackerStore = BotfrontTrackerStore(domain=None, host='test')
-     #tracker with 1 event
-    testTrackerStore._fetch_tracker = MagicMock(return_value = tracker1 )
-    testTrackerStore.retrieve('test')
-
-     #tracker with  new no new event
-    testTrackerStore._fetch_tracker = MagicMock(return_value = tracker3)
-    testTrackerStore.retrieve('test')
-    assert (
-            testTrackerStore.trackers['test'] == merged_tracker_2
-        ) 
+    testTrackerStore = BotfrontTrackerStore(domain=None, host="test")
+    # tracker with 1 event
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker1)
+    testTrackerStore.retrieve("test")
+
+    # tracker with  new no new event
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker3)
+    testTrackerStore.retrieve("test")
+    assert testTrackerStore.trackers["test"] == merged_tracker_2
+
+
+# the local copy and the sync info of a tracker should always be evicted together
+# otherwise the next retrieve would merge the local copy with the whole remote tracker
+def test_evicted_trackers_are_synced_from_scratch():
+
+    testTrackerStore = BotfrontTrackerStore(
+        domain=None, host="test", tracker_cache_size=1
+    )
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker1)
+    testTrackerStore.retrieve("test")
+    testTrackerStore.retrieve("other")
+
+    assert "test" not in testTrackerStore.trackers
+    assert "test" not in testTrackerStore.trackers_info
+
+    testTrackerStore.retrieve("test")
+    testTrackerStore._fetch_tracker.assert_called_with("test", -1)
+    metrics = testTrackerStore.cache_metrics()
+    assert metrics["trackers"]["size"] == 1
+    assert metrics["trackers_info"]["evictions"] == 2
+
+
+def test_expired_trackers_are_swept():
+
+    testTrackerStore = BotfrontTrackerStore(
+        domain=None, host="test", tracker_persist_time=-1
+    )
+    testTrackerStore._fetch_tracker = MagicMock(return_value=tracker1)
+    testTrackerStore.retrieve("test")
+    testTrackerStore.sweep()
+
+    assert len(testTrackerStore.trackers) == 0
+    assert len(testTrackerStore.trackers_info) == 0
+    assert testTrackerStore.cache_metrics()["trackers"]["expirations"] == 1
+
+
+def test_number_of_existing_events_of_evicted_tracker():
+    tracker = DialogueStateTracker.from_events(
+        "test", [ActionExecuted("action_listen"), UserUttered("hi")]
+    )
+    remote_tracker = {
+        "tracker": tracker.current_state(EventVerbosity.ALL),
+        "lastIndex": 2,
+        "lastTimestamp": tracker.events[-1].timestamp,
+    }
+    tracker_store = BotfrontTrackerStore(
+        domain=Domain.empty(), host="test", tracker_cache_size=1
+    )
+    tracker_store._fetch_tracker = MagicMock(return_value=remote_tracker)
+    tracker_store.retrieve("test")
+    tracker_store.retrieve("other")
+
+    assert "test" not in tracker_store.trackers
+    assert tracker_store.number_of_existing_events("test") == 2
+    tracker_store._fetch_tracker.assert_called_with("test", -1)
@@ -1,3 +1,4 @@
+import random
 from typing import Text
 
 import numpy as np
@@ -9,7 +10,18 @@ from rasa.core.featurizers.tracker_featurizers import (
     FullDialogueTrackerFeaturizer,
     MaxHistoryTrackerFeaturizer,
 )
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
 from rasa.shared.core.domain import Domain
+from rasa.shared.core.events import (
+    ActionExecuted,
+    ActionReverted,
+    ActiveLoop,
+    Restarted,
+    SlotSet,
+    UserUttered,
+    UserUtteranceReverted,
+)
+from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.nlu.interpreter import RegexInterpreter
 from tests.core.conftest import DEFAULT_DOMAIN_PATH_WITH_SLOTS
 from tests.core.utilities import tracker_from_dialogue_file
@@ -96,3 +108,53 @@ def test_featurize_trackers_with_max_history_tracker_featurizer(moodbot_domain:
     assert len(labels) == 7
     # moodbot doesn't contain e2e entities
     assert not any([any(turn_tags) for turn_tags in entity_tags])
+
+
+def _random_conversation(seed: int, domain: Domain) -> DialogueStateTracker:
+    rng = random.Random(seed)
+    intent = {"name": "greet", "confidence": 1.0}
+    steps = [
+        lambda: [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", intent, [{"entity": "name", "value": rng.random()}]),
+        ],
+        lambda: [ActionExecuted(rng.choice(["utter_greet", "utter_goodbye"]))],
+        lambda: [SlotSet("name", rng.choice(["Peter", None]))],
+        lambda: [ActionExecuted("loop"), ActiveLoop("loop")],
+        lambda: [ActiveLoop(None)],
+        lambda: [ActionReverted()],
+        lambda: [UserUtteranceReverted()],
+        lambda: [Restarted()],
+    ]
+
+    tracker = DialogueStateTracker("some-id", domain.slots)
+    for _ in range(rng.randint(1, 40)):
+        for event in rng.choices(steps, weights=[5, 5, 2, 2, 1, 1, 1, 1])[0]():
+            tracker.update(event, domain)
+    return tracker
+
+
+@pytest.mark.parametrize("seed", range(20))
+@pytest.mark.parametrize("max_history", [1, 2, 5])
+@pytest.mark.parametrize("use_text_for_last_user_input", [True, False])
+def test_prediction_states_with_max_history_equal_full_history(
+    seed: int,
+    max_history: int,
+    use_text_for_last_user_input: bool,
+    default_domain: Domain,
+):
+    tracker = _random_conversation(seed, default_domain)
+    tracker_featurizer = MaxHistoryTrackerFeaturizer(max_history=max_history)
+
+    all_states = default_domain.states_for_tracker_history(tracker)
+    expected_states = [tracker_featurizer.slice_state_history(all_states, max_history)]
+    tracker_featurizer._choose_last_user_input(
+        expected_states, use_text_for_last_user_input
+    )
+
+    assert (
+        tracker_featurizer.prediction_states(
+            [tracker], default_domain, use_text_for_last_user_input
+        )
+        == expected_states
+    )
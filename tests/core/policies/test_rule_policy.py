@@ -1,8 +1,11 @@
 from pathlib import Path
-from typing import Text, Optional
+from typing import List, Text, Optional
+from unittest.mock import Mock
 
 import pytest
 
+from rasa.core.policies.ensemble import SimplePolicyEnsemble
+from rasa.core.policies.memoization import MemoizationPolicy
 from rasa.core.policies.policy import PolicyPrediction
 from rasa.shared.constants import DEFAULT_NLU_FALLBACK_INTENT_NAME
 
@@ -29,10 +32,16 @@ from rasa.shared.core.events import (
     SlotSet,
     ActionExecutionRejected,
     LoopInterrupted,
+    Event,
 )
 from rasa.shared.nlu.interpreter import RegexInterpreter
 from rasa.core.nlg import TemplatedNaturalLanguageGenerator
-from rasa.core.policies.rule_policy import RulePolicy, InvalidRule
+from rasa.core.policies.rule_policy import (
+    RulePolicy,
+    InvalidRule,
+    RULES,
+    RULES_FOR_LOOP_UNHAPPY_PATH,
+)
 from rasa.shared.core.trackers import DialogueStateTracker
 from rasa.shared.core.generator import TrackerWithCachedStates
 
@@ -1936,3 +1945,115 @@ def test_predict_nothing_if_fallback_disabled():
     )
 
     assert prediction.max_confidence == 0
+
+
+@pytest.mark.parametrize(
+    "conversation_events",
+    [
+        [],
+        [ActionExecuted(ACTION_LISTEN_NAME)],
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "bye"})],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": GREET_INTENT_NAME}),
+        ],
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": "bye"}),
+            ActionExecuted("some_form"),
+            ActiveLoop("some_form"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            UserUttered("hi", {"name": GREET_INTENT_NAME}),
+        ],
+        [
+            ActiveLoop("some_form"),
+            ActionExecuted("some_form"),
+            ActiveLoop(None),
+            SlotSet(REQUESTED_SLOT, None),
+        ],
+    ],
+)
+def test_indexed_rules_are_the_applicable_rules(conversation_events: List[Event]):
+    form_name = "some_form"
+    domain = Domain.from_yaml(
+        f"""
+        intents:
+        - {GREET_INTENT_NAME}
+        - bye
+        actions:
+        - {UTTER_GREET_ACTION}
+        - some-action
+        slots:
+          {REQUESTED_SLOT}:
+            type: unfeaturized
+        forms:
+        - {form_name}
+    """
+    )
+    policy = RulePolicy()
+    policy.train(
+        [
+            GREET_RULE,
+            _form_activation_rule(domain, form_name, "bye"),
+            _form_submit_rule(domain, "some-action", form_name),
+        ],
+        domain,
+        RegexInterpreter(),
+    )
+    tracker = DialogueStateTracker.from_events(
+        "casd", evts=conversation_events, slots=domain.slots
+    )
+    states = policy.featurizer.prediction_states([tracker], domain)[0]
+
+    for lookup_name in [RULES, RULES_FOR_LOOP_UNHAPPY_PATH]:
+        reversed_rule_states = policy._rule_index(lookup_name).reversed_rule_states
+        applicable_rules = {
+            rule_key
+            for rule_key in policy.lookup[lookup_name]
+            if all(
+                policy._is_rule_applicable(reversed_rule_states[rule_key], i, state)
+                for i, state in enumerate(reversed(states))
+            )
+        }
+        assert policy._get_possible_keys(lookup_name, states) == applicable_rules
+
+
+def test_rules_are_matched_against_the_latest_states_only():
+    domain = Domain.from_yaml(
+        f"""
+        intents:
+        - {GREET_INTENT_NAME}
+        actions:
+        - {UTTER_GREET_ACTION}
+    """
+    )
+    policy = RulePolicy()
+    policy.train([GREET_RULE], domain, RegexInterpreter())
+    longest_rule = max(
+        len(RulePolicy._rule_key_to_state(rule_key))
+        for rule_key in policy.lookup[RULES]
+    )
+    assert policy.number_of_prediction_states() == longest_rule
+
+    greet = [
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("hi", {"name": GREET_INTENT_NAME}),
+    ]
+    events = [*greet, ActionExecuted(UTTER_GREET_ACTION)] * 20 + greet
+
+    tracker = DialogueStateTracker.from_events("casd", evts=events, slots=domain.slots)
+    tracker.past_states = Mock(wraps=tracker.past_states)
+    prediction = policy.predict_action_probabilities(
+        tracker, domain, RegexInterpreter()
+    )
+
+    assert all(
+        call[0][1] == longest_rule for call in tracker.past_states.call_args_list
+    )
+    assert prediction.max_confidence_index == domain.index_for_action(
+        UTTER_GREET_ACTION
+    )
+
+    # the ensemble prepares the states for the rules instead of the whole history
+    ensemble = SimplePolicyEnsemble([policy, MemoizationPolicy(max_history=2)])
+    assert ensemble._number_of_featurized_states() == max(longest_rule, 2)
@@ -1,8 +1,13 @@
 import asyncio
+import base64
+import gzip
+import hashlib
 from pathlib import Path
 from typing import Any, Dict, Text, List, Callable, Optional
 from unittest.mock import Mock
 
+from yarl import URL
+
 import pytest
 from _pytest.logging import LogCaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
@@ -29,7 +34,11 @@ from rasa.utils.endpoints import EndpointConfig
 from tests.core.conftest import DEFAULT_DOMAIN_PATH_WITH_SLOTS
 
 
-def model_server_app(model_path: Text, model_hash: Text = "somehash") -> Sanic:
+def model_server_app(
+    model_path: Text,
+    model_hash: Text = "somehash",
+    headers: Optional[Dict[Text, Text]] = None,
+) -> Sanic:
     app = Sanic(__name__)
     app.number_of_model_requests = 0
 
@@ -44,7 +53,7 @@ def model_server_app(model_path: Text, model_hash: Text = "somehash") -> Sanic:
 
         return await response.file_stream(
             location=model_path,
-            headers={"ETag": model_hash, "filename": model_path},
+            headers={"ETag": model_hash, "filename": model_path, **(headers or {})},
             mime_type="application/gzip",
         )
 
@@ -59,6 +68,39 @@ def model_server(
     return loop.run_until_complete(sanic_client(app))
 
 
+class EncodedModelResponse:
+    def __init__(self, body: bytes, headers: Dict[Text, Text], url: Text) -> None:
+        self.headers = headers
+        self.content_length = len(body)
+        # small chunks, so that the body is decoded in several steps
+        self.content = Mock(iter_chunked=lambda _: self._chunks(body))
+        self.url = URL(url)
+
+    @staticmethod
+    async def _chunks(body: bytes):
+        for start in range(0, len(body), 10):
+            yield body[start : start + 10]
+
+
+async def test_download_model_archive_with_content_encoding():
+    archive = b"model archive" * 100
+    body = gzip.compress(archive)
+    response = EncodedModelResponse(
+        body,
+        {
+            "Content-Encoding": "gzip",
+            "Content-MD5": base64.b64encode(hashlib.md5(body).digest()).decode(),
+        },
+        "http://server/models/model.tar.zst",
+    )
+
+    archive_path = await rasa.core.agent._download_model_archive(response)
+
+    assert archive_path.endswith(".tar.zst")
+    assert Path(archive_path).read_bytes() == archive
+    Path(archive_path).unlink()
+
+
 async def test_training_data_is_reproducible():
     training_data_file = "examples/moodbot/data/stories.yml"
     agent = Agent(
@@ -225,6 +267,116 @@ async def test_pull_model_with_invalid_domain(
     assert error_message in caplog.text
 
 
+def _base64_digest(path: Text, algorithm: Text) -> Text:
+    model_hash = hashlib.new(algorithm, Path(path).read_bytes())
+    return base64.b64encode(model_hash.digest()).decode()
+
+
+@pytest.mark.parametrize(
+    "headers, is_loaded",
+    [
+        ({}, True),
+        ({"Content-MD5": base64.b64encode(b"not the model").decode()}, False),
+        ({"Digest": "sha-256=" + base64.b64encode(b"not the model").decode()}, False),
+    ],
+)
+async def test_pull_model_verifies_checksum(
+    sanic_client: Callable,
+    trained_rasa_model: Text,
+    headers: Dict[Text, Text],
+    is_loaded: bool,
+):
+    app = model_server_app(trained_rasa_model, headers=headers)
+    model_server = await sanic_client(app)
+    model_endpoint_config = EndpointConfig.from_dict(
+        {"url": model_server.make_url("/model"), "wait_time_between_pulls": None}
+    )
+
+    agent = Agent()
+    await rasa.core.agent.load_from_server(agent, model_server=model_endpoint_config)
+
+    assert agent.is_ready() == is_loaded
+
+
+@pytest.mark.parametrize("algorithm, header", [("md5", "md5"), ("sha256", "sha-256")])
+async def test_pull_model_with_correct_checksum(
+    sanic_client: Callable, trained_rasa_model: Text, algorithm: Text, header: Text
+):
+    digest = _base64_digest(trained_rasa_model, algorithm)
+    app = model_server_app(trained_rasa_model, headers={"Digest": f"{header}={digest}"})
+    model_server = await sanic_client(app)
+    model_endpoint_config = EndpointConfig.from_dict(
+        {"url": model_server.make_url("/model"), "wait_time_between_pulls": None}
+    )
+
+    agent = Agent()
+    await rasa.core.agent.load_from_server(agent, model_server=model_endpoint_config)
+
+    assert agent.is_ready()
+    assert agent.fingerprint == "somehash"
+
+
+async def test_pull_model_with_etag_checksum(
+    sanic_client: Callable, trained_rasa_model: Text
+):
+    etag = hashlib.md5(Path(trained_rasa_model).read_bytes()).hexdigest()
+    app = model_server_app(trained_rasa_model, model_hash=f'"{etag}"')
+    model_server = await sanic_client(app)
+    model_endpoint_config = EndpointConfig.from_dict(
+        {
+            "url": model_server.make_url("/model"),
+            "wait_time_between_pulls": None,
+            "verify_etag": True,
+        }
+    )
+
+    agent = Agent()
+    await rasa.core.agent.load_from_server(agent, model_server=model_endpoint_config)
+
+    assert agent.is_ready()
+
+
+async def test_model_is_swapped_after_warm_up(
+    unpacked_trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    agent = Agent(fingerprint="old")
+    warm_ups = []
+    warm_up_model = rasa.core.agent._warm_up_model
+
+    def warm_up(*args: Any) -> None:
+        # the current model is still used while the new one warms up
+        warm_ups.append((agent.fingerprint, agent.pending_model_directory))
+        warm_up_model(*args)
+
+    monkeypatch.setattr(rasa.core.agent, "_warm_up_model", warm_up)
+
+    await rasa.core.agent.load_and_set_updated_model_in_background(
+        agent, unpacked_trained_rasa_model, "new"
+    )
+
+    assert warm_ups == [("old", unpacked_trained_rasa_model)]
+    assert agent.fingerprint == "new"
+    assert agent.pending_model_directory is None
+    assert agent.policy_ensemble is not None
+
+
+async def test_failed_warm_up_does_not_prevent_model_swap(
+    unpacked_trained_rasa_model: Text, monkeypatch: MonkeyPatch
+):
+    agent = Agent(fingerprint="old")
+    monkeypatch.setattr(
+        SimplePolicyEnsemble,
+        "probabilities_using_best_policy",
+        Mock(side_effect=ValueError("broken")),
+    )
+
+    await rasa.core.agent.load_and_set_updated_model_in_background(
+        agent, unpacked_trained_rasa_model, "new"
+    )
+
+    assert agent.fingerprint == "new"
+
+
 async def test_load_agent(trained_rasa_model: Text):
     agent = await load_agent(model_path=trained_rasa_model)
 
@@ -1,6 +1,6 @@
 from pathlib import Path
 from typing import List, Any, Text, Optional, Union
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from _pytest.capture import CaptureFixture
 from _pytest.monkeypatch import MonkeyPatch
@@ -30,7 +30,11 @@ import rasa.core.actions.action
 
 from tests.core import utilities
 from rasa.core.constants import FORM_POLICY_PRIORITY
-from rasa.shared.core.events import ActionExecuted, DefinePrevUserUtteredFeaturization
+from rasa.shared.core.events import (
+    ActionExecuted,
+    ActionExecutionRejected,
+    DefinePrevUserUtteredFeaturization,
+)
 from rasa.core.policies.two_stage_fallback import TwoStageFallbackPolicy
 from rasa.core.policies.mapping_policy import MappingPolicy
 from rasa.shared.core.constants import (
@@ -717,3 +721,86 @@ def test_is_not_in_training_data(
         SimplePolicyEnsemble.is_not_in_training_data(policy_name, confidence)
         == not_in_training_data
     )
+
+
+class BatchConstantPolicy(ConstantPolicy):
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.batch_sizes = []
+
+    def predict_action_probabilities_batch(
+        self,
+        trackers: List[DialogueStateTracker],
+        domain: Domain,
+        interpreter: NaturalLanguageInterpreter,
+        **kwargs: Any,
+    ) -> List[PolicyPrediction]:
+        self.batch_sizes.append(len(trackers))
+        return super().predict_action_probabilities_batch(
+            trackers, domain, interpreter, **kwargs
+        )
+
+
+def test_batch_prediction_equals_single_predictions(default_domain: Domain):
+    batch_policy = BatchConstantPolicy(priority=2, predict_index=1, confidence=0.8)
+    ensemble = SimplePolicyEnsemble(
+        [ConstantPolicy(priority=1, predict_index=0, confidence=0.9), batch_policy]
+    )
+    rejected_action = default_domain.action_names_or_texts[0]
+    trackers = [
+        DialogueStateTracker.from_events("no events", evts=[]),
+        DialogueStateTracker.from_events(
+            "rejected action",
+            evts=[
+                ActionExecuted(ACTION_LISTEN_NAME),
+                ActionExecutionRejected(rejected_action),
+            ],
+        ),
+        DialogueStateTracker.from_events(
+            "after user message",
+            evts=[ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi")],
+        ),
+    ]
+
+    predictions = ensemble.probabilities_using_best_policy_batch(
+        trackers, default_domain, RegexInterpreter()
+    )
+
+    # every policy which supports it predicts all trackers at once
+    assert batch_policy.batch_sizes == [len(trackers)]
+    assert [prediction.policy_name for prediction in predictions] == [
+        f"policy_0_{ConstantPolicy.__name__}",
+        f"policy_1_{BatchConstantPolicy.__name__}",
+        f"policy_0_{ConstantPolicy.__name__}",
+    ]
+    for tracker, prediction in zip(trackers, predictions):
+        expected = ensemble.probabilities_using_best_policy(
+            tracker, default_domain, RegexInterpreter()
+        )
+        assert prediction.probabilities == expected.probabilities
+        assert prediction.events == expected.events
+
+
+def test_policies_share_past_states(default_domain: Domain):
+    ensemble = SimplePolicyEnsemble(
+        [MemoizationPolicy(), MemoizationPolicy(max_history=2)]
+    )
+    tracker = DialogueStateTracker.from_events(
+        "test",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            utilities.user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+        ],
+        default_domain.slots,
+    )
+
+    with patch.object(
+        default_domain, "get_active_states", wraps=default_domain.get_active_states,
+    ) as get_active_states:
+        ensemble.probabilities_using_best_policy(
+            tracker, default_domain, RegexInterpreter()
+        )
+
+    # the states before both actions and the current state
+    assert get_active_states.call_count == 3
@@ -0,0 +1,137 @@
+import threading
+from typing import Any, Dict, List, Text
+from unittest.mock import Mock
+
+import pytest
+
+import rasa.core.executor
+from rasa.core.constants import (
+    INFERENCE_EXECUTOR_LOOP,
+    INFERENCE_EXECUTOR_PROCESS,
+    INFERENCE_EXECUTOR_THREAD,
+)
+from rasa.core.executor import InferenceExecutor
+from rasa.core.processor import MessageProcessor
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.events import ActionExecuted, UserUttered
+from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.nlu.interpreter import NaturalLanguageInterpreter, RegexInterpreter
+from rasa.shared.nlu.training_data.message import Message
+
+
+class ThreadRecordingInterpreter:
+    def __init__(self) -> None:
+        self.threads = []
+
+    def parse(self, text: Text) -> Dict[Text, Any]:
+        self.threads.append(threading.get_ident())
+        return {"text": text}
+
+    def parse_batch(self, texts: List[Text]) -> List[Dict[Text, Any]]:
+        return [self.parse(text) for text in texts]
+
+
+@pytest.fixture
+def thread_executor() -> InferenceExecutor:
+    executor = InferenceExecutor(INFERENCE_EXECUTOR_THREAD, max_workers=2)
+    rasa.core.executor.set_inference_executor(executor)
+    yield executor
+    rasa.core.executor.shutdown_inference_executor()
+
+
+def test_unknown_executor_mode():
+    with pytest.raises(ValueError):
+        InferenceExecutor("gpu")
+
+
+async def test_loop_executor_parses_on_event_loop():
+    interpreter = ThreadRecordingInterpreter()
+
+    result = await InferenceExecutor(INFERENCE_EXECUTOR_LOOP).parse(
+        interpreter, None, "hello"
+    )
+
+    assert result == {"text": "hello"}
+    assert interpreter.threads == [threading.get_ident()]
+
+
+@pytest.mark.parametrize(
+    "mode", [INFERENCE_EXECUTOR_THREAD, INFERENCE_EXECUTOR_PROCESS]
+)
+async def test_executor_parses_off_event_loop(mode: Text):
+    interpreter = ThreadRecordingInterpreter()
+    # without a persisted model the process executor falls back to threads
+    executor = InferenceExecutor(mode)
+
+    results = await executor.parse_batch(interpreter, None, ["hello", "bye"])
+    executor.shutdown()
+
+    assert results == [{"text": "hello"}, {"text": "bye"}]
+    assert threading.get_ident() not in interpreter.threads
+
+
+async def test_predict_next_action_async_matches_predict_next_action(
+    default_processor: MessageProcessor, thread_executor: InferenceExecutor
+):
+    tracker = DialogueStateTracker.from_events(
+        "some sender",
+        [ActionExecuted(ACTION_LISTEN_NAME), UserUttered("hi", {"name": "greet"})],
+    )
+
+    expected_action, expected_prediction = default_processor.predict_next_action(
+        tracker
+    )
+    action, prediction = await default_processor.predict_next_action_async(tracker)
+
+    assert action.name() == expected_action.name()
+    assert prediction.max_confidence_index == expected_prediction.max_confidence_index
+    assert prediction.policy_name == expected_prediction.policy_name
+
+
+class FeaturizingInterpreter(RegexInterpreter):
+    def featurize_message(self, message: Message) -> Message:
+        return message
+
+
+@pytest.mark.parametrize(
+    "interpreter, runs_in_process",
+    [(RegexInterpreter(), True), (FeaturizingInterpreter(), False)],
+)
+async def test_process_executor_predicts_in_process_only_without_featurization(
+    interpreter: NaturalLanguageInterpreter, runs_in_process: bool, monkeypatch
+):
+    executor = InferenceExecutor(INFERENCE_EXECUTOR_PROCESS)
+    pools = []
+
+    async def run(pool, func, *args):
+        pools.append(pool)
+
+    monkeypatch.setattr(executor, "_run", run)
+    monkeypatch.setattr(executor, "_get_process_pool", lambda: "process")
+    monkeypatch.setattr(executor, "_get_thread_pool", lambda: "thread")
+
+    await executor.probabilities_using_best_policy(
+        Mock(), DialogueStateTracker("some sender", []), Mock(), interpreter, "model"
+    )
+
+    assert pools == ["process" if runs_in_process else "thread"]
+
+
+async def test_executor_predicts_batch_off_event_loop():
+    threads = []
+
+    def predict_batch(trackers, domain, interpreter):
+        threads.append(threading.get_ident())
+        return [tracker.sender_id for tracker in trackers]
+
+    policy_ensemble = Mock(probabilities_using_best_policy_batch=predict_batch)
+    trackers = [DialogueStateTracker(sender_id, []) for sender_id in ["a", "b"]]
+    executor = InferenceExecutor(INFERENCE_EXECUTOR_THREAD)
+
+    predictions = await executor.probabilities_using_best_policy_batch(
+        policy_ensemble, trackers, Mock(), RegexInterpreter(), None
+    )
+    executor.shutdown()
+
+    assert predictions == ["a", "b"]
+    assert threading.get_ident() not in threads
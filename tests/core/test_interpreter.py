@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 from aioresponses import aioresponses
 
-from rasa.core.interpreter import RasaNLUHttpInterpreter
+from rasa.core.interpreter import MicroBatcher, RasaNLUHttpInterpreter
 from rasa.utils.endpoints import EndpointConfig
 from tests.utilities import latest_request, json_of_latest_request
 
@@ -28,3 +30,31 @@ async def test_http_interpreter(endpoint_url, joined_url):
         response = {"text": "message_text", "token": None, "message_id": "message_id"}
 
         assert query == response
+
+
+async def test_micro_batcher_batches_concurrent_requests():
+    batches = []
+
+    def process_batch(items):
+        batches.append(items)
+        return [item * 2 for item in items]
+
+    batcher = MicroBatcher(process_batch, max_wait_time=0.01, max_batch_size=2)
+
+    results = await asyncio.gather(*[batcher.submit(i) for i in range(5)])
+
+    assert results == [0, 2, 4, 6, 8]
+    assert batches == [[0, 1], [2, 3], [4]]
+
+
+async def test_micro_batcher_propagates_errors():
+    def process_batch(items):
+        raise ValueError("broken pipeline")
+
+    batcher = MicroBatcher(process_batch, max_wait_time=0.01, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.submit("hi"), batcher.submit("bye"), return_exceptions=True
+    )
+
+    assert all(isinstance(result, ValueError) for result in results)
@@ -6,6 +6,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 import time
+from typing import Optional, Text
 
 from _pytest.monkeypatch import MonkeyPatch
 from _pytest.tmpdir import TempdirFactory
@@ -30,16 +31,23 @@ class FakeRedisLockStore(RedisLockStore):
 
     # skipcq: PYL-W0231
     # noinspection PyMissingConstructor
-    def __init__(self):
+    def __init__(self, server: Optional["fakeredis.FakeServer"] = None):
         import fakeredis
 
-        self.red = fakeredis.FakeStrictRedis()
+        self.server = server or fakeredis.FakeServer()
+        self.red = fakeredis.FakeStrictRedis(server=self.server)
 
         # added in redis==3.3.0, but not yet in fakeredis
         self.red.connection_pool.connection_class.health_check_interval = 0
+        self._register_scripts()
 
         self.key_prefix = DEFAULT_REDIS_LOCK_STORE_KEY_PREFIX
 
+    def _create_async_client(self) -> "fakeredis.aioredis.FakeRedis":
+        import fakeredis.aioredis
+
+        return fakeredis.aioredis.FakeRedis(server=self.server)
+
 
 def test_issue_ticket():
     lock = TicketLock("random id 0")
@@ -145,6 +153,69 @@ def test_lock_expiration(lock_store: LockStore):
     assert lock.issue_ticket(10) == 1
 
 
+async def _hold_lock(lock_store: LockStore, conversation_id: Text, seconds: float):
+    async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+        await asyncio.sleep(seconds)
+
+
+async def _wait_for_lock(lock_store: LockStore, conversation_id: Text) -> float:
+    start = time.time()
+    async with lock_store.lock(conversation_id, wait_time_in_seconds=10):
+        return time.time() - start
+
+
+@pytest.mark.parametrize("lock_store", [InMemoryLockStore(), FakeRedisLockStore()])
+async def test_waiters_are_woken_up_when_lock_is_released(lock_store: LockStore):
+    conversation_id = "my id 3"
+
+    holder = asyncio.ensure_future(_hold_lock(lock_store, conversation_id, 0.1))
+    await asyncio.sleep(0.01)
+    waiting_time = await _wait_for_lock(lock_store, conversation_id)
+    await holder
+    await lock_store.close()
+
+    # without the wake-up the waiter would only retry after `wait_time_in_seconds`
+    assert waiting_time < 1
+
+
+async def test_redis_lock_store_wakes_up_waiters_of_other_instances():
+    conversation_id = "my id 4"
+    lock_store = FakeRedisLockStore()
+    other_lock_store = FakeRedisLockStore(lock_store.server)
+
+    holder = asyncio.ensure_future(_hold_lock(lock_store, conversation_id, 0.3))
+    await asyncio.sleep(0.01)
+    waiting_time = await _wait_for_lock(other_lock_store, conversation_id)
+    await holder
+    await other_lock_store.close()
+
+    assert waiting_time < 1
+
+
+async def test_redis_lock_store_close_stops_listening_for_releases():
+    lock_store = FakeRedisLockStore()
+    client = lock_store._create_async_client()
+    client_close = client.close
+    closed = []
+
+    async def close() -> None:
+        closed.append(True)
+        await client_close()
+
+    client.close = close
+    lock_store._create_async_client = lambda: client
+
+    # waiting for a release starts the listener
+    await lock_store._wait_for_release(asyncio.Event(), 0.01)
+    release_listener = lock_store._release_listener
+
+    await lock_store.close()
+
+    assert release_listener.cancelled()
+    assert lock_store._release_listener is None
+    assert closed
+
+
 async def test_multiple_conversation_ids(default_agent: Agent):
     text = INTENT_MESSAGE_PREFIX + 'greet{"name":"Rasa"}'
 
@@ -288,7 +359,7 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
     lock_store = FakeRedisLockStore()
     monkeypatch.setattr(
         lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store._run_script.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
@@ -297,6 +368,19 @@ async def test_redis_lock_store_timeout(monkeypatch: MonkeyPatch):
             pass
 
 
+async def test_redis_lock_store_registers_scripts_once():
+    lock_store = FakeRedisLockStore()
+
+    with patch.object(
+        lock_store.red, "register_script", wraps=lock_store.red.register_script
+    ) as register_script:
+        async with lock_store.lock("some sender"):
+            pass
+
+    register_script.assert_not_called()
+    assert lock_store.get_lock("some sender") is None
+
+
 async def test_redis_lock_store_with_invalid_prefix(monkeypatch: MonkeyPatch):
     import redis.exceptions
 
@@ -308,7 +392,7 @@ async def test_redis_lock_store_with_invalid_prefix(monkeypatch: MonkeyPatch):
 
     monkeypatch.setattr(
         lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store._run_script.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
@@ -331,10 +415,60 @@ async def test_redis_lock_store_with_valid_prefix(monkeypatch: MonkeyPatch):
 
     monkeypatch.setattr(
         lock_store,
-        lock_store.get_or_create_lock.__name__,
+        lock_store._run_script.__name__,
         Mock(side_effect=redis.exceptions.TimeoutError),
     )
 
     with pytest.raises(LockError):
         async with lock_store.lock("some sender"):
             pass
+
+
+def test_redis_lock_store_issues_tickets_atomically():
+    conversation_id = "my id 5"
+    lock_store = FakeRedisLockStore()
+    # e.g. another Rasa instance
+    other_lock_store = FakeRedisLockStore(lock_store.server)
+
+    tickets = [
+        store.issue_ticket(conversation_id, 10)
+        for store in [lock_store, other_lock_store, lock_store]
+    ]
+    assert tickets == [0, 1, 2]
+
+    other_lock_store.finish_serving(conversation_id, 0)
+    lock = lock_store.get_lock(conversation_id)
+    assert [ticket.number for ticket in lock.tickets] == [1, 2]
+    assert lock.now_serving == 1
+
+    # the lock is only deleted once nobody is waiting
+    lock_store.cleanup(conversation_id, 1)
+    assert lock_store.get_lock(conversation_id)
+    other_lock_store.cleanup(conversation_id, 2)
+    assert lock_store.get_lock(conversation_id) is None
+
+
+def test_redis_lock_store_removes_expired_tickets():
+    conversation_id = "my id 6"
+    lock_store = FakeRedisLockStore()
+
+    lock_store.issue_ticket(conversation_id, 10)
+    lock_store.issue_ticket(conversation_id, 0.00001)
+    time.sleep(0.00002)
+    lock_store.update_lock(conversation_id)
+
+    lock = lock_store.get_lock(conversation_id)
+    assert [ticket.number for ticket in lock.tickets] == [0]
+    # newly issued ticket should get number 1 again
+    assert lock_store.issue_ticket(conversation_id, 10) == 1
+
+
+def test_redis_lock_store_replaces_locks_stored_as_json():
+    conversation_id = "my id 7"
+    lock_store = FakeRedisLockStore()
+    lock = TicketLock(conversation_id)
+    lock.issue_ticket(10)
+    lock_store.red.set(lock_store.key_prefix + conversation_id, lock.dumps())
+
+    assert lock_store.get_lock(conversation_id).last_issued == 0
+    assert lock_store.issue_ticket(conversation_id, 10) == 0
@@ -155,6 +155,28 @@ class PolicyTestCollection:
             )
             assert predicted_probabilities == actual_probabilities
 
+    async def test_batch_prediction_equals_single_predictions(
+        self, trained_policy: Policy, default_domain: Domain
+    ):
+        trackers = await train_trackers(default_domain, augmentation_factor=0)
+        trackers.append(DialogueStateTracker(DEFAULT_SENDER_ID, default_domain.slots))
+
+        predictions = trained_policy.predict_action_probabilities_batch(
+            trackers, default_domain, RegexInterpreter()
+        )
+
+        assert len(predictions) == len(trackers)
+        for tracker, prediction in zip(trackers, predictions):
+            expected = trained_policy.predict_action_probabilities(
+                tracker, default_domain, RegexInterpreter()
+            )
+            assert np.allclose(
+                prediction.probabilities, expected.probabilities, atol=1e-6
+            )
+            assert (
+                prediction.is_end_to_end_prediction == expected.is_end_to_end_prediction
+            )
+
     def test_prediction_on_empty_tracker(
         self, trained_policy: Policy, default_domain: Domain
     ):
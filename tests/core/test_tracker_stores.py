@@ -1,3 +1,4 @@
+import json
 import logging
 from contextlib import contextmanager
 from pathlib import Path
@@ -15,7 +16,7 @@ from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.dialects.sqlite.base import SQLiteDialect
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import URL
-from typing import Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
+from typing import Any, Tuple, Text, Type, Dict, List, Union, Optional, ContextManager
 from unittest.mock import Mock
 
 import rasa.core.tracker_store
@@ -30,6 +31,12 @@ from rasa.shared.core.events import (
     SessionStarted,
     BotUttered,
     Event,
+    EntitiesAdded,
+    DefinePrevUserUtteredFeaturization,
+    ActiveLoop,
+    UserUtteranceReverted,
+    ConversationPaused,
+    FollowupAction,
 )
 from rasa.shared.exceptions import ConnectionException
 from rasa.core.tracker_store import (
@@ -41,8 +48,9 @@ from rasa.core.tracker_store import (
     DynamoTrackerStore,
     FailSafeTrackerStore,
 )
-from rasa.shared.core.trackers import DialogueStateTracker
+from rasa.shared.core.trackers import DialogueStateTracker, EventVerbosity
 from rasa.utils.endpoints import EndpointConfig, read_endpoint_config
+from tests.conftest import AsyncMock
 from tests.core.conftest import DEFAULT_ENDPOINTS_FILE, MockedMongoTrackerStore
 
 domain = Domain.load("data/test_domains/default.yml")
@@ -67,6 +75,18 @@ def test_get_or_create():
     get_or_create_tracker_store(InMemoryTrackerStore(domain))
 
 
+async def test_get_or_create_tracker_async_creates_tracker_without_blocking():
+    tracker_store = InMemoryTrackerStore(domain)
+    tracker_store.save = Mock()
+    tracker_store.save_async = AsyncMock()
+
+    tracker = await tracker_store.get_or_create_tracker_async(DEFAULT_SENDER_ID)
+
+    assert list(tracker.events) == [ActionExecuted(ACTION_LISTEN_NAME)]
+    tracker_store.save_async.assert_called_once_with(tracker)
+    tracker_store.save.assert_not_called()
+
+
 # noinspection PyPep8Naming
 @mock_dynamodb2
 def test_dynamo_get_or_create():
@@ -539,59 +559,162 @@ def _saved_tracker_with_multiple_session_starts(
     return tracker_store.retrieve(sender_id)
 
 
-def test_mongo_additional_events(default_domain: Domain):
-    tracker_store = MockedMongoTrackerStore(default_domain)
-    events, tracker = create_tracker_with_partially_saved_events(tracker_store)
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+)
+def test_save_only_stores_additional_events(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    _, tracker = create_tracker_with_partially_saved_events(tracker_store)
 
-    # make sure only new events are returned
-    # noinspection PyProtectedMember
-    assert list(tracker_store._additional_events(tracker)) == events
+    tracker_store.save(tracker)
 
+    # make sure the events which were saved before aren't stored again
+    stored_tracker = tracker_store.retrieve_full_tracker(tracker.sender_id)
+    assert list(stored_tracker.events) == list(tracker.events)
 
-def test_mongo_additional_events_with_session_start(default_domain: Domain):
-    sender = "test_mongo_additional_events_with_session_start"
-    tracker_store = MockedMongoTrackerStore(default_domain)
-    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender)
 
-    tracker.update(UserUttered("hi2"))
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [(MockedMongoTrackerStore, {}), (SQLTrackerStore, {"host": "sqlite:///"})],
+)
+def test_save_only_stores_additional_events_with_session_start(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    default_domain: Domain,
+):
+    sender = uuid.uuid4().hex
+    tracker_store = tracker_store_type(default_domain, **tracker_store_kwargs)
+    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender)
 
-    # noinspection PyProtectedMember
-    additional_events = list(tracker_store._additional_events(tracker))
+    tracker.update(UserUttered("hi2"), default_domain)
+    tracker_store.save(tracker)
 
-    assert len(additional_events) == 1
-    assert isinstance(additional_events[0], UserUttered)
+    stored_events = list(tracker_store.retrieve_full_tracker(sender).events)
+    assert len(stored_events) == 6
+    assert isinstance(stored_events[-1], UserUttered)
 
 
-# we cannot parametrise over this and the previous test due to the different ways of
-# calling _additional_events()
-def test_sql_additional_events(default_domain: Domain):
-    tracker_store = SQLTrackerStore(default_domain)
-    additional_events, tracker = create_tracker_with_partially_saved_events(
-        tracker_store
+def test_sql_tracker_store_stores_sequence_numbers(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id,
+        [
+            ActionExecuted(ACTION_SESSION_START_NAME, timestamp=1),
+            SessionStarted(timestamp=2),
+            UserUttered("hi", {"name": "greet"}, timestamp=3),
+        ],
     )
+    tracker_store.save(tracker)
+
+    tracker = tracker_store.retrieve(sender_id)
+    tracker.update(BotUttered("hey", timestamp=4))
+    tracker_store.save(tracker)
 
-    # make sure only new events are returned
+    assert tracker_store.use_sequence_numbers
     with tracker_store.session_scope() as session:
-        # noinspection PyProtectedMember
-        assert (
-            list(tracker_store._additional_events(session, tracker))
-            == additional_events
+        sequence_numbers = (
+            session.query(SQLTrackerStore.SQLEvent.sequence_number)
+            .filter(SQLTrackerStore.SQLEvent.sender_id == sender_id)
+            .order_by(SQLTrackerStore.SQLEvent.timestamp)
+            .all()
         )
+    assert [number for (number,) in sequence_numbers] == [0, 1, 2, 3]
+    # events since the latest `SessionStarted` event
+    assert tracker_store.number_of_existing_events(sender_id) == 3
 
 
-def test_sql_additional_events_with_session_start(default_domain: Domain):
-    sender = "test_sql_additional_events_with_session_start"
-    tracker_store = SQLTrackerStore(default_domain)
-    tracker = _saved_tracker_with_multiple_session_starts(tracker_store, sender)
+def test_sql_tracker_store_without_sequence_number_column(
+    default_domain: Domain, tmp_path: Path
+):
+    db_path = tmp_path / "rasa.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    # events table as it was created before sequence numbers were introduced
+    engine.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY, "
+        "sender_id VARCHAR(255) NOT NULL, type_name VARCHAR(255) NOT NULL, "
+        "timestamp FLOAT, intent_name VARCHAR(255), action_name VARCHAR(255), "
+        "data TEXT)"
+    )
 
-    tracker.update(UserUttered("hi2"), default_domain)
+    tracker_store = SQLTrackerStore(default_domain, db=str(db_path))
+    events = [SessionStarted(timestamp=1), UserUttered("hi", timestamp=2)]
+    tracker = DialogueStateTracker.from_events("some-sender", events)
+    tracker_store.save(tracker)
+
+    tracker.update(BotUttered("hey", timestamp=3))
+    tracker_store.save(tracker)
+
+    assert not tracker_store.use_sequence_numbers
+    assert list(tracker_store.retrieve("some-sender").events) == [
+        *events,
+        BotUttered("hey", timestamp=3),
+    ]
+
+
+def test_sql_tracker_store_keeps_track_of_sessions(default_domain: Domain):
+    tracker_store = SQLTrackerStore(default_domain, host="sqlite:///")
+    sender_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        sender_id, [UserUttered("hi", timestamp=1)]
+    )
+    tracker_store.save(tracker)
+
+    tracker.update(SessionStarted(timestamp=2))
+    tracker.update(UserUttered("hi again", timestamp=3))
+    tracker_store.save(tracker)
 
-    # make sure only new events are returned
     with tracker_store.session_scope() as session:
-        # noinspection PyProtectedMember
-        additional_events = list(tracker_store._additional_events(session, tracker))
-        assert len(additional_events) == 1
-        assert isinstance(additional_events[0], UserUttered)
+        conversation_session = session.query(
+            SQLTrackerStore.SQLConversationSession
+        ).get(sender_id)
+        assert conversation_session.session_start == 2
+
+    assert list(tracker_store.keys()) == [sender_id]
+    assert len(tracker_store.retrieve(sender_id).events) == 2
+
+
+def test_sql_tracker_store_fills_sessions_of_stored_events(
+    default_domain: Domain, tmp_path: Path
+):
+    db_path = tmp_path / "rasa.db"
+    engine = sqlalchemy.create_engine(f"sqlite:///{db_path}")
+    engine.execute(
+        "CREATE TABLE events (id INTEGER PRIMARY KEY, "
+        "sender_id VARCHAR(255) NOT NULL, type_name VARCHAR(255) NOT NULL, "
+        "timestamp FLOAT, intent_name VARCHAR(255), action_name VARCHAR(255), "
+        "data TEXT)"
+    )
+    # events which were stored before sessions were kept track of
+    for sender_id, events in [
+        ("sender1", [UserUttered("hi", timestamp=1)]),
+        ("sender2", [SessionStarted(timestamp=1), UserUttered("hi", timestamp=2)]),
+    ]:
+        for event in events:
+            engine.execute(
+                sqlalchemy.text(
+                    "INSERT INTO events (sender_id, type_name, timestamp, data) "
+                    "VALUES (:sender_id, :type_name, :timestamp, :data)"
+                ),
+                sender_id=sender_id,
+                type_name=event.type_name,
+                timestamp=event.timestamp,
+                data=json.dumps(event.as_dict()),
+            )
+
+    tracker_store = SQLTrackerStore(default_domain, db=str(db_path))
+
+    assert sorted(tracker_store.keys()) == ["sender1", "sender2"]
+    assert len(tracker_store.retrieve("sender2").events) == 2
+    index_names = [
+        index["name"] for index in sqlalchemy.inspect(engine).get_indexes("events")
+    ]
+    assert "ix_events_sender_id_timestamp" in index_names
 
 
 @pytest.mark.parametrize(
@@ -689,6 +812,304 @@ def test_tracker_store_retrieve_with_events_from_previous_sessions(
     assert len(actual.events) == len(tracker.events)
 
 
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (InMemoryTrackerStore, {}),
+    ],
+)
+def test_stream_events_does_not_retrieve_tracker(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict
+):
+    tracker_store = tracker_store_type(Domain.empty(), **tracker_store_kwargs)
+    tracker_store.event_broker = Mock()
+
+    conversation_id = uuid.uuid4().hex
+    tracker_store.save(
+        DialogueStateTracker.from_events(
+            conversation_id,
+            [ActionExecuted(ACTION_SESSION_START_NAME), SessionStarted()],
+        )
+    )
+
+    # the count covers the events which `retrieve` returns, which are the events
+    # that the saved trackers start with
+    tracker = tracker_store.retrieve(conversation_id)
+    assert tracker_store.number_of_existing_events(conversation_id) == len(
+        tracker.events
+    )
+
+    tracker_store.event_broker = Mock()
+    tracker_store.retrieve = Mock()
+
+    tracker.update(UserUttered("hi"))
+    tracker_store.save(tracker)
+
+    # only the new event is published and the stored tracker is not replayed
+    tracker_store.retrieve.assert_not_called()
+    tracker_store.event_broker.publish.assert_called_once()
+    published = tracker_store.event_broker.publish.call_args[0][0]
+    assert published["event"] == UserUttered.type_name
+    assert published["sender_id"] == conversation_id
+
+
+def _append_only_redis_tracker_store(domain: Domain) -> RedisTrackerStore:
+    import fakeredis
+
+    tracker_store = RedisTrackerStore(domain, append_only=True)
+    tracker_store.red = fakeredis.FakeStrictRedis()
+    # added in redis==3.3.0, but not yet in fakeredis
+    tracker_store.red.connection_pool.connection_class.health_check_interval = 0
+
+    return tracker_store
+
+
+@pytest.mark.parametrize(
+    "create_tracker_store",
+    [
+        lambda domain: InMemoryTrackerStore(domain, append_only=True),
+        _append_only_redis_tracker_store,
+    ],
+)
+def test_append_only_tracker_store(create_tracker_store):
+    tracker_store = create_tracker_store(Domain.empty())
+
+    conversation_id = uuid.uuid4().hex
+    events = [
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        UserUttered("hi"),
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        ActionExecuted(ACTION_LISTEN_NAME),
+    ]
+    tracker_store.save(DialogueStateTracker.from_events(conversation_id, events))
+
+    # only the latest session is retrieved
+    tracker = tracker_store.retrieve(conversation_id)
+    assert list(tracker.events) == events[4:]
+    assert tracker_store.number_of_existing_events(conversation_id) == 2
+
+    # saving the retrieved tracker only appends the new event
+    tracker.update(UserUttered("hello again"))
+    tracker_store.save(tracker)
+
+    assert list(tracker_store.retrieve(conversation_id).events) == [
+        *events[4:],
+        UserUttered("hello again"),
+    ]
+    assert list(tracker_store.retrieve_full_tracker(conversation_id).events) == [
+        *events,
+        UserUttered("hello again"),
+    ]
+    # the stored event list doesn't show up as separate conversation
+    assert len(list(tracker_store.keys())) == 1
+
+
+def test_append_only_redis_tracker_store_migrates_stored_tracker():
+    tracker_store = _append_only_redis_tracker_store(Domain.empty())
+    conversation_id = uuid.uuid4().hex
+    events = [SessionStarted(), UserUttered("hi")]
+    tracker = DialogueStateTracker.from_events(conversation_id, events)
+
+    # tracker which was stored before append-only mode was enabled
+    tracker_store.red.set(
+        tracker_store.key_prefix + conversation_id,
+        tracker_store.serialise_tracker(tracker),
+    )
+
+    tracker = tracker_store.retrieve(conversation_id)
+    assert list(tracker.events) == events
+
+    tracker.update(ActionExecuted(ACTION_LISTEN_NAME))
+    tracker_store.save(tracker)
+
+    assert tracker_store.red.llen(tracker_store._events_key(conversation_id)) == 3
+    assert list(tracker_store.retrieve(conversation_id).events) == [
+        *events,
+        ActionExecuted(ACTION_LISTEN_NAME),
+    ]
+
+
+def test_append_only_redis_tracker_store_retries_concurrent_saves(
+    monkeypatch: MonkeyPatch,
+):
+    tracker_store = _append_only_redis_tracker_store(Domain.empty())
+    conversation_id = uuid.uuid4().hex
+    events = [SessionStarted(), UserUttered("hi")]
+    tracker = DialogueStateTracker.from_events(conversation_id, events)
+
+    queue_appended_events = tracker_store._queue_appended_events
+    concurrent_saves = []
+
+    def queue_after_concurrent_save(pipeline, *args: Any) -> None:
+        if not concurrent_saves:
+            # another instance appends the events after they were counted
+            concurrent_saves.append(conversation_id)
+            other_pipeline = tracker_store.red.pipeline()
+            queue_appended_events(other_pipeline, tracker, None, 0, None)
+            other_pipeline.execute()
+        queue_appended_events(pipeline, *args)
+
+    monkeypatch.setattr(
+        tracker_store, "_queue_appended_events", queue_after_concurrent_save
+    )
+    tracker_store.save(tracker)
+
+    assert concurrent_saves == [conversation_id]
+    # the save was retried with the new count, so no event was appended twice
+    assert tracker_store.red.llen(tracker_store._events_key(conversation_id)) == 2
+    assert list(tracker_store.retrieve(conversation_id).events) == events
+
+
+def _domain_with_slots() -> Domain:
+    return Domain.from_yaml(
+        """
+        slots:
+          cuisine:
+            type: text
+          location:
+            type: text
+        """
+    )
+
+
+def _tracker_store_with_snapshots(
+    tracker_store_type: Type[TrackerStore], kwargs: Dict, domain: Domain
+) -> TrackerStore:
+    if tracker_store_type == RedisTrackerStore:
+        tracker_store = _append_only_redis_tracker_store(domain)
+    else:
+        tracker_store = tracker_store_type(domain, **kwargs)
+    tracker_store.snapshot_interval = 3
+
+    return tracker_store
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (RedisTrackerStore, {}),
+    ],
+)
+def test_tracker_store_snapshots_match_full_replay(
+    tracker_store_type: Type[TrackerStore],
+    tracker_store_kwargs: Dict,
+    monkeypatch: MonkeyPatch,
+):
+    domain = _domain_with_slots()
+    tracker_store = _tracker_store_with_snapshots(
+        tracker_store_type, tracker_store_kwargs, domain
+    )
+    restored_snapshots = []
+    restore_state_snapshot = DialogueStateTracker.restore_state_snapshot
+
+    def restore(tracker, snapshot, events):
+        restored_snapshots.append(len(events))
+        restore_state_snapshot(tracker, snapshot, events)
+
+    monkeypatch.setattr(DialogueStateTracker, "restore_state_snapshot", restore)
+
+    conversation_id = uuid.uuid4().hex
+    events = [
+        ActionExecuted(ACTION_SESSION_START_NAME),
+        SessionStarted(),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("hi", {"name": "greet"}),
+        EntitiesAdded([{"entity": "cuisine", "value": "pizza"}]),
+        DefinePrevUserUtteredFeaturization(False),
+        SlotSet("cuisine", "pizza"),
+        ActionExecuted("utter_greet"),
+        BotUttered("hey there!"),
+        ActiveLoop("some_form"),
+        ActionExecuted(ACTION_LISTEN_NAME),
+        UserUttered("bye", {"name": "goodbye"}),
+        UserUtteranceReverted(),
+        ConversationPaused(),
+        FollowupAction("utter_goodbye"),
+        SlotSet("location", "Berlin"),
+    ]
+    # the SQL tracker store orders events by timestamp
+    for timestamp, event in enumerate(events, 1):
+        event.timestamp = timestamp
+
+    tracker = tracker_store.init_tracker(conversation_id)
+    session_events = []
+    for event in events:
+        if isinstance(event, SessionStarted):
+            session_events = []
+        session_events.append(event)
+
+        tracker.update(event)
+        tracker_store.save(tracker)
+
+        # like the processor, continue with the retrieved tracker, which only
+        # contains the events since the latest session start
+        tracker = tracker_store.retrieve(conversation_id)
+        replayed = DialogueStateTracker.from_dict(
+            conversation_id, [e.as_dict() for e in session_events], domain.slots
+        )
+
+        assert [e.as_dict() for e in tracker.events] == [
+            e.as_dict() for e in session_events
+        ]
+        assert list(tracker.events) == list(replayed.events)
+        assert tracker.current_state(EventVerbosity.ALL) == replayed.current_state(
+            EventVerbosity.ALL
+        )
+        assert tracker.latest_message == replayed.latest_message
+        assert (
+            tracker.latest_message.use_text_for_featurization
+            == replayed.latest_message.use_text_for_featurization
+        )
+        assert tracker.latest_bot_utterance == replayed.latest_bot_utterance
+
+    # the retrieved trackers were restored from snapshots
+    assert restored_snapshots
+    assert max(restored_snapshots) == 15
+
+
+@pytest.mark.parametrize(
+    "tracker_store_type,tracker_store_kwargs",
+    [
+        (MockedMongoTrackerStore, {}),
+        (SQLTrackerStore, {"host": "sqlite:///"}),
+        (RedisTrackerStore, {}),
+    ],
+)
+def test_tracker_store_ignores_snapshot_of_previous_session(
+    tracker_store_type: Type[TrackerStore], tracker_store_kwargs: Dict
+):
+    domain = _domain_with_slots()
+    tracker_store = _tracker_store_with_snapshots(
+        tracker_store_type, tracker_store_kwargs, domain
+    )
+    conversation_id = uuid.uuid4().hex
+    tracker = DialogueStateTracker.from_events(
+        conversation_id,
+        [
+            SessionStarted(timestamp=1),
+            SlotSet("cuisine", "pizza", timestamp=2),
+            ActionExecuted(ACTION_LISTEN_NAME, timestamp=3),
+        ],
+        domain.slots,
+    )
+    tracker_store.save(tracker)
+
+    tracker.update(SessionStarted(timestamp=4))
+    tracker.update(SlotSet("location", "Berlin", timestamp=5))
+    tracker_store.save(tracker)
+
+    retrieved = tracker_store.retrieve(conversation_id)
+
+    assert retrieved.get_slot("cuisine") is None
+    assert retrieved.get_slot("location") == "Berlin"
+
+
 def test_tracker_store_deprecated_session_retrieval_kwarg():
     tracker_store = SQLTrackerStore(
         Domain.empty(), retrieve_events_from_previous_conversation_sessions=True
@@ -651,3 +651,35 @@ async def test_process_gives_diagnostic_data(trained_nlu_moodbot_path: Text,):
     assert isinstance(diagnostic_data[name].get("attention_weights"), np.ndarray)
     assert "text_transformed" in diagnostic_data[name]
     assert isinstance(diagnostic_data[name].get("text_transformed"), np.ndarray)
+
+
+async def test_process_batch_matches_process(trained_nlu_moodbot_path: Text):
+    with rasa.model.unpack_model(trained_nlu_moodbot_path) as unpacked_model_directory:
+        _, nlu_model_directory = rasa.model.get_model_subdirectories(
+            unpacked_model_directory
+        )
+        interpreter = Interpreter.load(nlu_model_directory)
+
+    texts = ["hello", "I am feeling very very sad today", "great"]
+    batch = [Message(data={TEXT: text}) for text in texts]
+    for component in interpreter.pipeline:
+        component.process_batch(batch)
+
+    for text, batch_message in zip(texts, batch):
+        message = Message(data={TEXT: text})
+        for component in interpreter.pipeline:
+            component.process(message)
+
+        assert batch_message.get(INTENT)["name"] == message.get(INTENT)["name"]
+        assert batch_message.get(INTENT)["confidence"] == pytest.approx(
+            message.get(INTENT)["confidence"], rel=1e-4
+        )
+        assert batch_message.get(ENTITIES) == message.get(ENTITIES)
+
+        batch_diagnostic_data = batch_message.get(DIAGNOSTIC_DATA)
+        diagnostic_data = message.get(DIAGNOSTIC_DATA)
+        assert batch_diagnostic_data.keys() == diagnostic_data.keys()
+        for name, data in diagnostic_data.items():
+            for key, values in data.items():
+                assert batch_diagnostic_data[name][key].shape == values.shape
+                assert np.allclose(batch_diagnostic_data[name][key], values, atol=1e-5)
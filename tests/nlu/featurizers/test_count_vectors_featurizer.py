@@ -867,3 +867,29 @@ def test_cvf_incremental_train_vocabulary_overflow(tmp_path: Path,):
     with pytest.warns(UserWarning) as warning:
         new_featurizer.train(data)
     assert "New data contains vocabulary of size" in warning[0].message.args[0]
+
+
+def test_count_vector_featurizer_process_batch_matches_process():
+    ftr = CountVectorsFeaturizer()
+    tokenizer = WhitespaceTokenizer()
+    sentences = ["hello there", "goodbye hello", "a b c hello"]
+
+    train_messages = [Message(data={TEXT: sentence}) for sentence in sentences]
+    for message in train_messages:
+        tokenizer.process(message)
+    ftr.train(TrainingData(train_messages))
+
+    single_messages = [Message(data={TEXT: s}) for s in sentences + ["unknown"]]
+    batch_messages = [Message(data={TEXT: s}) for s in sentences + ["unknown"]]
+    for single, batch in zip(single_messages, batch_messages):
+        tokenizer.process(single)
+        tokenizer.process(batch)
+        ftr.process(single)
+
+    ftr.process_batch(batch_messages)
+
+    for single, batch in zip(single_messages, batch_messages):
+        for expected, actual in zip(
+            single.get_sparse_features(TEXT, []), batch.get_sparse_features(TEXT, [])
+        ):
+            assert np.all(expected.features.toarray() == actual.features.toarray())
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List, Optional, Text, Type
+from typing import Any, Dict, List, Optional, Text, Type
 
 import pytest
 
@@ -112,6 +112,29 @@ async def test_example_component(component_builder: ComponentBuilder, tmp_path:
     assert loaded.parse("test") is not None
 
 
+class CacheableComponent(Component):
+    @classmethod
+    def cache_key(
+        cls, component_meta: Dict[Text, Any], model_metadata: Metadata
+    ) -> Optional[Text]:
+        return cls.name
+
+
+async def test_builder_shares_cached_components_between_models(tmp_path: Path):
+    _config = RasaNLUModelConfig(
+        {"pipeline": [{"name": "tests.nlu.test_components.CacheableComponent"}]}
+    )
+    (_, _, persisted_path) = await train(
+        _config, data=DEFAULT_DATA_PATH, path=str(tmp_path)
+    )
+    component_builder = ComponentBuilder()
+
+    first = Interpreter.load(persisted_path, component_builder)
+    second = Interpreter.load(persisted_path, component_builder)
+
+    assert first.pipeline[0] is second.pipeline[0]
+
+
 @pytest.mark.parametrize(
     "supported_language_list, not_supported_language_list, language, expected",
     [
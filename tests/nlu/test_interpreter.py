@@ -1,3 +1,5 @@
+import asyncio
+
 import rasa.nlu
 
 import pytest
@@ -70,3 +72,44 @@ def test_create_interpreter(parameters, trained_nlu_model):
     )
 
     assert isinstance(interpreter, parameters["type"])
+
+
+def test_parse_batch_matches_parse(trained_nlu_model):
+    model_dir = get_model_subdirectories(get_model(trained_nlu_model))[1]
+    interpreter = Interpreter.load(model_dir)
+    texts = ["hello", "", "I am looking for a mexican restaurant", "goodbye"]
+
+    results = interpreter.parse_batch(texts)
+
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        expected = interpreter.parse(text)
+        assert result["text"] == expected["text"]
+        assert result["intent"]["name"] == expected["intent"]["name"]
+        assert result["intent"]["confidence"] == pytest.approx(
+            expected["intent"]["confidence"], rel=1e-4
+        )
+        assert [(e["entity"], e["value"]) for e in result["entities"]] == [
+            (e["entity"], e["value"]) for e in expected["entities"]
+        ]
+
+
+async def test_rasa_nlu_interpreter_batches_concurrent_parses(
+    trained_nlu_model, monkeypatch
+):
+    model_dir = get_model_subdirectories(get_model(trained_nlu_model))[1]
+    interpreter = RasaNLUInterpreter(model_dir, batch_wait_time=0.05)
+    batches = []
+    parse_batch = interpreter.interpreter.parse_batch
+
+    def record_batch(texts):
+        batches.append(texts)
+        return parse_batch(texts)
+
+    monkeypatch.setattr(interpreter.interpreter, "parse_batch", record_batch)
+
+    texts = ["hello", "goodbye", "I am looking for a mexican restaurant"]
+    results = await asyncio.gather(*[interpreter.parse(text) for text in texts])
+
+    assert batches == [texts]
+    assert [result["text"] for result in results] == texts
@@ -1,11 +1,13 @@
 import json
 import logging
 import os
+import pickle
 import textwrap
 import time
 from pathlib import Path
 import tempfile
 from typing import List, Text, Dict, Any, Type
+from unittest.mock import patch
 
 import fakeredis
 import freezegun
@@ -504,6 +506,142 @@ def test_tracker_init_copy(default_domain: Domain):
     assert tracker.sender_id == tracker_copy.sender_id
 
 
+def test_cached_past_states(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "some-id",
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+        default_domain.slots,
+    )
+    expected_states = default_domain.states_for_tracker_history(tracker)
+
+    tracker.cache_past_states(default_domain)
+
+    with patch.object(default_domain, "get_active_states") as get_active_states:
+        states = tracker.past_states(default_domain)
+        assert states == expected_states
+        # the states are copied, so that modifying them doesn't change the cache
+        states[-1].clear()
+        assert tracker.past_states(default_domain) == expected_states
+        get_active_states.assert_not_called()
+
+
+def test_cached_past_states_are_invalidated_by_new_events(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "some-id",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+        max_event_history=2,
+    )
+    tracker.cache_past_states(default_domain)
+
+    # the number of events doesn't change once `max_event_history` is reached
+    tracker.update(ActionExecuted("utter_greet"))
+
+    assert tracker.past_states(
+        default_domain
+    ) == default_domain.states_for_tracker_history(tracker)
+
+
+@pytest.mark.parametrize(
+    "events",
+    [
+        # loop happy path
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            SlotSet(REQUESTED_SLOT, "bla"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("inform"),
+            ActionExecuted("loop"),
+            ActiveLoop(None),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+        # loop unhappy path
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("loop"),
+            ActiveLoop("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("chitchat"),
+            ActionExecutionRejected("loop"),
+            ActionExecuted("handle_rejection"),
+            ActionExecuted("loop"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+        # reverted events, restarts and new sessions
+        [
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted("utter_greet"),
+            ActionReverted(),
+            ActionExecuted("utter_goodbye"),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("goodbye"),
+            UserUtteranceReverted(),
+            SlotSet("name", "Peter"),
+            Restarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+            user_uttered("greet"),
+            ActionExecuted(ACTION_SESSION_START_NAME),
+            SessionStarted(),
+            ActionExecuted(ACTION_LISTEN_NAME),
+        ],
+    ],
+)
+def test_past_states_are_updated_incrementally(
+    events: List[Event], default_domain: Domain
+):
+    tracker = DialogueStateTracker("some-id", default_domain.slots)
+
+    for event in events:
+        tracker.update(event)
+
+        assert tracker.past_states(
+            default_domain
+        ) == default_domain.states_for_tracker_history(tracker)
+
+
+def test_past_states_of_new_action_are_computed_once(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "some-id",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+    )
+    tracker.past_states(default_domain)
+
+    with patch.object(
+        default_domain, "get_active_states", wraps=default_domain.get_active_states
+    ) as get_active_states:
+        tracker.update(ActionExecuted("utter_greet"))
+        tracker.past_states(default_domain)
+
+    # the state before the new action and the current state
+    assert get_active_states.call_count == 2
+
+
+def test_pickled_tracker_does_not_contain_past_states(default_domain: Domain):
+    tracker = DialogueStateTracker.from_events(
+        "some-id",
+        [ActionExecuted(ACTION_LISTEN_NAME), user_uttered("greet")],
+        default_domain.slots,
+    )
+    tracker.cache_past_states(default_domain)
+
+    restored = pickle.loads(pickle.dumps(tracker))
+
+    assert restored._past_states_cache is None
+    assert tracker._past_states_cache is not None
+    assert restored.past_states(default_domain) == tracker.past_states(default_domain)
+
+
 async def test_dump_and_restore_as_json(default_agent: Agent, tmp_path: Path):
     trackers = await default_agent.load_data(DEFAULT_STORIES_FILE)
 
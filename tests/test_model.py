@@ -413,6 +413,43 @@ async def test_rasa_packaging(
     assert not os.path.exists(unpacked_model_path)
 
 
+@pytest.mark.parametrize(
+    "extension, compression",
+    [(".tar.gz", "gz"), (".tar", "none"), (".tar.zst", "zstd")],
+)
+def test_rasa_packaging_with_compression(
+    trained_rasa_model: Text, tmp_path: Path, extension: Text, compression: Text
+):
+    if compression == "zstd":
+        pytest.importorskip("zstandard")
+
+    unpacked_model_path = get_model(trained_rasa_model)
+    output_path = str(tmp_path / f"test{extension}")
+
+    create_package_rasa(unpacked_model_path, output_path)
+
+    assert model.archive_compression(output_path) == compression
+    assert get_latest_model(str(tmp_path)) == output_path
+
+    unpacked = get_model(output_path)
+    assert os.path.exists(os.path.join(unpacked, FINGERPRINT_FILE_PATH))
+    assert os.path.exists(os.path.join(unpacked, DEFAULT_CORE_SUBDIRECTORY_NAME))
+    assert os.path.exists(os.path.join(unpacked, "nlu"))
+
+
+def test_package_model_with_compression_from_env(
+    trained_rasa_model: Text, tmp_path: Path, monkeypatch: MonkeyPatch
+):
+    monkeypatch.setenv(rasa.constants.ENV_MODEL_COMPRESSION, "none")
+
+    output_path = model.package_model(
+        {}, str(tmp_path), get_model(trained_rasa_model), fixed_model_name="model"
+    )
+
+    assert output_path == str(tmp_path / "model.tar")
+    assert model.archive_compression(output_path) == "none"
+
+
 @pytest.mark.parametrize(
     "fingerprint",
     [
@@ -42,7 +42,7 @@ from rasa.core.channels import (
 )
 from rasa.core.channels.slack import SlackBot
 from rasa.core.tracker_store import InMemoryTrackerStore
-from rasa.model import unpack_model
+from rasa.model import fingerprint_from_path, unpack_model
 from rasa.nlu.test import CVEvaluationResult
 from rasa.shared.core import events
 from rasa.shared.core.constants import (
@@ -164,6 +164,20 @@ async def test_status(rasa_app: SanicASGITestClient, trained_rasa_model: Text):
     assert model_file == trained_rasa_model
 
 
+async def test_status_during_model_swap(
+    rasa_app: SanicASGITestClient, unpacked_trained_rasa_model: Text
+):
+    rasa_app.app.agent.pending_model_directory = unpacked_trained_rasa_model
+    _, response = await rasa_app.get("/status")
+    rasa_app.app.agent.pending_model_directory = None
+
+    assert response.status == HTTPStatus.OK
+    assert "fingerprint" in response.json()
+    assert response.json()["pending_fingerprint"] == fingerprint_from_path(
+        unpacked_trained_rasa_model
+    )
+
+
 async def test_status_nlu_only(
     rasa_app_nlu: SanicASGITestClient, trained_nlu_model: Text
 ):
@@ -1090,6 +1104,42 @@ async def test_predict(rasa_app: SanicASGITestClient):
     assert "policy" in content
 
 
+async def test_predict_batch(rasa_app: SanicASGITestClient):
+    events = [
+        {"event": "action", "name": "action_listen"},
+        {
+            "event": "user",
+            "text": "hello",
+            "parse_data": {
+                "entities": [],
+                "intent": {"confidence": 0.57, INTENT_NAME_KEY: "greet"},
+                "text": "hello",
+            },
+        },
+    ]
+    _, response = await rasa_app.post(
+        "/model/predict",
+        json={"trackers": [events, events[:1]]},
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    content = response.json()
+    assert response.status == HTTPStatus.OK
+    assert len(content) == 2
+    for result in content:
+        assert "scores" in result
+        assert "tracker" in result
+        assert "policy" in result
+
+
+async def test_predict_batch_with_invalid_trackers(rasa_app: SanicASGITestClient):
+    _, response = await rasa_app.post(
+        "/model/predict",
+        json={"trackers": "not a list"},
+        headers={"Content-Type": rasa.server.JSON_CONTENT_TYPE},
+    )
+    assert response.status == HTTPStatus.BAD_REQUEST
+
+
 @freeze_time("2018-01-01")
 async def test_requesting_non_existent_tracker(rasa_app: SanicASGITestClient):
     _, response = await rasa_app.get("/conversations/madeupid/tracker")
@@ -0,0 +1,134 @@
+from pathlib import Path
+from typing import Any, List
+
+import numpy as np
+import pytest
+import scipy.sparse
+
+import rasa.utils.io as io_utils
+from rasa.utils.tensorflow import model_data_storage
+from rasa.utils.tensorflow.model_data import Data, FeatureArray
+
+
+def _object_array(items: List[Any]) -> np.ndarray:
+    array = np.empty(len(items), dtype=object)
+    for i, item in enumerate(items):
+        array[i] = item
+    return array
+
+
+@pytest.fixture
+def data() -> Data:
+    return {
+        "text": {
+            "sequence": [
+                FeatureArray(
+                    _object_array(
+                        [np.random.rand(5, 14), np.random.rand(2, 14)]
+                        + [np.random.rand(0, 14)]
+                    ),
+                    number_of_dimensions=3,
+                ),
+                FeatureArray(
+                    _object_array(
+                        [
+                            scipy.sparse.random(5, 10, density=0.3).tocsr(),
+                            scipy.sparse.random(2, 10, density=0.3).tocoo(),
+                            scipy.sparse.coo_matrix((3, 10)),
+                        ]
+                    ),
+                    number_of_dimensions=3,
+                ),
+            ],
+            "sentence": [
+                FeatureArray(
+                    np.random.rand(3, 1, 14).astype(np.float32), number_of_dimensions=3
+                )
+            ],
+        },
+        "label": {
+            "ids": [FeatureArray(np.array([[0], [1], [2]]), number_of_dimensions=2)]
+        },
+        "action_text": {
+            "sequence": [
+                FeatureArray(
+                    _object_array(
+                        [
+                            _object_array(
+                                [
+                                    scipy.sparse.csr_matrix(np.ones((2, 7))),
+                                    scipy.sparse.csr_matrix(np.ones((1, 7))),
+                                ]
+                            ),
+                            _object_array([scipy.sparse.csr_matrix(np.ones((3, 7)))]),
+                        ]
+                    ),
+                    number_of_dimensions=4,
+                )
+            ]
+        },
+    }
+
+
+def _assert_equal(expected: Any, actual: Any) -> None:
+    if scipy.sparse.issparse(expected):
+        assert actual.getformat() == expected.getformat()
+        assert actual.shape == expected.shape
+        assert (actual != expected).nnz == 0
+    elif expected.dtype == object:
+        assert actual.dtype == object
+        assert actual.shape == expected.shape
+        for expected_item, actual_item in zip(expected.ravel(), actual.ravel()):
+            _assert_equal(expected_item, actual_item)
+    else:
+        assert actual.dtype == expected.dtype
+        assert np.array_equal(actual, expected)
+
+
+@pytest.mark.parametrize("mmap_mode", ["c", None])
+def test_persist_and_load_model_data(data: Data, tmp_path: Path, mmap_mode: Any):
+    path = tmp_path / "model.label_data"
+    model_data_storage.persist_model_data(data, path)
+
+    loaded = model_data_storage.load_model_data(path, mmap_mode=mmap_mode)
+
+    assert loaded.keys() == data.keys()
+    for key, attribute_data in data.items():
+        assert loaded[key].keys() == attribute_data.keys()
+        for sub_key, features in attribute_data.items():
+            for expected, actual in zip(features, loaded[key][sub_key]):
+                assert isinstance(actual, FeatureArray)
+                assert actual.number_of_dimensions == expected.number_of_dimensions
+                assert actual.is_sparse == expected.is_sparse
+                assert actual.units == expected.units
+                _assert_equal(expected.view(np.ndarray), actual.view(np.ndarray))
+
+
+def test_loaded_model_data_is_memory_mapped(data: Data, tmp_path: Path):
+    path = tmp_path / "model.data_example"
+    model_data_storage.persist_model_data(data, path)
+
+    loaded = model_data_storage.load_model_data(path, mmap_mode="c")
+
+    # every example of a ragged array is a view on one memory-mapped block
+    example = loaded["text"]["sequence"][0][0]
+    assert isinstance(example.base, np.memmap) or isinstance(
+        example.base.base, np.memmap
+    )
+
+
+def test_load_pickled_model_data(data: Data, tmp_path: Path):
+    path = tmp_path / "model.label_data"
+    io_utils.pickle_dump(f"{path}.pkl", data)
+
+    assert model_data_storage.model_data_exists(path)
+    loaded = model_data_storage.load_model_data(path)
+
+    _assert_equal(
+        data["label"]["ids"][0].view(np.ndarray),
+        loaded["label"]["ids"][0].view(np.ndarray),
+    )
+
+
+def test_model_data_does_not_exist(tmp_path: Path):
+    assert not model_data_storage.model_data_exists(tmp_path / "model.label_data")
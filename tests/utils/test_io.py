@@ -1,6 +1,8 @@
 import copy
 import os
+import shutil
 from pathlib import Path
+from typing import Text
 
 import pytest
 from prompt_toolkit.document import Document
@@ -124,3 +126,15 @@ def test_fingerprint_does_not_use_string_hashing(monkeypatch):
     monkeypatch.setenv("PYTHONHASHSEED", "42")
     f2 = rasa.shared.utils.io.deep_container_fingerprint(dictionary)
     assert f1 == f2
+
+
+@pytest.mark.parametrize("archive_format", ["gztar", "zip"])
+def test_unarchive_file(tmp_path: Path, archive_format: Text):
+    source = tmp_path / "source"
+    source.mkdir()
+    (source / "model.txt").write_text("model")
+    archive = shutil.make_archive(str(tmp_path / "model"), archive_format, source)
+
+    target = io_utils.unarchive_file(archive, str(tmp_path / "target"))
+
+    assert (Path(target) / "model.txt").read_text() == "model"